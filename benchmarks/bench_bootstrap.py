@@ -0,0 +1,43 @@
+"""Benchmark the bootstrap confidence intervals of the overview averages, serial and in a process pool."""
+
+import argparse
+import time
+import numpy as np
+
+from synthetic_archive import generate_game_sheets
+from backend.evaluation.transformations import prepare_rounds_batch, parse_timestamps
+from backend.evaluation.fact_table import build_fact_table
+from backend.evaluation.bootstrap import BOOTSTRAP_RESAMPLES, bootstrap_mean_intervals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, nargs="+", default=[500, 2000, 8000], help="Archive sizes in rounds")
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes of the parallel run")
+    args = parser.parse_args()
+
+    sheets = generate_game_sheets(max(args.rounds), old_format_every=10)
+    df_rounds, df_games, df_points = prepare_rounds_batch(sheets)
+    df_rounds, df_games = parse_timestamps(df_rounds, df_games)
+    df_facts = build_fact_table(df_rounds, df_games, df_points, {'version': 1, 'players': []})
+
+    print(f"{BOOTSTRAP_RESAMPLES} resamples per player, punkte_netto per game:")
+    for n_rounds in args.rounds:
+        df_subset = df_facts[df_facts['round_index'] <= n_rounds]
+        samples = [
+            group.to_numpy() for _, group in df_subset.groupby('spieler_id', sort=False)['punkte_netto']
+        ]
+        start = time.perf_counter()
+        serial = bootstrap_mean_intervals(samples)
+        serial_time = time.perf_counter() - start
+        start = time.perf_counter()
+        parallel = bootstrap_mean_intervals(samples, workers=args.workers)
+        parallel_time = time.perf_counter() - start
+        assert np.array_equal(serial, parallel, equal_nan=True), "Parallel intervals differ from serial ones"
+        print(f"  {len(df_subset):7d} player-games  serial {serial_time * 1000:8.1f} ms  "
+              f"{args.workers} workers {parallel_time * 1000:8.1f} ms")
+    print("Parallel intervals identical to serial ones")
+
+
+if __name__ == "__main__":
+    main()
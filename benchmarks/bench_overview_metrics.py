@@ -0,0 +1,101 @@
+"""Benchmark the overview metrics engine against per-chart pandas aggregation on a synthetic archive."""
+
+import argparse
+import time
+import numpy as np
+import pandas as pd
+
+from synthetic_archive import generate_game_sheets
+from backend.evaluation.transformations import prepare_rounds_batch, parse_timestamps
+from backend.evaluation.fact_table import build_fact_table
+from backend.evaluation.metrics import WIND_ORDER, compute_overview_metrics
+from backend.evaluation.visualization import _create_overview_figure
+from backend.player_registry import display_names
+
+
+def overview_aggregates_pandas(df_facts: pd.DataFrame) -> dict:
+    """Reference: one groupby chain per chart, as the figure computed them before."""
+    df_final_games = df_facts[df_facts['is_final_game']]
+    player_groups = dict(tuple(df_facts.groupby('spieler_id')))
+
+    df_ranks = df_final_games[['round_index', 'spieler_id', 'cumulative_siegerpunkte']].copy()
+    df_ranks['rank'] = df_ranks.groupby('round_index')['cumulative_siegerpunkte'].rank(method='min', ascending=False)
+    rank_groups = dict(tuple(df_ranks.groupby('spieler_id')))
+
+    df_as_wind = df_facts[df_facts['is_spielfuehrer']]
+    df_wind_stats = df_as_wind.groupby(['runden_id', 'spieler_id']).agg(
+        netto_as_wind=('punkte_netto', 'sum'),
+        delta_as_wind=('punkte_delta', 'sum')
+    ).reset_index()
+    wind_stats_groups = dict(tuple(df_wind_stats.groupby('spieler_id')))
+    wind_wins = df_final_games[df_final_games['rang'] == 1]['spieler_wind'].value_counts()
+
+    return {
+        'siegerpunkte': df_final_games.groupby('spieler_id')['siegerpunkte'].sum(),
+        'total_points': df_facts.groupby('spieler_id')['punkte_delta'].sum(),
+        'avg': df_facts.groupby('spieler_id').agg(
+            avg_netto=('punkte_netto', 'mean'), avg_delta=('punkte_delta', 'mean')
+        ),
+        'avg_as_wind': df_as_wind.groupby('spieler_id').agg(
+            avg_netto=('punkte_netto', 'mean'), avg_delta=('punkte_delta', 'mean')
+        ),
+        'cumulative_points': {player: group['cumulative_points'] for player, group in player_groups.items()},
+        'rank': {player: group['rank'] for player, group in rank_groups.items()},
+        'netto_as_wind': {player: group['netto_as_wind'] for player, group in wind_stats_groups.items()},
+        'wind_wins': [wind_wins.get(wind, 0) for wind in WIND_ORDER],
+    }
+
+
+def check_equal(expected: dict, metrics) -> None:
+    ids = list(metrics.player_ids)
+    assert (expected['siegerpunkte'][ids].to_numpy() == metrics.siegerpunkte).all()
+    assert (expected['total_points'][ids].to_numpy() == metrics.total_points).all()
+    np.testing.assert_allclose(expected['avg'].loc[ids, 'avg_netto'], metrics.avg_netto)
+    np.testing.assert_allclose(expected['avg'].loc[ids, 'avg_delta'], metrics.avg_delta)
+    as_wind = metrics.games_as_wind > 0
+    np.testing.assert_allclose(expected['avg_as_wind'].loc[metrics.player_ids[as_wind], 'avg_netto'], metrics.avg_netto_as_wind[as_wind])
+    assert list(expected['wind_wins']) == list(metrics.wind_wins)
+    for player, series in metrics.series.items():
+        assert (expected['cumulative_points'][player].to_numpy() == series.cumulative_points).all()
+        assert (expected['rank'][player].to_numpy() == series.rank).all()
+        if player in expected['netto_as_wind']:
+            # The reference lists the rounds by runden_id, the engine chronologically
+            assert (np.sort(expected['netto_as_wind'][player].to_numpy()) == np.sort(series.netto_as_wind)).all()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=5000, help="Approximate number of games in the archive")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions, the best one is reported")
+    args = parser.parse_args()
+
+    # A synthetic round file holds about five games
+    sheets = generate_game_sheets(max(1, args.games // 5), old_format_every=10)
+    df_rounds, df_games, df_points = prepare_rounds_batch(sheets)
+    df_rounds, df_games = parse_timestamps(df_rounds, df_games)
+    registry = {'version': 1, 'players': []}
+    df_facts = build_fact_table(df_rounds, df_games, df_points, registry)
+    player_names = display_names(registry)
+
+    def best_of(function):
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = function()
+            times.append(time.perf_counter() - start)
+        return min(times), result
+
+    pandas_time, expected = best_of(lambda: overview_aggregates_pandas(df_facts))
+    metrics_time, metrics = best_of(lambda: compute_overview_metrics(df_facts, player_names))
+    figure_time, _ = best_of(lambda: _create_overview_figure(df_facts, player_names))
+    check_equal(expected, metrics)
+
+    print(f"Files / games / rows:     {len(df_rounds)} / {df_facts['game_index'].max()} / {len(df_facts)}")
+    print(f"pandas per chart:         {pandas_time * 1000:.1f} ms")
+    print(f"compute_overview_metrics: {metrics_time * 1000:.1f} ms")
+    print(f"overview figure total:    {figure_time * 1000:.1f} ms")
+    print(f"Speedup:                  {pandas_time / metrics_time:.1f}x, results identical")
+
+
+if __name__ == "__main__":
+    main()
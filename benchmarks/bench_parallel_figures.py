@@ -0,0 +1,88 @@
+"""Timing report of the dashboard figure and player page construction, serial and with a pool of worker processes."""
+
+import argparse
+import json
+import time
+
+from synthetic_archive import generate_game_sheets
+from backend.evaluation.transformations import prepare_rounds_batch, parse_timestamps
+from backend.evaluation.fact_table import build_fact_table
+from backend.evaluation.metrics import compute_overview_metrics, compute_player_details
+from backend.evaluation.visualization import (
+    OVERVIEW_BLOCKS, TIMELINE_POINT_BUDGET, _build_chart_block, _create_overview_figure, _render_player_pages
+)
+from backend.player_registry import display_names
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=20000, help="Approximate number of games in the archive")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Pool sizes to compare")
+    parser.add_argument("--point-budget", type=int, default=TIMELINE_POINT_BUDGET, help="Timeline point budget")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions, the best one is reported")
+    args = parser.parse_args()
+
+    # A synthetic round file holds about five games
+    sheets = generate_game_sheets(max(1, args.games // 5), old_format_every=10)
+    df_rounds, df_games, df_points = prepare_rounds_batch(sheets)
+    df_rounds, df_games = parse_timestamps(df_rounds, df_games)
+    registry = {'version': 1, 'players': []}
+    df_facts = build_fact_table(df_rounds, df_games, df_points, registry)
+    player_names = display_names(registry)
+    print(f"Files / games / rows: {len(df_rounds)} / {df_facts['game_index'].max()} / {len(df_facts)}")
+
+    # Cost of the single chart blocks, serial
+    metrics = compute_overview_metrics(df_facts, player_names)
+    print("\nChart blocks (serial):")
+    for block in OVERVIEW_BLOCKS:
+        start = time.perf_counter()
+        _build_chart_block(block, args.point_budget, metrics)
+        print(f"  {block.__name__:<30} {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+    # Figure plus HTML serialization per pool size; pool startup is included
+    print("\nFigure + to_html:")
+    reference = None
+    serial_time = None
+    for workers in args.workers:
+        figure_times, html_times = [], []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            fig = _create_overview_figure(df_facts, player_names, args.point_budget, workers)
+            figure_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            fig.to_html(full_html=False, include_plotlyjs=False)
+            html_times.append(time.perf_counter() - start)
+
+        figure_json = json.loads(fig.to_json())
+        if reference is None:
+            reference = figure_json
+        assert figure_json == reference, f"Figure with {workers} workers differs"
+
+        total = min(figure_times) + min(html_times)
+        serial_time = serial_time or total
+        print(f"  workers={workers:<3} figure {min(figure_times) * 1000:8.1f} ms   "
+              f"html {min(html_times) * 1000:7.1f} ms   total {total * 1000:8.1f} ms   "
+              f"({serial_time / total:.2f}x)")
+    print("Figures identical for all pool sizes")
+
+    # Player pages: one shared aggregate pass, then one figure per player
+    start = time.perf_counter()
+    details = list(compute_player_details(df_facts, player_names).values())
+    print(f"\nPlayer details ({len(details)} players): {(time.perf_counter() - start) * 1000:8.1f} ms")
+    reference = None
+    serial_time = None
+    for workers in args.workers:
+        page_times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            pages = _render_player_pages(details, args.point_budget, workers)
+            page_times.append(time.perf_counter() - start)
+        reference = reference or pages
+        assert pages == reference, f"Player pages with {workers} workers differ"
+        serial_time = serial_time or min(page_times)
+        print(f"  workers={workers:<3} pages {min(page_times) * 1000:8.1f} ms   ({serial_time / min(page_times):.2f}x)")
+    print("Player pages identical for all pool sizes")
+
+
+if __name__ == "__main__":
+    main()
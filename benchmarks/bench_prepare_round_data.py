@@ -0,0 +1,103 @@
+"""Benchmark prepare_round_data against the former row-by-row implementation and the batch transform."""
+
+import argparse
+import hashlib
+import time
+import pandas as pd
+
+from synthetic_archive import generate_game_sheets
+from backend.evaluation.transformations import WINNING_POINTS, prepare_round_data, prepare_rounds_batch
+
+
+def prepare_round_data_iterrows(filename, df_meta, df_games, df_standings):
+    """Reference: the implementation before vectorization, condensed."""
+    file_hash = hashlib.md5(filename.encode()).hexdigest()[:8]
+    df_meta.columns = ['rundenstart', 'rundenende', 'rundendauer', 'rundendauer_text']
+    if df_meta.empty:
+        df_meta = pd.DataFrame({column: [None] for column in df_meta.columns})
+    df_meta['runden_id'] = file_hash
+    df_meta['dateiname'] = filename
+
+    df_standings.columns = ['spieler_wind', 'spieler', 'punktestand', 'rang']
+    df_standings = df_standings.copy()
+    df_standings['siegerpunkte'] = df_standings['rang'].apply(lambda x: WINNING_POINTS.get(x, 0))
+    wind_mapping = {'Osten': 'osten', 'Süden': 'sueden', 'Westen': 'westen', 'Norden': 'norden'}
+    for _, row in df_standings.iterrows():
+        wind_key = wind_mapping.get(row['spieler_wind'])
+        if wind_key:
+            df_meta[f'spieler_{wind_key}'] = row['spieler']
+            df_meta[f'siegerpunkte_{wind_key}'] = row['siegerpunkte']
+    df_rounds = df_meta[[
+        'runden_id', 'dateiname', 'rundenstart', 'rundenende', 'rundendauer', 'rundendauer_text',
+        'spieler_osten', 'siegerpunkte_osten', 'spieler_sueden', 'siegerpunkte_sueden',
+        'spieler_westen', 'siegerpunkte_westen', 'spieler_norden', 'siegerpunkte_norden'
+    ]].copy()
+
+    columns = ['spiel_index', 'wind_des_spiels', 'gewinner_wind', 'spieler', 'spieler_wind',
+               'punkte_brutto', 'verdopplungen', 'punkte_netto', 'punkte_delta', 'punktestand', 'rang']
+    if len(df_games.columns) > 11:
+        columns.extend(['spielstart', 'spielende'])
+    df_games.columns = columns
+    if 'spielstart' not in df_games.columns:
+        df_games['spielstart'] = None
+    if 'spielende' not in df_games.columns:
+        df_games['spielende'] = None
+
+    df_games_meta = df_games[[
+        'spiel_index', 'wind_des_spiels', 'gewinner_wind', 'spielstart', 'spielende'
+    ]].drop_duplicates().copy()
+    df_games_meta['runden_id'] = file_hash
+    df_games_meta = df_games_meta[[
+        'runden_id', 'spiel_index', 'wind_des_spiels', 'gewinner_wind', 'spielstart', 'spielende'
+    ]]
+
+    df_points = df_games[[
+        'spiel_index', 'spieler', 'spieler_wind', 'punkte_brutto', 'verdopplungen',
+        'punkte_netto', 'punkte_delta', 'punktestand', 'rang'
+    ]].copy()
+    df_points['runden_id'] = file_hash
+    df_points = df_points[[
+        'runden_id', 'spiel_index', 'spieler', 'spieler_wind', 'punkte_brutto', 'verdopplungen',
+        'punkte_netto', 'punkte_delta', 'punktestand', 'rang'
+    ]]
+    return df_rounds, df_games_meta, df_points
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=2000, help="Number of synthetic game files")
+    args = parser.parse_args()
+
+    sheets = generate_game_sheets(args.files, old_format_every=10)
+    # The reference renames the columns of its inputs in place
+    copies = [(name, *(df.copy() for df in frames)) for name, *frames in sheets]
+
+    start = time.perf_counter()
+    expected = [prepare_round_data_iterrows(*entry) for entry in copies]
+    iterrows_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [prepare_round_data(*entry) for entry in sheets]
+    vectorized_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = prepare_rounds_batch(sheets)
+    batch_time = time.perf_counter() - start
+
+    for frames_expected, frames_actual in zip(expected, actual):
+        for df_expected, df_actual in zip(frames_expected, frames_actual):
+            pd.testing.assert_frame_equal(df_actual, df_expected, check_exact=True)
+    for i, df_batch in enumerate(batch):
+        df_expected = pd.concat([frames[i] for frames in expected], ignore_index=True)
+        pd.testing.assert_frame_equal(df_batch, df_expected, check_exact=True)
+
+    print(f"Files:                {len(sheets)}")
+    print(f"iterrows:             {iterrows_time:.3f} s ({iterrows_time / len(sheets) * 1000:.2f} ms/file)")
+    print(f"prepare_round_data:   {vectorized_time:.3f} s ({vectorized_time / len(sheets) * 1000:.2f} ms/file)")
+    print(f"prepare_rounds_batch: {batch_time:.3f} s ({batch_time / len(sheets) * 1000:.2f} ms/file)")
+    print(f"Speedup:              {iterrows_time / vectorized_time:.1f}x per file, "
+          f"{iterrows_time / batch_time:.1f}x batch, results identical")
+
+
+if __name__ == "__main__":
+    main()
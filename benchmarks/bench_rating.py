@@ -0,0 +1,51 @@
+"""Benchmark the rating engine: full recomputation at growing archive sizes and incremental updates."""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+
+from synthetic_archive import generate_game_sheets
+from backend.evaluation.transformations import prepare_rounds_batch, parse_timestamps
+from backend.evaluation.fact_table import build_fact_table
+from backend.evaluation.rating import update_ratings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, nargs="+", default=[500, 1000, 2000, 4000], help="Archive sizes in rounds")
+    parser.add_argument("--new", type=int, default=10, help="Rounds added for the incremental update")
+    args = parser.parse_args()
+
+    sheets = generate_game_sheets(max(args.rounds), old_format_every=10)
+    df_rounds, df_games, df_points = prepare_rounds_batch(sheets)
+    df_rounds, df_games = parse_timestamps(df_rounds, df_games)
+    df_facts = build_fact_table(df_rounds, df_games, df_points, {'version': 1, 'players': []})
+
+    print("Full recomputation:")
+    for n_rounds in args.rounds:
+        df_subset = df_facts[df_facts['round_index'] <= n_rounds]
+        start = time.perf_counter()
+        history = update_ratings(None, df_subset)
+        elapsed = time.perf_counter() - start
+        print(f"  {len(history.round_ids):6d} rounds  {elapsed * 1000:8.1f} ms  "
+              f"({elapsed / len(history.round_ids) * 1e6:5.1f} µs per round)")
+
+    # Incremental: state of all but the newest rounds, then the newest rounds are added
+    n_rounds = max(args.rounds)
+    with tempfile.TemporaryDirectory() as folder:
+        folder = Path(folder)
+        update_ratings(folder, df_facts[df_facts['round_index'] <= n_rounds - args.new])
+        start = time.perf_counter()
+        incremental = update_ratings(folder, df_facts)
+        elapsed = time.perf_counter() - start
+    full = update_ratings(None, df_facts)
+    assert np.array_equal(incremental.ratings, full.ratings), "Incremental ratings differ from full recomputation"
+    print(f"\nIncremental update of {incremental.applied} rounds on {n_rounds} rounds "
+          f"(state load, prefix check, save): {elapsed * 1000:.1f} ms")
+    print("Incremental ratings identical to full recomputation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark the fast xlsx reader against reading the sheets with pd.read_excel."""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+import pandas as pd
+
+from synthetic_archive import write_archive
+from backend.evaluation.xlsx_reader import read_game_workbook
+
+
+def read_with_pandas(file_path: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    return tuple(pd.read_excel(file_path, sheet_name=i, engine='openpyxl') for i in range(3))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=200, help="Number of synthetic game files")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = write_archive(Path(tmp), args.files, old_format_every=10)
+
+        start = time.perf_counter()
+        pandas_sheets = [read_with_pandas(file) for file in files]
+        pandas_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fast_sheets = [read_game_workbook(file) for file in files]
+        fast_time = time.perf_counter() - start
+
+    for expected, actual in zip(pandas_sheets, fast_sheets):
+        for df_expected, df_actual in zip(expected, actual):
+            pd.testing.assert_frame_equal(df_actual, df_expected, check_exact=True)
+
+    print(f"Files:             {len(files)}")
+    print(f"pd.read_excel:     {pandas_time:.3f} s ({pandas_time / len(files) * 1000:.2f} ms/file)")
+    print(f"read_game_workbook: {fast_time:.3f} s ({fast_time / len(files) * 1000:.2f} ms/file)")
+    print(f"Speedup:           {pandas_time / fast_time:.1f}x, results identical")
+
+
+if __name__ == "__main__":
+    main()
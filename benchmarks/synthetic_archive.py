@@ -0,0 +1,82 @@
+"""Synthetic game archives for the benchmark scripts."""
+
+import logging
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from backend.game import Game, Wind
+from backend.data_export import (
+    create_metadata_dataframe, prepare_dataframes_for_saving, save_dataframes_to_excel
+)
+
+PLAYER_NAMES = ["Anna", "Ben", "Carla", "Dieter", "Emil", "Frieda", "Gustav", "Hanna"]
+ARCHIVE_START = datetime(2023, 1, 1, 19, 0, tzinfo=timezone(timedelta(hours=1)))
+
+
+def simulate_game(rng: random.Random, index: int, old_format: bool = False) -> Game:
+    """Play a complete game with random hands, one game per day starting at ARCHIVE_START."""
+    game = Game()
+    game.set_players(rng.sample(PLAYER_NAMES, 4))
+    game.start_time = None if old_format else ARCHIVE_START + timedelta(days=index)
+
+    while True:
+        winner = rng.choice(list(Wind))
+        points = {wind: (rng.randrange(0, 600, 20), rng.randint(0, 3)) for wind in Wind}
+        game.process_points_input(points, winner)
+        if old_format:
+            game.rounds[-1].start_time = None
+        else:
+            game.rounds[-1].start_time = game.start_time + timedelta(minutes=12 * len(game.rounds))
+        if game.is_game_over(winner):
+            break
+        game.start_new_round(winner)
+
+    game.end_time = None if old_format else game.start_time + timedelta(minutes=12 * len(game.rounds) + 5)
+    return game
+
+
+def _game_sheets(game: Game, old_format: bool) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    df = game.create_game_dataframe()
+    if old_format:
+        df = df.drop(columns=['spielstart', 'spielende'])
+    df_rounds, df_standings = prepare_dataframes_for_saving(df)
+    return create_metadata_dataframe(game), df_rounds, df_standings
+
+
+def generate_game_sheets(
+        n_files: int,
+        seed: int = 0,
+        old_format_every: int = 0) -> list[tuple[str, pd.DataFrame, pd.DataFrame, pd.DataFrame]]:
+    """
+    Generate the raw sheets of n_files games in memory.
+
+    Returns:
+        list of (filename, df_metadata, df_games, df_standings) as they are written to Excel
+    """
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(seed)
+    sheets = []
+    for index in range(n_files):
+        old_format = bool(old_format_every) and index % old_format_every == 0
+        game = simulate_game(rng, index, old_format)
+        sheets.append((f"game_{index:05d}", *_game_sheets(game, old_format)))
+    return sheets
+
+
+def write_archive(folder: Path, n_files: int, seed: int = 0, old_format_every: int = 0) -> list[Path]:
+    """Write a folder of n_files game workbooks with save_dataframes_to_excel."""
+    logging.disable(logging.CRITICAL)
+    folder.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    files = []
+    for index in range(n_files):
+        old_format = bool(old_format_every) and index % old_format_every == 0
+        game = simulate_game(rng, index, old_format)
+        _, df_rounds, df_standings = _game_sheets(game, old_format)
+        files.append(Path(save_dataframes_to_excel(df_rounds, df_standings, f"game_{index:05d}", folder, game=game)))
+    return files
@@ -0,0 +1,133 @@
+"""
+Manifest of all game files in a game folder.
+
+The manifest stores one summary record per workbook (players per wind, start
+and end, final standings, siegerpunkte, number of games) together with a
+fingerprint of the file. It is updated whenever a game is saved and rebuilt
+lazily for files whose fingerprint no longer matches, so summary questions
+about the folder can be answered without opening any workbook.
+
+The records and their storage are in manifest_records.py. During an
+evaluation, the loader builds the records of changed files from the sheets
+it reads anyway (see excel_loader.iter_dataframes_from_folder), so each
+changed file is parsed once.
+"""
+from datetime import datetime
+from pathlib import Path
+from backend.helper_functions import setup_logger
+from backend.evaluation.excel_loader import read_raw_sheets
+from backend.manifest_records import (
+    build_record, file_fingerprint, invalid_record, is_pending, load_manifest, pending_record, save_manifest
+)
+
+logger = setup_logger(__name__)
+
+
+def scan_manifest(folder_path: Path) -> tuple[dict, bool]:
+    """
+    Bring the manifest in line with the files of the folder without reading any workbook.
+
+    Records of removed files are dropped, new or changed files get a pending
+    record (see manifest_records.pending_record) with their current fingerprint,
+    to be filled by complete_manifest or by the loader from the sheets it reads.
+
+    Returns:
+        tuple[dict, bool]: (manifest, changed)
+    """
+    manifest = load_manifest(folder_path)
+    if not folder_path.is_dir():
+        return manifest, False
+
+    records = manifest['files']
+    current_files = {file.name: file for file in folder_path.glob("*.xls*")}
+    changed = False
+
+    for name in list(records):
+        if name not in current_files:
+            del records[name]
+            changed = True
+
+    for name, file_path in current_files.items():
+        record = records.get(name)
+        if not is_pending(record) and record['fingerprint'] == file_fingerprint(file_path):
+            continue
+        records[name] = pending_record(file_path)
+        changed = True
+
+    return manifest, changed
+
+
+def complete_manifest(folder_path: Path, manifest: dict) -> None:
+    """Read and summarize the workbooks of all pending records, in place."""
+    for name, record in manifest['files'].items():
+        if not is_pending(record):
+            continue
+        file_path = folder_path / name
+        logger.debug(f"Updating manifest record of {name}")
+        try:
+            manifest['files'][name] = build_record(file_path, *read_raw_sheets(file_path))
+        except Exception as e:
+            logger.warning(f"Could not summarize {name} for the manifest. Error: {e}")
+            manifest['files'][name] = invalid_record(file_path, type(e).__name__)
+
+
+def get_manifest(folder_path: Path) -> dict:
+    """
+    Return the manifest of a folder, rebuilding the records of new or changed
+    files and dropping those of removed files.
+
+    Returns:
+        dict: {'version': int, 'files': {filename: record}}
+    """
+    manifest, changed = scan_manifest(folder_path)
+    if changed:
+        complete_manifest(folder_path, manifest)
+        save_manifest(folder_path, manifest)
+    return manifest
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def summarize_manifest(manifest: dict) -> dict:
+    """
+    Aggregate the manifest records of all valid files.
+
+    Returns:
+        dict: Number of 'files' and 'invalid' files (pending records count as neither), total 'games', 'first' and
+        'last' start as datetime (None if unknown), 'players' sorted by name
+        and 'siegerpunkte' per player, sorted descending
+    """
+    valid = [record for record in manifest['files'].values() if record['valid']]
+    pending = [record for record in manifest['files'].values() if is_pending(record)]
+    starts = [start for start in (_parse_timestamp(record['start']) for record in valid) if start]
+
+    siegerpunkte = {}
+    for record in valid:
+        for player, points in record['siegerpunkte'].items():
+            siegerpunkte[player] = siegerpunkte.get(player, 0) + points
+
+    return {
+        'files': len(valid),
+        'invalid': len(manifest['files']) - len(valid) - len(pending),
+        'games': sum(record['games'] for record in valid),
+        'first': min(starts) if starts else None,
+        'last': max(starts) if starts else None,
+        'players': sorted(siegerpunkte),
+        'siegerpunkte': dict(sorted(siegerpunkte.items(), key=lambda item: item[1], reverse=True)),
+    }
+
+
+def format_manifest_summary(summary: dict) -> str:
+    """Short German description of a folder summary for the UI."""
+    if not summary['files']:
+        return "Noch keine gespeicherten Runden"
+    parts = [f"{summary['files']} Runden, {summary['games']} Spiele"]
+    if summary['first'] and summary['last']:
+        parts.append(f"{summary['first']:%d.%m.%Y} – {summary['last']:%d.%m.%Y}")
+    parts.append(f"{len(summary['players'])} Spieler")
+    return " | ".join(parts)
@@ -2,6 +2,8 @@ from logging import getLogger
 import pandas as pd
 import os
 from pathlib import Path
+from backend.manifest_records import build_record, update_manifest_record
+from backend.player_registry import register_players
 
 
 def create_metadata_dataframe(game) -> pd.DataFrame:
@@ -129,6 +131,19 @@ def save_dataframes_to_excel(df_rounds: pd.DataFrame, df_standings: pd.DataFrame
     
     logger = getLogger(__name__)
     logger.info(f"Game results saved to {full_path}")
+
+    # Keep the folder manifest in sync without reading the file back
+    try:
+        df_metadata = create_metadata_dataframe(game) if game is not None else pd.DataFrame()
+        record = build_record(full_path, df_metadata, df_rounds, df_standings)
+        update_manifest_record(full_path.parent, record)
+    except Exception as e:
+        logger.warning(f"Could not update manifest for {full_path}. Error: {e}")
+
+    try:
+        register_players(full_path.parent, df_standings.iloc[:, 1].tolist())
+    except Exception as e:
+        logger.warning(f"Could not update player registry for {full_path}. Error: {e}")
     
     return str(full_path)
 
@@ -0,0 +1,135 @@
+"""
+Headless evaluation: python -m backend.evaluation <Spielordner> [...]
+
+Runs start_evaluation on one or more game folders without the Kivy app, for
+example from cron to refresh the dashboards nightly. Prints the stage
+timings and memory high-water marks per folder; the exit code is 1 if a
+folder could not be evaluated.
+
+stdout only carries this report: log messages go to stderr, only warnings
+and errors unless --verbose is given, and no app.log is written.
+"""
+import argparse
+import logging
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.evaluation.orchestrator import STAGE_LABELS, start_evaluation
+
+
+def _configure_logging(verbose: bool) -> None:
+    """Drop the app.log handlers of the module loggers and set the level of their stderr output."""
+    for logger in logging.Logger.manager.loggerDict.values():
+        if not isinstance(logger, logging.Logger):
+            continue
+        for handler in list(logger.handlers):
+            # FileHandler is a StreamHandler, check it first
+            if isinstance(handler, logging.FileHandler):
+                logger.removeHandler(handler)
+                handler.close()
+            elif isinstance(handler, logging.StreamHandler):
+                handler.setLevel(logging.DEBUG if verbose else logging.WARNING)
+
+
+def _format_seconds(seconds: float) -> str:
+    return f"{seconds:.2f} s".replace(".", ",")
+
+
+def _peak_rss_mb() -> tuple[float, float] | None:
+    """Peak resident memory in MB of this process and of its largest worker process, None on Windows."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is in bytes on macOS and in KB elsewhere
+    unit = 1024**2 if sys.platform == 'darwin' else 1024
+    return (
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / unit,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / unit,
+    )
+
+
+def _print_report(
+        folder_path: Path,
+        html_file: Path,
+        loading_info: dict,
+        elapsed: float,
+        workers: int,
+        traced_peak: int | None):
+    cached = {'dashboard': ' (unverändert)', 'aggregates': ' (Daten aus dem Cache)'}.get(loading_info.get('cached'), '')
+    print(f"{folder_path}: {html_file}{cached}")
+    print(f"  {len(loading_info['loaded'])} Dateien geladen, {len(loading_info['failed'])} fehlerhaft")
+
+    stages = loading_info.get('stages', {})
+    for stage, label in STAGE_LABELS.items():
+        if stage in stages:
+            print(f"  {label:<16}{_format_seconds(stages[stage]):>10}")
+    print(f"  {'Gesamt':<16}{_format_seconds(elapsed):>10}")
+
+    # High-water marks: the process peaks are the maxima since the start of the run
+    peaks = _peak_rss_mb()
+    if peaks is not None:
+        process_peak, worker_peak = peaks
+        line = f"  Speicher (Spitze): Prozess {process_peak:.0f} MB"
+        if workers > 1:
+            line += f", Worker {worker_peak:.0f} MB"
+        print(line)
+    if traced_peak is not None:
+        print(f"  Python-Allokationen (Spitze): {traced_peak / 1024**2:.0f} MB")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.evaluation",
+        description="Erstellt die Auswertungen der Spielordner ohne die App zu starten."
+    )
+    parser.add_argument("folders", type=Path, nargs="+", help="Spielordner mit den Excel-Dateien")
+    parser.add_argument(
+        "-o", "--output", type=Path,
+        help="Zielordner der Dashboards (Standard: der jeweilige Spielordner)"
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1,
+        help="Anzahl Prozesse für die Diagramme (Standard: 1)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Alles neu auswerten, Caches ignorieren")
+    parser.add_argument(
+        "--trace-memory", action="store_true",
+        help="Spitze der Python-Allokationen je Ordner messen (langsamer)"
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true",
+        help="Alle Log-Meldungen auf stderr ausgeben (Standard: nur Warnungen und Fehler)"
+    )
+    args = parser.parse_args(argv)
+    _configure_logging(args.verbose)
+
+    if args.output:
+        args.output.mkdir(parents=True, exist_ok=True)
+    if args.trace_memory:
+        tracemalloc.start()
+
+    failed = 0
+    for folder_path in args.folders:
+        if args.trace_memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            html_file, loading_info = start_evaluation(
+                folder_path, workers=args.workers, use_cache=not args.no_cache, output_path=args.output
+            )
+        except (ValueError, OSError) as e:
+            failed += 1
+            print(f"{folder_path}: Fehler: {e}", file=sys.stderr)
+            continue
+        traced_peak = tracemalloc.get_traced_memory()[1] if args.trace_memory else None
+        _print_report(folder_path, html_file, loading_info, time.perf_counter() - start, args.workers, traced_peak)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Bootstrap confidence intervals of per-player averages.
+
+For every player, a (resamples, games) index matrix is drawn into the
+player's values and the mean of each row is one bootstrap mean. The interval
+is given by the percentiles of those means. Several columns of the same games
+(e.g. netto and delta points) share one index matrix, which saves random
+draws and keeps the resamples of the columns paired. To keep memory bounded,
+the matrix is drawn in row blocks of at most BOOTSTRAP_BLOCK_VALUES entries.
+
+Every player draws from its own generator, seeded with (BOOTSTRAP_SEED,
+position of the player). The intervals are therefore reproducible and do not
+depend on whether the players are resampled in this process or in a pool of
+worker processes.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+BOOTSTRAP_RESAMPLES = 1000
+BOOTSTRAP_CONFIDENCE = 0.95
+BOOTSTRAP_SEED = 2024
+BOOTSTRAP_BLOCK_VALUES = 4_000_000  # Max entries of one block of the resample index matrix
+BOOTSTRAP_PARALLEL_VALUES = 200_000  # Fewer values in total are resampled in this process
+
+
+def _mean_interval(values: np.ndarray, seed: tuple[int, int], resamples: int, confidence: float) -> np.ndarray:
+    """Bootstrap interval [lower, upper] of the mean of values per column, NaN for fewer than 2 values."""
+    values = np.asarray(values)
+    n = len(values)
+    if n < 2:
+        return np.full(values.shape[1:] + (2,), np.nan)
+    rng = np.random.default_rng(seed)
+    # Contiguous columns: gathering from a 1-D array and summing along rows is the fastest layout,
+    # integer points are summed exactly
+    columns = np.ascontiguousarray(values.reshape(n, -1).T)
+    rows = max(1, BOOTSTRAP_BLOCK_VALUES // n)
+    means = []
+    for start in range(0, resamples, rows):
+        indices = rng.integers(0, n, size=(min(rows, resamples - start), n), dtype=np.int32)
+        means.append([column[indices].sum(axis=1) / n for column in columns])
+    tail = (1 - confidence) / 2 * 100
+    bounds = np.percentile(np.concatenate(means, axis=1), [tail, 100 - tail], axis=1).T
+    return bounds.reshape(values.shape[1:] + (2,))
+
+
+def bootstrap_mean_intervals(
+        samples: list[np.ndarray],
+        resamples: int = BOOTSTRAP_RESAMPLES,
+        confidence: float = BOOTSTRAP_CONFIDENCE,
+        seed: int = BOOTSTRAP_SEED,
+        workers: int = 1) -> np.ndarray:
+    """
+    Bootstrap confidence intervals of the means of several samples.
+
+    Args:
+        samples: Values per player, (games,) or (games, columns) to resample columns together
+        resamples: Bootstrap resamples per player
+        confidence: Confidence level of the intervals
+        seed: Base seed, combined with the position of each sample
+        workers: Number of worker processes, used only for more than
+            BOOTSTRAP_PARALLEL_VALUES values in total
+
+    Returns:
+        np.ndarray: (samples, 2) or (samples, columns, 2) lower and upper bound,
+            NaN for samples with fewer than 2 values; (0, 2) without samples
+    """
+    if not samples:
+        return np.empty((0, 2))
+    seeds = [(seed, i) for i in range(len(samples))]
+    if workers <= 1 or len(samples) <= 1 or sum(len(values) for values in samples) <= BOOTSTRAP_PARALLEL_VALUES:
+        return np.array([_mean_interval(values, s, resamples, confidence) for values, s in zip(samples, seeds)])
+    with ProcessPoolExecutor(max_workers=min(workers, len(samples))) as executor:
+        return np.array(list(executor.map(
+            _mean_interval, samples, seeds, [resamples] * len(samples), [confidence] * len(samples)
+        )))
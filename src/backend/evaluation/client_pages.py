@@ -0,0 +1,474 @@
+"""
+Dashboard pages that are built in the browser.
+
+These pages are not pre-rendered into the HTML. Their JavaScript builder
+runs when the page is opened for the first time and reads the compact
+dataset (see compact_dataset.py), so adding pages does not slow down the
+initial load of the dashboard.
+
+The filter page derives its index from the dataset once when it is built:
+per-player prefix sums over the continuous game index and the rounds of
+every player (co-occurrence index). Embedding them would repeat the player
+rows of the dataset in a less compact form. A date range is a contiguous
+range of rounds, so its totals cost O(players) per filter change; a player
+subset adds O(players) per run of consecutive matching rounds.
+
+The round details page lists one row per player and game. Only the blocks
+of rows in the visible part of its scroll area are in the DOM, so archives
+with tens of thousands of rows stay responsive.
+"""
+from dataclasses import dataclass
+
+
+@dataclass
+class ClientPage:
+    """A lazily built dashboard page."""
+    page_id: str   # HTML ids are '<page_id>-page' and 'btn-<page_id>'
+    label: str     # Navigation button text
+    builder: str   # Name of the JS function(container, data) in PAGES_JS
+
+
+CLIENT_PAGES = [
+    ClientPage('times', '⏱️ Spielzeiten', 'buildTimesPage'),
+    ClientPage('filter', '🔎 Filter', 'buildFilterPage'),
+    ClientPage('details', '📋 Rundendetails', 'buildDetailsPage'),
+]
+
+# Shared chart helper and one builder per page
+PAGES_JS = """
+            function addChart(container, title, traces, layout) {
+                const div = document.createElement('div');
+                div.className = 'chart';
+                container.appendChild(div);
+                Plotly.newPlot(div, traces, Object.assign({
+                    title: {text: title},
+                    height: 420,
+                    paper_bgcolor: 'white',
+                    plot_bgcolor: 'white',
+                    showlegend: false
+                }, layout), {responsive: true});
+                return div;
+            }
+
+            function addNotice(container, text) {
+                const notice = document.createElement('p');
+                notice.className = 'notice';
+                notice.textContent = text;
+                container.appendChild(notice);
+            }
+
+            function buildTimesPage(container, data) {
+                const gameStarts = data.games.start.filter(start => start !== null);
+                if (!gameStarts.length) {
+                    addNotice(container, 'Keine Zeitangaben vorhanden (nur Dateien im alten Format).');
+                    return;
+                }
+
+                // Games per month
+                const months = new Map();
+                gameStarts.forEach(start => {
+                    const month = start.getFullYear() + '-' + String(start.getMonth() + 1).padStart(2, '0');
+                    months.set(month, (months.get(month) || 0) + 1);
+                });
+                const monthKeys = [...months.keys()].sort();
+                addChart(container, 'Spiele pro Monat', [{
+                    type: 'bar',
+                    x: monthKeys,
+                    y: monthKeys.map(month => months.get(month)),
+                    marker: {color: '#3498db'}
+                }], {
+                    xaxis: {type: 'category', title: {text: 'Monat'}},
+                    yaxis: {title: {text: 'Spiele'}}
+                });
+
+                // Round starts by hour of day (local time of the browser)
+                const hours = new Array(24).fill(0);
+                data.rounds.start.forEach(start => {
+                    if (start !== null) hours[start.getHours()] += 1;
+                });
+                addChart(container, 'Rundenbeginn nach Uhrzeit', [{
+                    type: 'bar',
+                    x: hours.map((_, hour) => hour + ' Uhr'),
+                    y: hours,
+                    marker: {color: '#27ae60'}
+                }], {
+                    xaxis: {type: 'category', title: {text: 'Uhrzeit'}},
+                    yaxis: {title: {text: 'Runden'}}
+                });
+
+                // Game durations in minutes
+                const durations = data.games.duration
+                    .filter(seconds => seconds !== null && seconds >= 0)
+                    .map(seconds => seconds / 60);
+                addChart(container, 'Spieldauer', [{
+                    type: 'histogram',
+                    x: durations,
+                    xbins: {size: 1},
+                    marker: {color: '#e67e22'}
+                }], {
+                    xaxis: {title: {text: 'Minuten'}},
+                    yaxis: {title: {text: 'Spiele'}}
+                });
+            }
+
+            // Sums of the filter page, per player and game; missing point cells (null) are skipped,
+            // so the averages divide by the games with a known value
+            const FILTER_SUMS = ['games', 'rounds', 'wins', 'siegerpunkte', 'netto', 'delta', 'nettoGames', 'deltaGames'];
+            const PODIUM_COLORS = ['#FFD700', '#C0C0C0', '#CD7F32', '#939393'];
+
+            function lowerBound(values, target, lo, hi) {
+                while (lo < hi) {
+                    const mid = (lo + hi) >> 1;
+                    if (values[mid] < target) lo = mid + 1; else hi = mid;
+                }
+                return lo;
+            }
+
+            function buildFilterIndex(data) {
+                const nPlayers = data.players.length;
+                const nGames = data.games.round.length;
+                const nRounds = data.rounds.file.length;
+
+                // Game range [roundStart, roundEnd) of every round
+                const roundStart = new Int32Array(nRounds).fill(nGames);
+                const roundEnd = new Int32Array(nRounds);
+                data.games.round.forEach((round, game) => {
+                    roundStart[round] = Math.min(roundStart[round], game);
+                    roundEnd[round] = game + 1;
+                });
+
+                // Per-player prefix sums over the game index, entry g holds the sum of games 0 .. g-1;
+                // rounds, wins and the rounds of every player are counted on the final game of a round
+                const prefix = {};
+                FILTER_SUMS.forEach(name => {
+                    prefix[name] = Array.from({length: nPlayers}, () => new Float64Array(nGames + 1));
+                });
+                const roundsByPlayer = Array.from({length: nPlayers}, () => []);
+                const rows = data.rows;
+                rows.game.forEach((game, i) => {
+                    const player = rows.player[i];
+                    const round = data.games.round[game];
+                    prefix.games[player][game + 1] += 1;
+                    if (rows.netto[i] !== null) {
+                        prefix.netto[player][game + 1] += rows.netto[i];
+                        prefix.nettoGames[player][game + 1] += 1;
+                    }
+                    if (rows.delta[i] !== null) {
+                        prefix.delta[player][game + 1] += rows.delta[i];
+                        prefix.deltaGames[player][game + 1] += 1;
+                    }
+                    prefix.siegerpunkte[player][game + 1] += rows.siegerpunkte[i];
+                    if (game === roundEnd[round] - 1) {
+                        prefix.rounds[player][game + 1] += 1;
+                        if (rows.rang[i] === 1) prefix.wins[player][game + 1] += 1;
+                        roundsByPlayer[player].push(round);
+                    }
+                });
+                Object.values(prefix).forEach(perPlayer => perPlayer.forEach(sums => {
+                    for (let game = 1; game <= nGames; game++) sums[game] += sums[game - 1];
+                }));
+
+                // Rounds without timing come first and only match without a date range
+                const roundTimes = data.rounds.start.map(start => start === null ? null : start.getTime());
+                const firstTimed = roundTimes.findIndex(time => time !== null);
+                return {
+                    prefix, roundStart, roundEnd, roundsByPlayer, roundTimes, nRounds,
+                    firstTimed: firstTimed < 0 ? nRounds : firstTimed
+                };
+            }
+
+            function filterRounds(index, from, to, players) {
+                // The date range selects a contiguous range of rounds
+                let lo = 0;
+                let hi = index.nRounds;
+                if (from !== null || to !== null) {
+                    lo = index.firstTimed;
+                    if (from !== null) lo = lowerBound(index.roundTimes, from, lo, hi);
+                    if (to !== null) hi = lowerBound(index.roundTimes, to, lo, hi);
+                }
+                if (lo >= hi) return [];
+                if (!players.length) return [[lo, hi]];
+
+                // Rounds with all selected players: intersect their round lists, shortest first
+                const lists = players.map(player => index.roundsByPlayer[player]).sort((a, b) => a.length - b.length);
+                let rounds = lists[0].slice(lowerBound(lists[0], lo, 0, lists[0].length), lowerBound(lists[0], hi, 0, lists[0].length));
+                lists.slice(1).forEach(list => {
+                    rounds = rounds.filter(round => list[lowerBound(list, round, 0, list.length)] === round);
+                });
+
+                // Runs [first, last) of consecutive rounds
+                const runs = [];
+                rounds.forEach(round => {
+                    const run = runs[runs.length - 1];
+                    if (run && run[1] === round) run[1] = round + 1; else runs.push([round, round + 1]);
+                });
+                return runs;
+            }
+
+            function filterTotals(index, runs) {
+                const totals = {};
+                FILTER_SUMS.forEach(name => {
+                    totals[name] = index.prefix[name].map(sums => runs.reduce(
+                        (sum, [first, last]) => sum + sums[index.roundEnd[last - 1]] - sums[index.roundStart[first]], 0
+                    ));
+                });
+                return totals;
+            }
+
+            function buildFilterPage(container, data) {
+                if (!data.rounds.file.length) {
+                    addNotice(container, 'Keine Runden vorhanden.');
+                    return;
+                }
+                const index = buildFilterIndex(data);
+
+                // Controls: date range and players who must have been at the table
+                const controls = document.createElement('div');
+                controls.className = 'filter-bar';
+                container.appendChild(controls);
+                function addControl(text, input) {
+                    const label = document.createElement('label');
+                    label.textContent = text;
+                    label.appendChild(input);
+                    controls.appendChild(label);
+                    return input;
+                }
+                function dateInput(text) {
+                    const input = document.createElement('input');
+                    input.type = 'date';
+                    return addControl(text, input);
+                }
+                const fromInput = dateInput('Von ');
+                const toInput = dateInput('Bis ');
+                const playerInputs = data.players.map(name => {
+                    const input = document.createElement('input');
+                    input.type = 'checkbox';
+                    return addControl(' ' + name, input);
+                });
+                const summary = document.createElement('span');
+                summary.className = 'filter-summary';
+                controls.appendChild(summary);
+
+                const siegerChart = addChart(container, 'Podium - Siegerpunkte', [], {yaxis: {title: {text: 'Siegerpunkte'}}});
+                const totalChart = addChart(container, 'Podium - Gesamtpunktzahl', [], {yaxis: {title: {text: 'Gesamtpunktzahl'}}});
+                const table = document.createElement('table');
+                table.className = 'filter-table';
+                container.appendChild(table);
+
+                // Local midnight of a date input, the end date includes its whole day
+                function dateBound(input, nextDay) {
+                    if (!input.value) return null;
+                    const [year, month, day] = input.value.split('-').map(Number);
+                    return new Date(year, month - 1, day + (nextDay ? 1 : 0)).getTime();
+                }
+
+                function podium(chart, title, values, players) {
+                    const order = players.slice().sort((a, b) => values[b] - values[a] || data.players[a].localeCompare(data.players[b]));
+                    Plotly.react(chart, [{
+                        type: 'bar',
+                        x: order.map(player => data.players[player]),
+                        y: order.map(player => values[player]),
+                        text: order.map(player => values[player].toLocaleString('de-DE')),
+                        textposition: 'auto',
+                        marker: {color: order.map((_, rank) => rank < PODIUM_COLORS.length ? PODIUM_COLORS[rank] : '#A9A9A9')}
+                    }], Object.assign({}, chart.layout, {title: {text: title}}));
+                }
+
+                function average(sum, count) {
+                    return count ? Math.round(sum / count).toLocaleString('de-DE') : '–';
+                }
+
+                function update() {
+                    const selected = playerInputs.map((input, player) => input.checked ? player : -1).filter(player => player >= 0);
+                    const runs = filterRounds(index, dateBound(fromInput, false), dateBound(toInput, true), selected);
+                    const totals = filterTotals(index, runs);
+                    const rounds = runs.reduce((sum, [first, last]) => sum + last - first, 0);
+                    const games = runs.reduce((sum, [first, last]) => sum + index.roundEnd[last - 1] - index.roundStart[first], 0);
+                    summary.textContent = rounds + ' Runden, ' + games + ' Spiele';
+
+                    const players = data.players.map((_, player) => player).filter(player => totals.games[player] > 0);
+                    podium(siegerChart, 'Podium - Siegerpunkte', totals.siegerpunkte, players);
+                    podium(totalChart, 'Podium - Gesamtpunktzahl', totals.delta, players);
+
+                    table.textContent = '';
+                    const header = ['Spieler', 'Runden', 'Siege', 'Spiele', 'Siegerpunkte', 'Gesamtpunktzahl', 'Ø Netto', 'Ø Delta'];
+                    const tableRows = [header].concat(players.map(player => [
+                        data.players[player],
+                        totals.rounds[player],
+                        totals.wins[player],
+                        totals.games[player],
+                        totals.siegerpunkte[player],
+                        totals.delta[player].toLocaleString('de-DE'),
+                        average(totals.netto[player], totals.nettoGames[player]),
+                        average(totals.delta[player], totals.deltaGames[player])
+                    ]));
+                    tableRows.forEach((cells, row) => {
+                        const tr = document.createElement('tr');
+                        cells.forEach(value => {
+                            const cell = document.createElement(row === 0 ? 'th' : 'td');
+                            cell.textContent = value;
+                            tr.appendChild(cell);
+                        });
+                        table.appendChild(tr);
+                    });
+                }
+
+                controls.addEventListener('change', update);
+                update();
+            }
+
+            // Round details: rows are rendered in blocks of DETAIL_BLOCK_ROWS, only the visible ones
+            const DETAIL_ROW_HEIGHT = 28;
+            const DETAIL_BLOCK_ROWS = 50;
+
+            function formatDateTime(date) {
+                if (date === null) return '–';
+                return date.toLocaleString('de-DE', {
+                    day: '2-digit', month: '2-digit', year: 'numeric', hour: '2-digit', minute: '2-digit'
+                });
+            }
+
+            function buildDetailsPage(container, data) {
+                const rows = data.rows;
+                const games = data.games;
+                const nRows = rows.game.length;
+                if (!nRows) {
+                    addNotice(container, 'Keine Spiele vorhanden.');
+                    return;
+                }
+                const windName = code => code >= 0 ? data.winds[code] : '–';
+                const number = value => value === null ? '–' : value.toLocaleString('de-DE');
+                const columns = [
+                    {label: 'Runde', value: (i, game) => games.round[game] + 1, numeric: true},
+                    {label: 'Datei', value: (i, game) => data.rounds.file[games.round[game]]},
+                    {label: 'Spiel', value: (i, game) => games.spiel_index[game], numeric: true},
+                    {label: 'Beginn', value: (i, game) => formatDateTime(games.start[game])},
+                    {label: 'Spielführer', value: (i, game) => windName(games.wind[game])},
+                    {label: 'Gewinner', value: (i, game) => windName(games.winner[game])},
+                    {label: 'Spieler', value: i => data.players[rows.player[i]]},
+                    {label: 'Wind', value: i => windName(rows.wind[i])},
+                    {label: 'Brutto', value: i => number(rows.brutto[i]), numeric: true},
+                    {label: 'Verdopplungen', value: i => number(rows.verdopplungen[i]), numeric: true},
+                    {label: 'Netto', value: i => number(rows.netto[i]), numeric: true},
+                    {label: 'Delta', value: i => number(rows.delta[i]), numeric: true},
+                    {label: 'Punktestand', value: i => number(rows.punktestand[i]), numeric: true},
+                    {label: 'Rang', value: i => number(rows.rang[i]), numeric: true}
+                ];
+
+                // Rows of round r are [roundRowStart[r], roundRowStart[r + 1]), rows are in chronological order
+                const nRounds = data.rounds.file.length;
+                const roundRowStart = new Int32Array(nRounds + 1).fill(nRows);
+                for (let i = nRows - 1; i >= 0; i--) roundRowStart[games.round[rows.game[i]]] = i;
+
+                // Controls: drill down to one round and / or one player
+                const controls = document.createElement('div');
+                controls.className = 'filter-bar';
+                container.appendChild(controls);
+                function addSelect(text, allLabel, labels) {
+                    const label = document.createElement('label');
+                    label.textContent = text;
+                    const select = document.createElement('select');
+                    [allLabel].concat(labels).forEach((optionLabel, position) => {
+                        const option = document.createElement('option');
+                        option.value = position - 1;
+                        option.textContent = optionLabel;
+                        select.appendChild(option);
+                    });
+                    label.appendChild(select);
+                    controls.appendChild(label);
+                    return select;
+                }
+                const roundSelect = addSelect('Runde ', 'Alle Runden', data.rounds.file.map((file, round) =>
+                    (round + 1) + ': ' + file + (data.rounds.start[round] ? ' (' + formatDateTime(data.rounds.start[round]) + ')' : '')
+                ));
+                const playerSelect = addSelect('Spieler ', 'Alle Spieler', data.players);
+                const summary = document.createElement('span');
+                summary.className = 'filter-summary';
+                controls.appendChild(summary);
+
+                function makeRow(values, className) {
+                    const row = document.createElement('div');
+                    row.className = className;
+                    values.forEach((value, column) => {
+                        const cell = document.createElement('span');
+                        if (columns[column].numeric) cell.className = 'num';
+                        cell.textContent = value;
+                        row.appendChild(cell);
+                    });
+                    return row;
+                }
+
+                // Scroll area: sticky header, a canvas with the height of all rows and the rendered block range
+                const viewport = document.createElement('div');
+                viewport.className = 'detail-viewport';
+                viewport.appendChild(makeRow(columns.map(column => column.label), 'detail-row detail-header'));
+                const canvas = document.createElement('div');
+                canvas.className = 'detail-canvas';
+                const block = document.createElement('div');
+                block.className = 'detail-block';
+                canvas.appendChild(block);
+                viewport.appendChild(canvas);
+                container.appendChild(viewport);
+
+                let selection = new Int32Array(0);
+                let renderedRange = null;
+
+                function render() {
+                    const blockHeight = DETAIL_ROW_HEIGHT * DETAIL_BLOCK_ROWS;
+                    const first = Math.floor(viewport.scrollTop / blockHeight) * DETAIL_BLOCK_ROWS;
+                    const blocks = Math.ceil(viewport.clientHeight / blockHeight) + 1;
+                    const last = Math.min(selection.length, first + blocks * DETAIL_BLOCK_ROWS);
+                    if (renderedRange === first + '-' + last) return;
+                    renderedRange = first + '-' + last;
+
+                    const fragment = document.createDocumentFragment();
+                    for (let position = first; position < last; position++) {
+                        const i = selection[position];
+                        const game = rows.game[i];
+                        const previousGame = position > 0 ? rows.game[selection[position - 1]] : -1;
+                        const className = 'detail-row' + (game % 2 ? ' odd-game' : '') + (game !== previousGame ? ' game-start' : '');
+                        fragment.appendChild(makeRow(columns.map(column => column.value(i, game)), className));
+                    }
+                    block.style.top = first * DETAIL_ROW_HEIGHT + 'px';
+                    block.replaceChildren(fragment);
+                }
+
+                function update() {
+                    const round = Number(roundSelect.value);
+                    const player = Number(playerSelect.value);
+                    const first = round >= 0 ? roundRowStart[round] : 0;
+                    const last = round >= 0 ? roundRowStart[round + 1] : nRows;
+                    const positions = [];
+                    for (let i = first; i < last; i++) {
+                        if (player < 0 || rows.player[i] === player) positions.push(i);
+                    }
+                    selection = Int32Array.from(positions);
+                    summary.textContent = number(selection.length) + ' Zeilen';
+                    canvas.style.height = selection.length * DETAIL_ROW_HEIGHT + 'px';
+                    viewport.scrollTop = 0;
+                    renderedRange = null;
+                    render();
+                }
+
+                // At most one render per frame while scrolling
+                let renderPending = false;
+                function scheduleRender() {
+                    if (renderPending) return;
+                    renderPending = true;
+                    requestAnimationFrame(() => {
+                        renderPending = false;
+                        render();
+                    });
+                }
+                viewport.addEventListener('scroll', scheduleRender);
+                window.addEventListener('resize', scheduleRender);
+                controls.addEventListener('change', update);
+                update();
+            }
+"""
+
+
+def page_builders_js(pages: list[ClientPage]) -> str:
+    """JS object mapping the page ids to their builder functions."""
+    entries = ', '.join(f"'{page.page_id}': {page.builder}" for page in pages)
+    return f"            const PAGE_BUILDERS = {{{entries}}};\n"
@@ -0,0 +1,154 @@
+"""
+Compact columnar encoding of the fact table for pages built in the browser.
+
+The fact table repeats every round and game attribute on each player row.
+For embedding in the dashboard it is split back into one column list per
+table (rounds, games, rows), strings are replaced by integer codes and
+ascending values (timestamps, game numbers) are delta-encoded, so the JSON
+consists mostly of short integers. DECODER_JS turns it back into the same
+columns in the browser.
+"""
+import json
+import numpy as np
+import pandas as pd
+from backend.evaluation.metrics import WIND_ORDER
+
+DATASET_VERSION = 2
+
+
+def _delta_encode(values: np.ndarray, valid: np.ndarray) -> list:
+    """
+    Differences to the previous valid value, the first valid value as is.
+    Invalid entries become None and do not interrupt the chain.
+    """
+    encoded = np.zeros(len(values), dtype=np.int64)
+    valid_values = values[valid].astype(np.int64)
+    encoded[valid] = np.diff(valid_values, prepend=0)
+    return [int(value) if is_valid else None for value, is_valid in zip(encoded, valid)]
+
+
+def _epoch_seconds(timestamps: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Unix seconds of tz-aware timestamps and the mask of non-missing values."""
+    valid = timestamps.notna().to_numpy()
+    seconds = np.zeros(len(timestamps), dtype=np.int64)
+    seconds[valid] = timestamps[valid].astype('int64').to_numpy() // 10**9
+    return seconds, valid
+
+
+def _nullable_integers(values: pd.Series) -> list:
+    """Integer list of a point column, None (JSON null) for missing cells; NaN is not valid JSON."""
+    if not values.hasnans:
+        return values.to_numpy(dtype=np.int64).tolist()
+    return [None if pd.isna(value) else int(value) for value in values.tolist()]
+
+
+def _codes(values: pd.Series, categories: list) -> list[int]:
+    """Position of each value in categories, -1 for missing or unknown values."""
+    return pd.Categorical(values, categories=categories).codes.tolist()
+
+
+def encode_fact_table(df_facts: pd.DataFrame, player_names: dict[int, str]) -> dict:
+    """
+    Encode the fact table as compact columnar dataset.
+
+    Layout (all columns are lists of equal length per table):
+    - players / player_ids: Display name and spieler_id per player code
+    - winds: Wind name per wind code, in WIND_ORDER
+    - rounds: file, start (delta-encoded Unix seconds, null without timing)
+    - games: round (round position, delta-encoded), spiel_index,
+      start (delta-encoded Unix seconds), duration (seconds), wind, winner (wind codes)
+    - rows: game (game position, delta-encoded), player (player code), wind,
+      brutto, verdopplungen, netto, delta, punktestand, rang, siegerpunkte
+      (null for missing point cells)
+
+    Rounds and games are in the chronological order of the fact table, so
+    round and game positions equal round_index - 1 and game_index - 1.
+
+    Args:
+        df_facts: Player-game fact table, see fact_table.build_fact_table
+        player_names: Display name per spieler_id
+
+    Returns:
+        dict: JSON-serializable dataset
+    """
+    player_codes, player_ids = pd.factorize(df_facts['spieler_id'], sort=True)
+
+    df_games = df_facts.drop_duplicates('game_index')
+    df_rounds = df_games.drop_duplicates('round_index')
+
+    round_start, round_valid = _epoch_seconds(df_rounds['rundenstart'])
+    game_start, game_valid = _epoch_seconds(df_games['spielstart'])
+    duration = df_games['spieldauer'].dt.total_seconds()
+    game_round = df_games['round_index'].to_numpy() - 1
+    row_game = df_facts['game_index'].to_numpy() - 1
+
+    return {
+        'version': DATASET_VERSION,
+        'players': [player_names[player_id] for player_id in player_ids],
+        'player_ids': [int(player_id) for player_id in player_ids],
+        'winds': WIND_ORDER,
+        'rounds': {
+            'file': df_rounds['dateiname'].tolist(),
+            'start': _delta_encode(round_start, round_valid),
+        },
+        'games': {
+            'round': _delta_encode(game_round, np.ones(len(game_round), dtype=bool)),
+            'spiel_index': df_games['spiel_index'].tolist(),
+            'start': _delta_encode(game_start, game_valid),
+            'duration': [None if pd.isna(value) else int(value) for value in duration],
+            'wind': _codes(df_games['wind_des_spiels'], WIND_ORDER),
+            'winner': _codes(df_games['gewinner_wind'], WIND_ORDER),
+        },
+        'rows': {
+            'game': _delta_encode(row_game, np.ones(len(row_game), dtype=bool)),
+            'player': player_codes.tolist(),
+            'wind': _codes(df_facts['spieler_wind'], WIND_ORDER),
+            'brutto': _nullable_integers(df_facts['punkte_brutto']),
+            'verdopplungen': _nullable_integers(df_facts['verdopplungen']),
+            'netto': _nullable_integers(df_facts['punkte_netto']),
+            'delta': _nullable_integers(df_facts['punkte_delta']),
+            'punktestand': _nullable_integers(df_facts['punktestand']),
+            'rang': _nullable_integers(df_facts['rang']),
+            'siegerpunkte': df_facts['siegerpunkte'].tolist(),
+        },
+    }
+
+
+def dataset_script(dataset: dict) -> str:
+    """Embed a dataset as JSON data block, read by DECODER_JS."""
+    # JSON.parse rejects NaN, missing values must already be None
+    payload = json.dumps(dataset, ensure_ascii=False, separators=(',', ':'), allow_nan=False)
+    # A literal "</" would end the script element early
+    payload = payload.replace('</', '<\\/')
+    return f'<script type="application/json" id="dashboard-data">{payload}</script>'
+
+
+# Browser side of the encoding: loadDataset() parses the data block on first use
+# and undoes the delta encoding (timestamps become Date objects or null)
+DECODER_JS = """
+            let dashboardDataset = null;
+
+            function decodeDeltas(values) {
+                let previous = 0;
+                return values.map(value => {
+                    if (value === null) return null;
+                    previous += value;
+                    return previous;
+                });
+            }
+
+            function toDates(seconds) {
+                return seconds.map(value => value === null ? null : new Date(value * 1000));
+            }
+
+            function loadDataset() {
+                if (dashboardDataset) return dashboardDataset;
+                const data = JSON.parse(document.getElementById('dashboard-data').textContent);
+                data.rounds.start = toDates(decodeDeltas(data.rounds.start));
+                data.games.round = decodeDeltas(data.games.round);
+                data.games.start = toDates(decodeDeltas(data.games.start));
+                data.rows.game = decodeDeltas(data.rows.game);
+                dashboardDataset = data;
+                return data;
+            }
+"""
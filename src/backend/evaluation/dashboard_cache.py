@@ -0,0 +1,183 @@
+"""
+Fingerprint cache of the dashboard.
+
+An evaluation depends on the game files, the player registry and the code
+that loads and renders them. The data fingerprint covers the file
+fingerprints from the manifest, the registry and the loading code; the
+dashboard fingerprint adds the rendering code and is stored in a meta tag
+of the generated HTML. If it still matches, the existing dashboard is
+returned without loading anything. The aggregates (fact table and loading
+statistics) are stored by data fingerprint, so a change of the rendering
+code only re-renders.
+
+The game folder may be shared or synced, so the aggregates are not pickled:
+the DataFrame columns are stored as plain arrays in an .npz file read with
+allow_pickle=False, everything else as JSON inside it. Files that cannot be
+read that way are cache misses.
+
+The code versions hash the module sources. In a frozen app without sources
+only CACHE_VERSION counts, so it has to be increased with every release that
+changes the evaluation.
+"""
+import hashlib
+import importlib
+import json
+import os
+import re
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from plotly.offline import get_plotlyjs_version
+from backend.helper_functions import setup_logger
+
+logger = setup_logger(__name__)
+
+CACHE_FILENAME = "myjongg_dashboard_cache.npz"
+LEGACY_CACHE_FILENAME = "myjongg_dashboard_cache.pkl"  # Pickled cache of earlier versions, removed on save
+CACHE_VERSION = 2
+FINGERPRINT_META = "myjongg-fingerprint"
+
+# By name, the rendering modules import this one for the meta tag
+DATA_MODULES = [
+    'backend.evaluation.xlsx_reader', 'backend.evaluation.excel_loader', 'backend.evaluation.transformations',
+    'backend.evaluation.validation', 'backend.evaluation.fact_table', 'backend.player_registry',
+    'backend.manifest_records',
+]
+DASHBOARD_MODULES = [
+    'backend.evaluation.metrics', 'backend.evaluation.bootstrap', 'backend.evaluation.downsampling',
+    'backend.evaluation.compact_dataset', 'backend.evaluation.client_pages', 'backend.evaluation.plotly_asset',
+    'backend.evaluation.rating', 'backend.evaluation.head_to_head', 'backend.evaluation.form',
+    'backend.evaluation.visualization', 'backend.evaluation.orchestrator',
+]
+
+
+def code_version(module_names: list[str]) -> str:
+    """Hash of CACHE_VERSION and the source files of the given modules."""
+    digest = hashlib.sha256(str(CACHE_VERSION).encode())
+    for name in module_names:
+        source = Path(getattr(importlib.import_module(name), '__file__', None) or '')
+        if source.suffix == '.py' and source.is_file():
+            digest.update(source.read_bytes())
+        else:
+            digest.update(name.encode())
+    return digest.hexdigest()[:16]
+
+
+def data_fingerprint(manifest: dict, registry: dict) -> str:
+    """
+    Fingerprint of everything the aggregates depend on.
+
+    Args:
+        manifest: Folder manifest, see archive_manifest.get_manifest
+        registry: Player registry as it will be stored after the evaluation
+    """
+    payload = json.dumps({
+        'files': {name: record['fingerprint'] for name, record in manifest['files'].items()},
+        'registry': registry,
+        'code': code_version(DATA_MODULES),
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def dashboard_fingerprint(data_key: str) -> str:
+    """Fingerprint of the dashboard: the data fingerprint plus the rendering code and plotly.js version."""
+    versions = f"{data_key}-{code_version(DASHBOARD_MODULES)}-{get_plotlyjs_version()}"
+    return hashlib.sha256(versions.encode()).hexdigest()
+
+
+def fingerprint_meta_tag(fingerprint: str) -> str:
+    """Meta tag carrying the dashboard fingerprint in the HTML head."""
+    return f'<meta name="{FINGERPRINT_META}" content="{fingerprint}">'
+
+
+def stored_dashboard_fingerprint(html_file: Path) -> str | None:
+    """Fingerprint in the head of an existing dashboard, None if there is none."""
+    try:
+        with open(html_file, encoding='utf-8') as f:
+            head = f.read(4096)
+    except OSError:
+        return None
+    match = re.search(rf'<meta name="{FINGERPRINT_META}" content="([0-9a-f]+)">', head)
+    return match.group(1) if match else None
+
+
+def _frame_arrays(name: str, df: pd.DataFrame) -> tuple[dict[str, np.ndarray], list[dict]]:
+    """
+    Split a DataFrame into plain arrays for np.savez.
+
+    Returns:
+        tuple: (arrays by key, column specs for the JSON header); object columns
+        (strings, None) go into the header as JSON lists instead of arrays
+    """
+    arrays = {}
+    columns = []
+    for i, (column, values) in enumerate(df.items()):
+        key = f"{name}__{i}"
+        if isinstance(values.dtype, pd.DatetimeTZDtype):
+            arrays[key] = values.dt.tz_convert('UTC').dt.tz_localize(None).to_numpy()
+            columns.append({'name': column, 'key': key, 'kind': 'utc'})
+        elif values.dtype == object:
+            columns.append({'name': column, 'kind': 'json', 'values': values.tolist()})
+        else:
+            # Plain dtype: pandas can attach dtype metadata, which np.savez warns about
+            array = values.to_numpy()
+            arrays[key] = array.view(np.dtype(array.dtype.str))
+            columns.append({'name': column, 'key': key, 'kind': 'array'})
+    return arrays, columns
+
+
+def _frame_from_arrays(data, columns: list[dict]) -> pd.DataFrame:
+    """Rebuild a DataFrame from _frame_arrays."""
+    frame = {}
+    for column in columns:
+        if column['kind'] == 'json':
+            frame[column['name']] = pd.Series(column['values'], dtype=object)
+        elif column['kind'] == 'utc':
+            frame[column['name']] = pd.Series(data[column['key']]).dt.tz_localize('UTC')
+        else:
+            frame[column['name']] = pd.Series(data[column['key']])
+    return pd.DataFrame(frame)
+
+
+def load_aggregates(folder_path: Path, data_key: str) -> dict | None:
+    """Cached aggregates of the folder if they were stored for data_key, otherwise None."""
+    cache_file = folder_path / CACHE_FILENAME
+    if not cache_file.exists():
+        return None
+    try:
+        # allow_pickle=False: a manipulated file can fail to load, but never runs code
+        with np.load(cache_file, allow_pickle=False) as data:
+            header = json.loads(str(data['header']))
+            if header.get('version') != CACHE_VERSION or header.get('key') != data_key:
+                return None
+            aggregates = dict(header['values'])
+            for name, columns in header['frames'].items():
+                aggregates[name] = _frame_from_arrays(data, columns)
+    except Exception as e:
+        logger.warning(f"Could not read dashboard cache {cache_file}. Error: {e}")
+        return None
+    return aggregates
+
+
+def save_aggregates(folder_path: Path, data_key: str, aggregates: dict) -> None:
+    """Store the aggregates of the folder for data_key, replacing older ones."""
+    cache_file = folder_path / CACHE_FILENAME
+    arrays = {}
+    header = {'version': CACHE_VERSION, 'key': data_key, 'frames': {}, 'values': {}}
+    for name, value in aggregates.items():
+        if isinstance(value, pd.DataFrame):
+            frame_arrays, header['frames'][name] = _frame_arrays(name, value)
+            arrays.update(frame_arrays)
+        else:
+            header['values'][name] = value
+    temp_file = cache_file.with_suffix('.tmp')
+    try:
+        arrays['header'] = np.array(json.dumps(header, ensure_ascii=False))
+        # Write next to the target and swap, so readers never see a partial cache
+        with open(temp_file, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(temp_file, cache_file)
+        (folder_path / LEGACY_CACHE_FILENAME).unlink(missing_ok=True)
+    except (OSError, TypeError, ValueError) as e:
+        temp_file.unlink(missing_ok=True)
+        logger.warning(f"Could not write dashboard cache {cache_file}. Error: {e}")
@@ -0,0 +1,61 @@
+"""
+Shape-preserving downsampling of long timelines.
+
+Largest-Triangle-Three-Buckets (LTTB, Steinarsson 2013) keeps the first and
+last point and one point per bucket in between: the point spanning the
+largest triangle with the point kept in the previous bucket and the average
+of the next bucket. Peaks and drops therefore survive, and the kept points
+are original data points, so their hover values stay exact.
+"""
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select the indices of the points to keep with LTTB.
+
+    Args:
+        x: Ascending x values
+        y: y values, same length as x
+        n_out: Point budget, at least 3
+
+    Returns:
+        np.ndarray: Ascending indices into x and y, all indices if len(x) <= n_out
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Inner points are split into n_out - 2 buckets of (almost) equal size
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    # Average of the following bucket for every bucket (the last point for the last one),
+    # all at once from prefix sums
+    next_edges = np.append(edges[1:], n)
+    sum_x = np.concatenate(([0.0], np.cumsum(x)))
+    sum_y = np.concatenate(([0.0], np.cumsum(y)))
+    sizes = next_edges[1:] - next_edges[:-1]
+    averages_x = (sum_x[next_edges[1:]] - sum_x[next_edges[:-1]]) / sizes
+    averages_y = (sum_y[next_edges[1:]] - sum_y[next_edges[:-1]]) / sizes
+
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        average_x = averages_x[bucket]
+        average_y = averages_y[bucket]
+
+        # Twice the triangle area, the constant factor does not change the argmax
+        areas = np.abs(
+            (x[previous] - average_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (average_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+
+    return selected
@@ -1,72 +1,427 @@
+import time
+from collections import Counter
 import pandas as pd
 from pathlib import Path
+from typing import Callable, Iterator, TypeVar
 from backend.helper_functions import setup_logger
+from backend.manifest_records import build_record, invalid_record, is_pending
 
-from backend.evaluation.transformations import prepare_round_data
+from backend.evaluation.transformations import prepare_round_data, prepare_rounds_batch, parse_timestamps, round_id
+from backend.evaluation.xlsx_reader import read_game_workbook, empty_metadata_sheet, UnsupportedWorkbookError
 
 logger = setup_logger(__name__)
 
+# Upper bound for the DataFrames buffered before a chunk is concatenated and yielded,
+# per chunk: it does not bound a whole folder combined by get_dataframes_from_folder
+DEFAULT_MEMORY_BUDGET_MB = 256
+
+T = TypeVar('T')
+
+
+def read_raw_sheets(
+        file_path: Path,
+        file_stats: dict | None = None
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Read the three raw sheets of a game workbook, falling back to pandas for
+    workbooks the fast reader does not support.
+
+    Args:
+        file_path: Path to the Excel file
+        file_stats: Optional dict that receives the 'reader' used and the
+            'open' and 'parse' durations in seconds
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: (df_metadata, df_games, df_standings),
+        df_metadata is empty for old workbooks without Spielinfo sheet
+    """
+    file_stats = {} if file_stats is None else file_stats
+    try:
+        sheets = read_game_workbook(file_path, timings=file_stats)
+        file_stats['reader'] = 'fast'
+        return sheets
+    except UnsupportedWorkbookError as e:
+        logger.debug(f"Fast reader not applicable to {file_path.stem}, using pandas. Reason: {e}")
+
+    file_stats['reader'] = 'pandas'
+    start = time.perf_counter()
+    with pd.ExcelFile(file_path, engine='openpyxl') as excel_file:
+        file_stats['open'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        # Old files without a Spielinfo sheet only contain Runden and Endstand
+        if len(excel_file.sheet_names) == 2:
+            sheets = (empty_metadata_sheet(), *(excel_file.parse(sheet_name=i) for i in range(2)))
+        else:
+            sheets = tuple(excel_file.parse(sheet_name=i) for i in range(3))
+        file_stats['parse'] = time.perf_counter() - start
+    return sheets
+
+
+def read_file_with_stats(
+        file_path: Path
+) -> tuple[tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame] | None, dict]:
+    """
+    Read the raw sheets of a single Excel file and record per-stage statistics.
+
+    Returns:
+        tuple[tuple | None, dict]: (sheets, file_stats) where sheets is
+        (df_metadata, df_games, df_standings) or None if reading fails and
+        file_stats is initialized as described in load_file_with_stats
+    """
+    filename = file_path.stem
+    logger.debug(f"Loading data from file: {filename}")
+    file_stats = {
+        'file': file_path.name,
+        'status': 'failed',
+        'bytes': file_path.stat().st_size,
+        'reader': None,
+        'open': None,
+        'parse': None,
+        'transform': None,
+        'rows': None,
+        'memory_bytes': None,
+        'error': None,
+        'error_message': None,
+    }
+
+    try:
+        return read_raw_sheets(file_path, file_stats), file_stats
+    except Exception as e:
+        _record_failure(file_stats, e, 'loading')
+        return None, file_stats
+
+
+def load_file_with_stats(
+        file_path: Path
+) -> tuple[tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame] | None, dict]:
+    """
+    Load and transform a single Excel file and record per-stage statistics.
+
+    Returns:
+        tuple[tuple | None, dict]: (frames, file_stats) where frames is
+        (df_rounds, df_games_meta, df_points) or None if loading fails, and
+        file_stats holds the 'reader' used ('fast' or 'pandas' as fallback),
+        timings in seconds for 'open', 'parse' and 'transform',
+        'bytes' read, 'rows' per granularity, 'memory_bytes' of the transformed
+        DataFrames and the 'error' class name and message of a failure. Files
+        transformed in a batch (see iter_dataframes_from_folder) get their
+        share of the chunk's 'transform' time and 'memory_bytes' by row count
+    """
+    sheets, file_stats = read_file_with_stats(file_path)
+    if sheets is None:
+        return None, file_stats
+    return _transform_file(file_path.stem, sheets, file_stats), file_stats
+
+
+def _transform_file(
+        round_name: str,
+        sheets: tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame],
+        file_stats: dict
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame] | None:
+    """Transform the raw sheets of one file named round_name, see load_file_with_stats."""
+    start = time.perf_counter()
+    try:
+        frames = prepare_round_data(round_name, *sheets)
+    except Exception as e:
+        _record_failure(file_stats, e, 'transforming')
+        return None
+    file_stats['transform'] = time.perf_counter() - start
+
+    file_stats['rows'] = {
+        'rounds': len(frames[0]),
+        'games': len(frames[1]),
+        'points': len(frames[2])
+    }
+    file_stats['memory_bytes'] = _frames_memory_bytes(frames)
+    if frames[0].empty:
+        file_stats['error_message'] = "No round metadata"
+    else:
+        file_stats['status'] = 'loaded'
+
+    return frames
+
+
+def _record_failure(file_stats: dict, e: Exception, stage: str) -> None:
+    logger.warning(f"Error {stage} {Path(file_stats['file']).stem} - skipping file. Error: {e}")
+    file_stats['status'] = 'failed'
+    file_stats['error'] = type(e).__name__
+    file_stats['error_message'] = str(e)
+
+
 def get_dataframes_from_file(file_path: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame] | None:
     """
     Load and transform data from a single Excel file.
-    
+
     Returns:
         tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: (df_rounds, df_games_meta, df_points)
         or None if loading fails
     """
-    filename = file_path.stem
-    logger.debug(f"Loading data from file: {filename}")
+    frames, _ = load_file_with_stats(file_path)
+    return frames
+
+
+def _frames_memory_bytes(frames: tuple[pd.DataFrame, ...]) -> int:
+    """Deep memory usage of a tuple of DataFrames in bytes."""
+    return sum(int(df.memory_usage(deep=True).sum()) for df in frames)
+
+
+def _empty_loading_info() -> dict:
+    return {'loaded': [], 'failed': [], 'files': [], 'chunks': []}
+
+
+def _concat_chunk(
+        chunk: list[tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Concatenate buffered per-file frames, one pd.concat per granularity."""
+    return tuple(
+        pd.concat([frames[i] for frames in chunk], ignore_index=True)
+        for i in range(3)
+    )
+
+
+def _round_names(files: list[Path]) -> dict[str, str]:
+    """
+    Name of every file for its dateiname and runden_id: the stem, or the full
+    file name if several workbooks share the stem (e.g. a.xlsx and a.xlsm),
+    which would otherwise merge into one round.
+    """
+    stems = Counter(file.stem for file in files)
+    return {file.name: file.name if stems[file.stem] > 1 else file.stem for file in files}
+
+
+def _transform_batch(
+        chunk: list[tuple[str, tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame], dict]],
+        chunk_info: dict
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Transform the buffered raw sheets of a chunk in one vectorized pass.
+
+    If the batch fails, the files are transformed one by one so that only the
+    offending files are moved from 'loaded' to 'failed' and every file gets
+    its own statistics. Otherwise every file gets its 'rows' and its share of
+    the chunk's transform time and memory by row count. The transform duration
+    of the whole chunk is appended to chunk_info['chunks'].
+    """
+    start = time.perf_counter()
     try:
-        df_metadata = pd.read_excel(file_path, sheet_name=0, engine='openpyxl')
-        df_games = pd.read_excel(file_path, sheet_name=1, engine='openpyxl')
-        df_standings = pd.read_excel(file_path, sheet_name=2, engine='openpyxl')
+        frames = prepare_rounds_batch([
+            (round_name, *sheets) for round_name, sheets, file_stats in chunk
+        ])
     except Exception as e:
-        logger.warning(f"Error loading {filename} - skipping file. Error: {e}")
-        return None
-    
-    return prepare_round_data(filename, df_metadata, df_games, df_standings)
+        logger.warning(f"Batch transform failed - transforming files one by one. Error: {e}")
+        per_file = []
+        for round_name, sheets, file_stats in chunk:
+            file_frames = _transform_file(round_name, sheets, file_stats)
+            if file_frames is None:
+                chunk_info['loaded'].remove(file_stats['file'])
+                chunk_info['failed'].append(file_stats['file'])
+            else:
+                per_file.append(file_frames)
+        frames = _concat_chunk(per_file) if per_file else (pd.DataFrame(), pd.DataFrame(), pd.DataFrame())
+        chunk_info['chunks'].append({'files': len(chunk), 'transform': time.perf_counter() - start})
+        return frames
+    duration = time.perf_counter() - start
+    chunk_info['chunks'].append({'files': len(chunk), 'transform': duration})
+
+    if not frames[0].empty:
+        counts = [df['runden_id'].value_counts() for df in frames]
+        frame_bytes = [int(df.memory_usage(deep=True).sum()) for df in frames]
+        for round_name, _, file_stats in chunk:
+            if file_stats['status'] == 'loaded':
+                file_hash = round_id(round_name)
+                rows = [int(count.get(file_hash, 0)) for count in counts]
+                file_stats['rows'] = dict(zip(('rounds', 'games', 'points'), rows))
+                file_stats['transform'] = duration * rows[2] / max(len(frames[2]), 1)
+                file_stats['memory_bytes'] = int(sum(
+                    size * n / len(df) for size, n, df in zip(frame_bytes, rows, frames) if len(df)
+                ))
+    return frames
+
+
+def _finalize_chunk(
+        chunk: list,
+        chunk_info: dict,
+        batch: bool
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Turn a chunk into its three DataFrames and parse their timestamps in one
+    vectorized pass. A batch chunk holds (name, raw sheets, file_stats) per file and
+    is transformed here, otherwise the chunk holds per-file frames.
+    """
+    if batch:
+        df_rounds, df_games, df_points = _transform_batch(chunk, chunk_info)
+        if df_rounds.empty:
+            return df_rounds, df_games, df_points
+    else:
+        df_rounds, df_games, df_points = _concat_chunk(chunk)
+    df_rounds, df_games = parse_timestamps(df_rounds, df_games)
+    return df_rounds, df_games, df_points
 
 
-def get_dataframes_from_folder(folder_path: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, dict]:
+def iter_dataframes_from_folder(
+        folder_path: Path,
+        chunk_size: int | None = None,
+        memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+        batch: bool = True,
+        manifest_records: dict | None = None
+) -> Iterator[tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, dict]]:
+    """
+    Stream data from all Excel files in a folder in chunks of files.
+
+    Files are buffered until either `chunk_size` files are collected or the
+    buffered frames exceed `memory_budget_mb`; the buffer is then concatenated
+    once and yielded. Use chunk_size=1 to receive per-file frames. Timestamps
+    are parsed per chunk, see transformations.parse_timestamps.
+
+    With batch=True the raw sheets are buffered and each chunk is transformed
+    at once with prepare_rounds_batch, which avoids the per-file pandas
+    overhead of prepare_round_data; the result is identical. The transform
+    time is then measured per chunk and split across its files by row count,
+    and the memory budget counts the buffered raw sheets.
+
+    Rounds are named after the file stem, or after the full file name if
+    several workbooks share the stem.
+
+    Given the records of the folder manifest, the missing and pending records
+    (see archive_manifest.scan_manifest) are built from the sheets read here,
+    so changed files are not parsed a second time for the manifest.
+
+    Yields:
+        tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, dict]:
+        (df_rounds, df_games_meta, df_points, chunk_info)
+        where chunk_info contains {'loaded': [filenames], 'failed': [filenames],
+        'files': [file_stats], 'chunks': [{'files': int, 'transform': seconds}]}
+        for the files of this chunk (see load_file_with_stats; 'chunks' is only
+        filled in batch mode). Failed files are reported with the next
+        non-empty chunk, or in a final chunk of empty DataFrames.
+    """
+    budget_bytes = memory_budget_mb * 1024 * 1024
+    chunk = []
+    chunk_bytes = 0
+    chunk_info = _empty_loading_info()
+
+    files = list(folder_path.glob("*.xls*"))
+    round_names = _round_names(files)
+    for file in files:
+        sheets, file_stats = read_file_with_stats(file)
+        if manifest_records is not None and is_pending(manifest_records.get(file.name)):
+            manifest_records[file.name] = (
+                build_record(file, *sheets) if sheets is not None else invalid_record(file, file_stats['error'])
+            )
+        if batch:
+            if sheets is not None:
+                file_stats['status'] = 'loaded'
+                # The budget counts the buffered raw sheets, memory_bytes is set after the transform
+                frames_bytes = _frames_memory_bytes(sheets)
+            result = (round_names[file.name], sheets, file_stats)
+        else:
+            result = _transform_file(round_names[file.name], sheets, file_stats) if sheets is not None else None
+            frames_bytes = file_stats['memory_bytes']
+        chunk_info['files'].append(file_stats)
+        if file_stats['status'] != 'loaded':
+            chunk_info['failed'].append(file.name)
+            continue
+
+        # Flush before exceeding the budget, a single oversized file still forms its own chunk
+        if chunk and chunk_bytes + frames_bytes > budget_bytes:
+            yield *_finalize_chunk(chunk, chunk_info, batch), chunk_info
+            chunk, chunk_bytes = [], 0
+            chunk_info = _empty_loading_info()
+
+        chunk.append(result)
+        chunk_bytes += frames_bytes
+        chunk_info['loaded'].append(file.name)
+
+        if chunk_size is not None and len(chunk) >= chunk_size:
+            yield *_finalize_chunk(chunk, chunk_info, batch), chunk_info
+            chunk, chunk_bytes = [], 0
+            chunk_info = _empty_loading_info()
+
+    if chunk:
+        yield *_finalize_chunk(chunk, chunk_info, batch), chunk_info
+    elif chunk_info['failed']:
+        yield pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), chunk_info
+
+
+def fold_dataframes_from_folder(
+        folder_path: Path,
+        fold: Callable[[T, pd.DataFrame, pd.DataFrame, pd.DataFrame], T],
+        initial: T,
+        chunk_size: int | None = None,
+        memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+        batch: bool = True,
+        manifest_records: dict | None = None
+) -> tuple[T, dict]:
+    """
+    Fold all chunks of a folder into an aggregate without keeping the chunks.
+
+    Args:
+        fold: Called as fold(aggregate, df_rounds, df_games_meta, df_points) for
+            every non-empty chunk, returns the updated aggregate
+        initial: Starting value of the aggregate
+        manifest_records: Optional manifest records to fill, see iter_dataframes_from_folder
+
+    Returns:
+        tuple[T, dict]: (aggregate, loading_info)
+    """
+    aggregate = initial
+    loading_info = _empty_loading_info()
+
+    for df_rounds, df_games, df_points, chunk_info in iter_dataframes_from_folder(
+            folder_path, chunk_size=chunk_size, memory_budget_mb=memory_budget_mb, batch=batch,
+            manifest_records=manifest_records):
+        if not df_rounds.empty:
+            aggregate = fold(aggregate, df_rounds, df_games, df_points)
+        for key in loading_info:
+            loading_info[key].extend(chunk_info[key])
+
+    return aggregate, loading_info
+
+
+def _collect_chunks(
+        chunks: list[tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]],
+        df_rounds: pd.DataFrame,
+        df_games: pd.DataFrame,
+        df_points: pd.DataFrame
+) -> list[tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]:
+    chunks.append((df_rounds, df_games, df_points))
+    return chunks
+
+
+def get_dataframes_from_folder(
+        folder_path: Path,
+        memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+        batch: bool = True,
+        manifest_records: dict | None = None
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, dict]:
     """
     Load and combine data from all Excel files in a folder.
-    
+
+    memory_budget_mb only bounds the buffer of each chunk (see
+    iter_dataframes_from_folder); all chunks are concatenated, so the result
+    holds the whole folder. Use fold_dataframes_from_folder to aggregate a
+    folder without keeping it in memory.
+
     Returns:
-        tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, dict]: 
+        tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, dict]:
         (df_rounds, df_games_meta, df_points, loading_info)
         Three DataFrames with different granularities according to data structure,
-        and a dict with loading statistics: {'loaded': [filenames], 'failed': [filenames]}
-    """
-    all_rounds = []
-    all_games = []
-    all_points = []
-    loaded_files = []
-    failed_files = []
-    
-    for file in folder_path.glob("*.xls*"):
-        result = get_dataframes_from_file(file)
-        if result is not None:
-            df_rounds, df_games_meta, df_points = result
-            if not df_rounds.empty:
-                all_rounds.append(df_rounds)
-                all_games.append(df_games_meta)
-                all_points.append(df_points)
-                loaded_files.append(file.name)
-            else:
-                failed_files.append(file.name)
-        else:
-            failed_files.append(file.name)
-
-    logger.info(f"Loaded {len(all_rounds)} rounds from folder {folder_path}")
-    
-    df_rounds = pd.concat(all_rounds, ignore_index=True) if all_rounds else pd.DataFrame()
-    df_games = pd.concat(all_games, ignore_index=True) if all_games else pd.DataFrame()
-    df_points = pd.concat(all_points, ignore_index=True) if all_points else pd.DataFrame()
-    
-    loading_info = {
-        'loaded': loaded_files,
-        'failed': failed_files
-    }
-    
-    return df_rounds, df_games, df_points, loading_info
+        and a dict with loading statistics:
+        {'loaded': [filenames], 'failed': [filenames], 'files': [file_stats],
+        'chunks': [chunk stats]}, see iter_dataframes_from_folder
+    """
+    chunks, loading_info = fold_dataframes_from_folder(
+        folder_path, _collect_chunks, [], memory_budget_mb=memory_budget_mb, batch=batch,
+        manifest_records=manifest_records
+    )
 
+    logger.info(f"Loaded {len(loading_info['loaded'])} files from folder {folder_path}")
+
+    if not chunks:
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), loading_info
+    if len(chunks) == 1:
+        return *chunks[0], loading_info
+
+    df_rounds, df_games, df_points = _concat_chunk(chunks)
+    return df_rounds, df_games, df_points, loading_info
@@ -0,0 +1,115 @@
+"""
+Player-game fact table shared by all dashboard charts.
+
+The three loaded tables are joined once into one row per
+(runden_id, spiel_index, spieler) carrying all game, round and ordering
+attributes, so the charts only select and aggregate instead of repeating
+the same merges. Players are identified by their integer ID from the player
+registry; display names are only looked up when rendering.
+"""
+import numpy as np
+import pandas as pd
+from backend.evaluation.transformations import WIND_KEYS
+from backend.evaluation.validation import coerce_numeric_columns
+from backend.player_registry import player_ids
+
+FACT_COLUMNS = [
+    'game_index', 'round_index', 'runden_id', 'spiel_index', 'dateiname',
+    'rundenstart', 'spielstart', 'spieldauer', 'wind_des_spiels', 'gewinner_wind',
+    'spieler_id', 'spieler_wind', 'punkte_brutto', 'verdopplungen',
+    'punkte_netto', 'punkte_delta', 'punktestand', 'rang',
+    'is_spielfuehrer', 'is_final_game', 'siegerpunkte',
+    'cumulative_points', 'cumulative_siegerpunkte'
+]
+
+
+def build_fact_table(
+        df_rounds: pd.DataFrame,
+        df_games: pd.DataFrame,
+        df_points: pd.DataFrame,
+        registry: dict) -> pd.DataFrame:
+    """
+    Join points, games and rounds into one row per player and game.
+
+    Player names are replaced by their spieler_id from the registry, unknown
+    players are added to the registry. Rows without a player name are left
+    out; validation.find_inconsistent_games reports them. Blank or non-numeric
+    point cells are NaN (the point columns are float64 then), the aggregates
+    skip them and cumulative_points counts a missing punkte_delta as 0.
+
+    Rounds are ordered by rundenstart (rounds without timing from old files
+    first, otherwise in load order) and games by spiel_index within their
+    round. The table is sorted by this chronological order and the players of
+    a game keep their order from df_points.
+
+    Added columns:
+    - round_index / game_index: Continuous 1-based round and game number over all rounds
+    - spieler_id: Player ID from the registry instead of the typed name
+    - is_spielfuehrer: Player was wind_des_spiels of the game
+    - is_final_game: Last game of the round, carries the final rang
+    - siegerpunkte: Siegerpunkte of the round on the final game, 0 otherwise
+    - cumulative_points / cumulative_siegerpunkte: Running sums per player
+
+    Returns:
+        pd.DataFrame: Fact table with FACT_COLUMNS and a RangeIndex in chronological order
+    """
+    if df_points.empty:
+        return pd.DataFrame(columns=FACT_COLUMNS)
+
+    # Rounds without timing (old format) come first
+    df_round_order = df_rounds[['runden_id', 'dateiname', 'rundenstart']].sort_values(
+        'rundenstart', na_position='first', kind='stable'
+    )
+    df_round_order['round_index'] = np.arange(1, len(df_round_order) + 1)
+
+    df_game_attributes = df_games[
+        ['runden_id', 'spiel_index', 'spielstart', 'spieldauer', 'wind_des_spiels', 'gewinner_wind']
+    ].drop_duplicates(['runden_id', 'spiel_index'])
+
+    df_points = coerce_numeric_columns(df_points)
+    spieler_ids = player_ids(registry, df_points['spieler'])
+    df_facts = (
+        df_points
+        .assign(spieler_id=spieler_ids)
+        [spieler_ids >= 0]
+        .merge(df_round_order, on='runden_id', how='left', validate='many_to_one')
+        .merge(df_game_attributes, on=['runden_id', 'spiel_index'], how='left', validate='many_to_one')
+        .sort_values(['round_index', 'spiel_index'], kind='stable')
+        .reset_index(drop=True)
+    )
+
+    df_facts['game_index'] = df_facts.groupby(
+        ['round_index', 'spiel_index'], sort=False, dropna=False
+    ).ngroup() + 1
+    df_facts['is_spielfuehrer'] = df_facts['spieler_wind'] == df_facts['wind_des_spiels']
+    df_facts['is_final_game'] = (
+        df_facts['spiel_index'] == df_facts.groupby('runden_id')['spiel_index'].transform('max')
+    )
+
+    # Siegerpunkte are booked once per round, on the final game
+    round_siegerpunkte = _round_siegerpunkte(df_rounds, registry)
+    df_facts['siegerpunkte'] = np.where(
+        df_facts['is_final_game'],
+        pd.MultiIndex.from_frame(df_facts[['runden_id', 'spieler_id']]).map(round_siegerpunkte).fillna(0),
+        0
+    ).astype('int64')
+
+    by_player = df_facts.groupby('spieler_id', sort=False)
+    df_facts['cumulative_points'] = (
+        df_facts['punkte_delta'].fillna(0).groupby(df_facts['spieler_id'], sort=False).cumsum().astype('int64')
+    )
+    df_facts['cumulative_siegerpunkte'] = by_player['siegerpunkte'].cumsum()
+
+    return df_facts[FACT_COLUMNS]
+
+
+def _round_siegerpunkte(df_rounds: pd.DataFrame, registry: dict) -> pd.Series:
+    """Unpivot the spieler_<wind>/siegerpunkte_<wind> columns, indexed by (runden_id, spieler_id)."""
+    winds = WIND_KEYS.values()
+    names = np.concatenate([df_rounds[f'spieler_{wind}'].to_numpy() for wind in winds])
+    df_long = pd.DataFrame({
+        'runden_id': np.tile(df_rounds['runden_id'].to_numpy(), len(winds)),
+        'spieler_id': player_ids(registry, names),
+        'siegerpunkte': np.concatenate([df_rounds[f'siegerpunkte_{wind}'].to_numpy() for wind in winds]),
+    })
+    return df_long.groupby(['runden_id', 'spieler_id'])['siegerpunkte'].sum()
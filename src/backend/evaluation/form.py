@@ -0,0 +1,133 @@
+"""
+Current form of the players: rolling averages, streaks and hot and cold runs.
+
+A game counts as won if the player gained points (punkte_delta > 0) and as
+lost if the player paid (punkte_delta < 0); games with punkte_delta 0 end
+both streaks, games with a missing punkte_delta are skipped. The fact table is sorted by player once, after which every
+statistic is a whole-table numpy operation:
+
+- rolling sums are differences of one cumulative sum, restarted per player
+- streaks are run-length encoded over the sign of punkte_delta, a new run
+  starting wherever the sign or the player changes
+- the records per player are picked from one lexsort of all runs or windows
+"""
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+
+FORM_WINDOW = 10  # Games per rolling window
+
+
+@dataclass
+class FormAnalytics:
+    """Form of all players, ordered by display name; game numbers are game_index values."""
+    player_ids: np.ndarray
+    labels: list[str]
+    game_index: list[np.ndarray]         # per player and game, chronological
+    rolling_delta: list[np.ndarray]      # mean punkte_delta of the last FORM_WINDOW games, fewer at the start
+    current_form: np.ndarray             # rolling_delta after the last game
+    current_streak: np.ndarray           # games in the current streak, > 0 won, < 0 lost
+    win_streak: np.ndarray               # (players, 3) longest winning streak: games, first and last game
+    loss_streak: np.ndarray              # (players, 3) longest losing streak: games, first and last game
+    hot_run: np.ndarray                  # (players, 3) best FORM_WINDOW games: points, first and last game
+    cold_run: np.ndarray                 # (players, 3) worst FORM_WINDOW games: points, first and last game
+
+
+def _first_per_group(groups: np.ndarray, keys: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Index of the row with the highest key per group, the earliest on ties.
+
+    Returns:
+        np.ndarray: Row index per group, -1 for groups without rows
+    """
+    order = np.lexsort((-keys, groups))
+    present, first = np.unique(groups[order], return_index=True)
+    best = np.full(n_groups, -1, dtype=np.int64)
+    best[present] = order[first]
+    return best
+
+
+def _records(best: np.ndarray, values: np.ndarray, first_game: np.ndarray, last_game: np.ndarray) -> np.ndarray:
+    """(groups, 3) value, first and last game of the picked rows, zeros for groups without rows."""
+    records = np.zeros((len(best), 3), dtype=np.int64)
+    found = best >= 0
+    records[found] = np.column_stack([values[best[found]], first_game[best[found]], last_game[best[found]]])
+    return records
+
+
+def compute_form(df_facts: pd.DataFrame, player_names: dict[int, str], window: int = FORM_WINDOW) -> FormAnalytics:
+    """
+    Compute the form analytics of all players from the fact table.
+
+    Args:
+        df_facts: Player-game fact table, see fact_table.build_fact_table
+        player_names: Display name per spieler_id
+        window: Games per rolling window
+
+    Returns:
+        FormAnalytics
+    """
+    # A missing punkte_delta would be cast to INT64_MIN
+    df_facts = df_facts[df_facts['punkte_delta'].notna()]
+    codes, ids = pd.factorize(df_facts['spieler_id'])
+    n_players = len(ids)
+
+    # Sort by player once, games stay chronological within each player
+    order = np.argsort(codes, kind='stable')
+    player = codes[order]
+    game = df_facts['game_index'].to_numpy(dtype=np.int64)[order]
+    delta = df_facts['punkte_delta'].to_numpy(dtype=np.int64)[order]
+    games = np.bincount(player, minlength=n_players)
+    starts = np.concatenate(([0], np.cumsum(games)[:-1]))
+    position = np.arange(len(player)) - starts[player]  # game number of the player, from 0
+
+    # Rolling sums: one cumulative sum, the window start clipped to the player's first game
+    cumulative = np.concatenate(([0], np.cumsum(delta)))
+    window_start = np.maximum(np.arange(len(player)) - window + 1, starts[player])
+    rolling_sum = cumulative[1:] - cumulative[window_start]
+    rolling_delta = rolling_sum / np.minimum(position + 1, window)
+
+    # Hot and cold runs: complete windows only
+    full = np.flatnonzero(position >= window - 1)
+    hot = _first_per_group(player[full], rolling_sum[full], n_players)
+    cold = _first_per_group(player[full], -rolling_sum[full], n_players)
+    window_first = game[full - window + 1]
+    hot_run = _records(hot, rolling_sum[full], window_first, game[full])
+    cold_run = _records(cold, rolling_sum[full], window_first, game[full])
+
+    # Streaks: run-length encoding of the sign of punkte_delta per player
+    sign = np.sign(delta)
+    run_starts = np.flatnonzero((position == 0) | (sign != np.roll(sign, 1)))
+    run_lengths = np.diff(np.append(run_starts, len(player)))
+    run_player = player[run_starts]
+    run_sign = sign[run_starts]
+    run_first = game[run_starts]
+    run_last = game[run_starts + run_lengths - 1]
+
+    def longest_runs(runs: np.ndarray) -> np.ndarray:
+        best = _first_per_group(run_player[runs], run_lengths[runs], n_players)
+        return _records(best, run_lengths[runs], run_first[runs], run_last[runs])
+
+    win_streak = longest_runs(run_sign > 0)
+    loss_streak = longest_runs(run_sign < 0)
+
+    # Current streak: the last run of every player
+    last_run = np.searchsorted(run_starts, starts + games - 1, side='right') - 1
+    current_streak = np.where(games > 0, run_sign[last_run] * run_lengths[last_run], 0)
+
+    bounds = np.cumsum(games)[:-1]
+    game_series = np.split(game, bounds)
+    rolling_series = np.split(rolling_delta, bounds)
+    by_name = sorted(range(n_players), key=lambda i: player_names[ids[i]])
+    return FormAnalytics(
+        player_ids=np.asarray(ids)[by_name],
+        labels=[player_names[ids[i]] for i in by_name],
+        game_index=[game_series[i] for i in by_name],
+        rolling_delta=[rolling_series[i] for i in by_name],
+        current_form=np.array([rolling_series[i][-1] for i in by_name], dtype=np.float64),
+        current_streak=current_streak[by_name],
+        win_streak=win_streak[by_name],
+        loss_streak=loss_streak[by_name],
+        hot_run=hot_run[by_name],
+        cold_run=cold_run[by_name],
+    )
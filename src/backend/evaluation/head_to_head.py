@@ -0,0 +1,118 @@
+"""
+Head-to-head payments between players, reconstructed from the stored games.
+
+The files only store each player's punkte_delta, not who paid whom. The
+pairwise payments follow from punkte_netto and the winds with the rules of
+Round.calculate_point_transfers: the winner receives his punkte_netto from
+every other player, the other players settle the difference of their
+punkte_netto among each other, and every payment involving the Spielführer
+(wind_des_spiels) counts double.
+
+All games are reconstructed at once as a (games, 4, 4) payment array and
+accumulated into the player x player matrices with one np.bincount each.
+"""
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+from backend.helper_functions import setup_logger
+
+logger = setup_logger(__name__)
+
+SEATS = 4  # Games with another number of players are skipped
+
+
+@dataclass
+class HeadToHead:
+    """
+    Pairwise results, players ordered by display name.
+
+    Entry [i, j] of every matrix refers to player i against player j.
+    """
+    player_ids: np.ndarray
+    labels: list[str]
+    points: np.ndarray                   # net points i received from j, points = -points.T
+    won: np.ndarray                      # points i received from j
+    lost: np.ndarray                     # points i paid to j
+    games: np.ndarray                    # games i and j played together, the diagonal holds games played
+    mismatched_games: int                # games whose reconstruction differs from the stored punkte_delta
+
+
+def game_payments(netto: np.ndarray, is_winner: np.ndarray, is_spielfuehrer: np.ndarray) -> np.ndarray:
+    """
+    Reconstruct the pairwise payments of many games at once.
+
+    Args:
+        netto: (games, SEATS) punkte_netto per seat
+        is_winner: (games, SEATS) seat wind is gewinner_wind
+        is_spielfuehrer: (games, SEATS) seat wind is wind_des_spiels
+
+    Returns:
+        np.ndarray: (games, SEATS, SEATS) points seat i receives from seat j, 0 on the diagonal
+    """
+    netto_i = netto[:, :, None]
+    netto_j = netto[:, None, :]
+    payments = np.where(
+        is_winner[:, :, None], netto_i,
+        np.where(is_winner[:, None, :], -netto_j, netto_i - netto_j)
+    )
+    # Payments involving the Spielführer count double
+    payments = payments * (1 + (is_spielfuehrer[:, :, None] | is_spielfuehrer[:, None, :]))
+    payments[:, np.arange(SEATS), np.arange(SEATS)] = 0
+    return payments
+
+
+def compute_head_to_head(df_facts: pd.DataFrame, player_names: dict[int, str]) -> HeadToHead:
+    """
+    Compute the head-to-head matrices over all games of the fact table.
+
+    Args:
+        df_facts: Player-game fact table, see fact_table.build_fact_table
+        player_names: Display name per spieler_id
+
+    Returns:
+        HeadToHead
+    """
+    # The rows of a game are contiguous, keep the games with SEATS players as (games, SEATS) arrays
+    seated = df_facts.groupby('game_index', sort=False)['game_index'].transform('size').to_numpy() == SEATS
+    # The payments need every punkte_netto of the game, missing cells would be cast to INT64_MIN
+    known = (
+        df_facts[['punkte_netto', 'punkte_delta']].notna().all(axis=1)
+        .groupby(df_facts['game_index'], sort=False).transform('all').to_numpy()
+    )
+    for mask, reason in ((~seated, f"without {SEATS} players"), (seated & ~known, "with missing points")):
+        skipped = df_facts.loc[mask, 'game_index'].nunique()
+        if skipped:
+            logger.warning(f"{skipped} games {reason} are left out of the head-to-head")
+    df_seated = df_facts[seated & known]
+
+    def seat_array(values) -> np.ndarray:
+        return np.asarray(values).reshape(-1, SEATS)
+
+    codes, ids = pd.factorize(df_seated['spieler_id'], sort=True)
+    n_players = len(ids)
+    payments = game_payments(
+        seat_array(df_seated['punkte_netto'].to_numpy(dtype=np.int64)),
+        seat_array((df_seated['spieler_wind'] == df_seated['gewinner_wind']).to_numpy()),
+        seat_array((df_seated['spieler_wind'] == df_seated['wind_des_spiels']).to_numpy()),
+    )
+    mismatched = payments.sum(axis=2) != seat_array(df_seated['punkte_delta'].to_numpy(dtype=np.int64))
+
+    # Flat index i * players + j of every seat pair, one bincount per matrix
+    seat_codes = seat_array(codes)
+    pairs = (seat_codes[:, :, None] * n_players + seat_codes[:, None, :]).ravel()
+    flat_payments = payments.ravel()
+
+    def pair_sums(weights: np.ndarray | None = None) -> np.ndarray:
+        return np.bincount(pairs, weights=weights, minlength=n_players * n_players).reshape(n_players, n_players)
+
+    name_order = np.array(sorted(range(n_players), key=lambda i: player_names[ids[i]]), dtype=np.int64)
+    reorder = np.ix_(name_order, name_order)
+    return HeadToHead(
+        player_ids=np.asarray(ids)[name_order],
+        labels=[player_names[ids[i]] for i in name_order],
+        points=pair_sums(flat_payments)[reorder].astype(np.int64),
+        won=pair_sums(np.maximum(flat_payments, 0))[reorder].astype(np.int64),
+        lost=pair_sums(np.maximum(-flat_payments, 0))[reorder].astype(np.int64),
+        games=pair_sums()[reorder],
+        mismatched_games=int(mismatched.any(axis=1).sum()),
+    )
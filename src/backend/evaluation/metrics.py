@@ -0,0 +1,324 @@
+"""
+Aggregates of the dashboard overview and player pages, computed in one grouped pass each.
+
+The fact table is grouped by player once: every per-player total is a
+np.bincount over the player codes and every per-player series is a slice of
+the table sorted by player. The figure builders only receive plain arrays.
+
+Point cells missing in the fact table (NaN, see validation.find_inconsistent_games)
+are skipped like in pandas: sums leave them out and averages divide by the
+number of known values.
+"""
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+from backend.evaluation.bootstrap import bootstrap_mean_intervals
+
+# Fixed wind order (matching Wind enum in game.py)
+WIND_ORDER = ['Osten', 'Süden', 'Westen', 'Norden']
+
+
+@dataclass
+class PlayerSeries:
+    """Chronological values of one player."""
+    game_index: np.ndarray               # per game
+    cumulative_points: np.ndarray
+    punkte_netto: np.ndarray
+    punkte_delta: np.ndarray
+    round_index: np.ndarray              # per round, at its final game
+    rank: np.ndarray                     # rank by cumulative siegerpunkte after the round
+    cumulative_siegerpunkte: np.ndarray
+    netto_as_wind: np.ndarray            # per round in which the player was Spielführer
+    delta_as_wind: np.ndarray
+
+
+@dataclass
+class OverviewMetrics:
+    """
+    All aggregates of the overview page.
+
+    Per-player arrays are aligned with player_ids, which are ordered by
+    siegerpunkte (descending, ties by name). Legends and timelines list the
+    players by name, in name_order.
+    """
+    player_ids: np.ndarray
+    player_labels: list[str]
+    name_order: np.ndarray               # positions of the players sorted by label
+    siegerpunkte: np.ndarray
+    total_points: np.ndarray
+    avg_netto: np.ndarray
+    avg_delta: np.ndarray
+    games_as_wind: np.ndarray
+    avg_netto_as_wind: np.ndarray        # NaN for players who never were Spielführer
+    avg_delta_as_wind: np.ndarray
+    ci_netto: np.ndarray                 # (players, 2) bootstrap confidence interval of avg_netto
+    ci_delta: np.ndarray
+    ci_netto_as_wind: np.ndarray         # NaN for players with fewer than 2 games as Spielführer
+    ci_delta_as_wind: np.ndarray
+    series: dict[int, PlayerSeries]      # by spieler_id
+    wind_wins: np.ndarray                # round wins per wind in WIND_ORDER
+    total_rounds: int
+    max_rounds: int
+    max_games: int
+
+
+@dataclass
+class PlayerDetail:
+    """Aggregates of one player page."""
+    player_id: int
+    label: str
+    games: int
+    rounds: int
+    siegerpunkte: int
+    total_points: int
+    game_index: np.ndarray               # per game, chronological
+    cumulative_points: np.ndarray
+    punkte_brutto: np.ndarray            # hand value before doubling
+    verdopplungen: np.ndarray
+    placements: np.ndarray               # rounds finished on rank 1-4
+    games_per_wind: np.ndarray           # per own wind in WIND_ORDER
+    wins_per_wind: np.ndarray            # games won (gewinner_wind is the own wind)
+    avg_netto_per_wind: np.ndarray       # NaN for winds the player never had
+    games_as_wind: np.ndarray            # [as Spielführer, as other player]
+    wins_as_wind: np.ndarray
+    avg_netto_as_wind: np.ndarray
+    best_games: pd.DataFrame             # top games by punkte_delta, see GAME_TABLE_COLUMNS
+    worst_games: pd.DataFrame
+
+
+# Columns of the best / worst games tables
+GAME_TABLE_COLUMNS = ['game_index', 'dateiname', 'spiel_index', 'spielstart', 'punkte_netto', 'punkte_delta']
+
+
+def _split(values: np.ndarray, order: np.ndarray, counts: np.ndarray) -> list[np.ndarray]:
+    """Split values into one array per player code, keeping their order within each player."""
+    return np.split(values[order], np.cumsum(counts)[:-1])
+
+
+def _known_sum(codes: np.ndarray, values: np.ndarray, n_groups: int) -> tuple[np.ndarray, np.ndarray]:
+    """Sum and count of the known (non-NaN) values per code."""
+    known = ~np.isnan(values)
+    return (
+        np.bincount(codes[known], weights=values[known], minlength=n_groups),
+        np.bincount(codes[known], minlength=n_groups),
+    )
+
+
+def compute_overview_metrics(
+        df_facts: pd.DataFrame,
+        player_names: dict[int, str],
+        workers: int = 1) -> OverviewMetrics:
+    """
+    Compute all overview aggregates from the fact table.
+
+    Args:
+        df_facts: Player-game fact table, see fact_table.build_fact_table
+        player_names: Display name per spieler_id
+        workers: Number of worker processes for the bootstrap intervals of large archives
+
+    Returns:
+        OverviewMetrics
+    """
+    codes, ids = pd.factorize(df_facts['spieler_id'])
+    n_players = len(ids)
+    labels = [player_names[player_id] for player_id in ids]
+
+    netto = df_facts['punkte_netto'].to_numpy(dtype=np.float64)
+    delta = df_facts['punkte_delta'].to_numpy(dtype=np.float64)
+    is_final = df_facts['is_final_game'].to_numpy(dtype=bool)
+    as_wind = df_facts['is_spielfuehrer'].to_numpy(dtype=bool)
+
+    # Per-player totals, one bincount each
+    games = np.bincount(codes, minlength=n_players)
+    siegerpunkte = np.bincount(codes, weights=df_facts['siegerpunkte'].to_numpy(), minlength=n_players)
+    netto_sum, netto_count = _known_sum(codes, netto, n_players)
+    total_points, delta_count = _known_sum(codes, delta, n_players)
+    netto_as_wind_sum, netto_as_wind_count = _known_sum(codes[as_wind], netto[as_wind], n_players)
+    delta_as_wind_sum, delta_as_wind_count = _known_sum(codes[as_wind], delta[as_wind], n_players)
+    games_as_wind = np.bincount(codes[as_wind], minlength=n_players)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_netto = netto_sum / netto_count
+        avg_delta = total_points / delta_count
+        avg_netto_as_wind = netto_as_wind_sum / netto_as_wind_count
+        avg_delta_as_wind = delta_as_wind_sum / delta_as_wind_count
+
+    # Per-player series: sort the table by player once and slice it
+    order = np.argsort(codes, kind='stable')
+    game_series = {
+        column: _split(df_facts[column].to_numpy(), order, games)
+        for column in ('game_index', 'cumulative_points', 'punkte_netto', 'punkte_delta')
+    }
+
+    # Bootstrap intervals of the averages over the same games, netto and delta resampled together;
+    # games with a missing netto or delta value are left out
+    known = ~(np.isnan(netto) | np.isnan(delta))
+    points = np.column_stack([netto, delta])[known]
+    known_codes = codes[known]
+    known_as_wind = as_wind[known]
+    intervals = bootstrap_mean_intervals(
+        _split(points, np.argsort(known_codes, kind='stable'), np.bincount(known_codes, minlength=n_players))
+        + _split(
+            points[known_as_wind],
+            np.argsort(known_codes[known_as_wind], kind='stable'),
+            np.bincount(known_codes[known_as_wind], minlength=n_players)
+        ),
+        workers=workers
+    ) if n_players else np.empty((0, 2, 2))
+
+    # Rank by cumulative siegerpunkte at the final game of every round (highest = rank 1)
+    df_final = df_facts.loc[is_final, ['round_index', 'cumulative_siegerpunkte']]
+    final_codes = codes[is_final]
+    final_order = np.argsort(final_codes, kind='stable')
+    final_counts = np.bincount(final_codes, minlength=n_players)
+    ranks = df_final.groupby('round_index')['cumulative_siegerpunkte'].rank(method='min', ascending=False)
+    final_series = {
+        'round_index': _split(df_final['round_index'].to_numpy(), final_order, final_counts),
+        'rank': _split(ranks.to_numpy(), final_order, final_counts),
+        'cumulative_siegerpunkte': _split(df_final['cumulative_siegerpunkte'].to_numpy(), final_order, final_counts),
+    }
+
+    # Points as Spielführer summed per round and player
+    round_codes = pd.factorize(df_facts['runden_id'])[0][as_wind]
+    round_player, round_player_codes = np.unique(round_codes * n_players + codes[as_wind], return_inverse=True)
+    wind_players = round_player % n_players
+    wind_order = np.argsort(wind_players, kind='stable')
+    wind_counts = np.bincount(wind_players, minlength=n_players)
+    wind_series = {
+        column: _split(
+            np.bincount(round_player_codes, weights=np.nan_to_num(values[as_wind])).astype(np.int64),
+            wind_order, wind_counts
+        )
+        for column, values in (('netto_as_wind', netto), ('delta_as_wind', delta))
+    }
+
+    series = {
+        player_id: PlayerSeries(
+            **{column: values[code] for column, values in game_series.items()},
+            **{column: values[code] for column, values in final_series.items()},
+            **{column: values[code] for column, values in wind_series.items()},
+        )
+        for code, player_id in enumerate(ids)
+    }
+
+    # Round winners (rank 1 at the final game) by wind position
+    winner_winds = df_facts['spieler_wind'].to_numpy()[is_final & (df_facts['rang'].to_numpy() == 1)]
+
+    # Ranking order: siegerpunkte descending, ties by name
+    ranking = np.array(sorted(range(n_players), key=lambda i: (-siegerpunkte[i], labels[i])), dtype=np.int64)
+
+    return OverviewMetrics(
+        player_ids=np.asarray(ids)[ranking],
+        player_labels=[labels[i] for i in ranking],
+        name_order=np.array(sorted(range(n_players), key=lambda i: labels[ranking[i]]), dtype=np.int64),
+        siegerpunkte=siegerpunkte[ranking].astype(np.int64),
+        total_points=total_points[ranking].astype(np.int64),
+        avg_netto=avg_netto[ranking],
+        avg_delta=avg_delta[ranking],
+        games_as_wind=games_as_wind[ranking],
+        avg_netto_as_wind=avg_netto_as_wind[ranking],
+        avg_delta_as_wind=avg_delta_as_wind[ranking],
+        ci_netto=intervals[:n_players, 0][ranking],
+        ci_delta=intervals[:n_players, 1][ranking],
+        ci_netto_as_wind=intervals[n_players:, 0][ranking],
+        ci_delta_as_wind=intervals[n_players:, 1][ranking],
+        series=series,
+        wind_wins=np.array([np.count_nonzero(winner_winds == wind) for wind in WIND_ORDER]),
+        total_rounds=df_facts['runden_id'].nunique(),
+        max_rounds=int(df_final['round_index'].max()) if not df_final.empty else 0,
+        max_games=int(df_facts['game_index'].max()) - 1 if not df_facts.empty else 0,
+    )
+
+
+def compute_player_details(
+        df_facts: pd.DataFrame,
+        player_names: dict[int, str],
+        top_games: int = 5) -> dict[int, PlayerDetail]:
+    """
+    Compute the aggregates of all player pages from the fact table.
+
+    Args:
+        df_facts: Player-game fact table, see fact_table.build_fact_table
+        player_names: Display name per spieler_id
+        top_games: Number of best and worst games per player
+
+    Returns:
+        dict[int, PlayerDetail]: By spieler_id, ordered by display name
+    """
+    codes, ids = pd.factorize(df_facts['spieler_id'])
+    n_players = len(ids)
+    n_winds = len(WIND_ORDER)
+
+    netto = df_facts['punkte_netto'].to_numpy(dtype=np.float64)
+    known_netto = ~np.isnan(netto)
+    is_final = df_facts['is_final_game'].to_numpy(dtype=bool)
+    as_wind = df_facts['is_spielfuehrer'].to_numpy(dtype=bool)
+    wind_codes = pd.Categorical(df_facts['spieler_wind'], categories=WIND_ORDER).codes.astype(np.int64)
+    won = (df_facts['spieler_wind'] == df_facts['gewinner_wind']).to_numpy(dtype=bool)
+
+    # Per-player totals, one bincount each
+    games = np.bincount(codes, minlength=n_players)
+    rounds = np.bincount(codes[is_final], minlength=n_players)
+    siegerpunkte = np.bincount(codes, weights=df_facts['siegerpunkte'].to_numpy(), minlength=n_players)
+    total_points = _known_sum(codes, df_facts['punkte_delta'].to_numpy(dtype=np.float64), n_players)[0]
+
+    # Per-player and category counts as one bincount over code * categories + category
+    def per_category(category: np.ndarray, n_categories: int, mask: np.ndarray, weights=None) -> np.ndarray:
+        return np.bincount(
+            codes[mask] * n_categories + category[mask],
+            weights=None if weights is None else weights[mask],
+            minlength=n_players * n_categories
+        ).reshape(n_players, n_categories)
+
+    has_wind = wind_codes >= 0
+    games_per_wind = per_category(wind_codes, n_winds, has_wind)
+    wins_per_wind = per_category(wind_codes, n_winds, has_wind & won)
+    other = (~as_wind).astype(np.int64)  # column 0: as Spielführer, 1: as other player
+    all_games = np.ones(len(codes), dtype=bool)
+    games_as_wind = per_category(other, 2, all_games)
+    wins_as_wind = per_category(other, 2, won)
+    ranks = df_facts['rang'].to_numpy(dtype=np.float64)
+    known_rank = ~np.isnan(ranks)
+    placements = per_category(np.clip(np.nan_to_num(ranks, nan=1), 1, 4).astype(np.int64) - 1, 4, is_final & known_rank)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_netto_per_wind = (
+            per_category(wind_codes, n_winds, has_wind & known_netto, netto)
+            / per_category(wind_codes, n_winds, has_wind & known_netto)
+        )
+        avg_netto_as_wind = (
+            per_category(other, 2, known_netto, netto) / per_category(other, 2, known_netto)
+        )
+
+    # Per-player series: sort the table by player once and slice it
+    order = np.argsort(codes, kind='stable')
+    game_series = {
+        column: _split(df_facts[column].to_numpy(), order, games)
+        for column in ('game_index', 'cumulative_points', 'punkte_brutto', 'verdopplungen')
+    }
+    df_sorted = df_facts[GAME_TABLE_COLUMNS].take(order)
+    boundaries = np.concatenate(([0], np.cumsum(games)))
+
+    details = {}
+    for code in sorted(range(n_players), key=lambda i: player_names[ids[i]]):
+        df_player = df_sorted.iloc[boundaries[code]:boundaries[code + 1]]
+        ranking = df_player.dropna(subset=['punkte_delta']).sort_values(
+            ['punkte_delta', 'game_index'], ascending=[False, True], kind='stable'
+        )
+        details[ids[code]] = PlayerDetail(
+            player_id=int(ids[code]),
+            label=player_names[ids[code]],
+            games=int(games[code]),
+            rounds=int(rounds[code]),
+            siegerpunkte=int(siegerpunkte[code]),
+            total_points=int(total_points[code]),
+            **{column: values[code] for column, values in game_series.items()},
+            placements=placements[code],
+            games_per_wind=games_per_wind[code],
+            wins_per_wind=wins_per_wind[code],
+            avg_netto_per_wind=avg_netto_per_wind[code],
+            games_as_wind=games_as_wind[code],
+            wins_as_wind=wins_as_wind[code],
+            avg_netto_as_wind=avg_netto_as_wind[code],
+            best_games=ranking.head(top_games).reset_index(drop=True),
+            worst_games=ranking.tail(top_games).iloc[::-1].reset_index(drop=True),
+        )
+    return details
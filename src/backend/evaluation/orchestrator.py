@@ -1,28 +1,230 @@
+import json
+import time
 from pathlib import Path
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import pandas as pd
+from backend.helper_functions import setup_logger
+from backend.archive_manifest import complete_manifest, scan_manifest, summarize_manifest
+from backend.manifest_records import is_pending, save_manifest
+from backend.evaluation.dashboard_cache import (
+    dashboard_fingerprint, data_fingerprint, load_aggregates, save_aggregates, stored_dashboard_fingerprint
+)
 from backend.evaluation.excel_loader import get_dataframes_from_folder
-from backend.evaluation.visualization import create_html_dashboard
+from backend.evaluation.fact_table import build_fact_table
+from backend.evaluation.plotly_asset import write_plotly_asset
+from backend.evaluation.rating import update_ratings
+from backend.player_registry import load_registry, save_registry, display_names
+from backend.evaluation.validation import find_inconsistent_games, summarize_inconsistencies
+from backend.evaluation.visualization import create_html_dashboard, dashboard_path
 
-def start_evaluation(folder_path: Path) -> tuple[Path, dict]:
+logger = setup_logger(__name__)
+
+# Display names of the stages in loading_info['stages'], in pipeline order
+STAGE_LABELS = {
+    'manifest': 'Manifest',
+    'cache': 'Cache',
+    'load': 'Laden',
+    'transform': 'Transformation',
+    'validate': 'Prüfung',
+    'facts': 'Faktentabelle',
+    'rating': 'Rating',
+    'figures': 'Diagramme',
+    'html': 'HTML',
+}
+
+
+def start_evaluation(
+        folder_path: Path,
+        workers: int = 1,
+        use_cache: bool = True,
+        output_path: Path | None = None) -> tuple[Path, dict]:
     """
     Start the evaluation process for the given folder.
-    
+
+    Unchanged folders are not evaluated again: if the dashboard fingerprint
+    (files, registry and code, see dashboard_cache.py) matches the existing
+    dashboard, that one is returned, and if only the rendering code changed,
+    the cached aggregates are rendered again without loading the files.
+
+    Args:
+        folder_path: Game folder with the Excel files
+        workers: Number of worker processes for building the dashboard charts
+        use_cache: False evaluates and renders everything again and computes the
+            rating from scratch, without reading or writing the stored rating state
+        output_path: Folder for the dashboard, its report and plotly.js, defaults
+            to folder_path; the player registry and caches stay in folder_path
+
     Returns:
         tuple[Path, dict]: (html_file_path, loading_info)
-        where loading_info contains {'loaded': [filenames], 'failed': [filenames]}
-    
+        where loading_info contains {'loaded': [filenames], 'failed': [filenames]},
+        the per-file statistics under 'files', the inconsistent games per file
+        under 'invalid' (see validation.summarize_inconsistencies), the folder
+        summary from the manifest under 'archive', the stage durations in
+        seconds under 'stages', the path of the JSON report under 'report'
+        and, if a cache was used, 'dashboard' or 'aggregates' under 'cached'
+
     Raises:
         ValueError: If no valid Excel files are found in the folder
     """
+    stages = {}
+
+    # The manifest answers whether there is anything to evaluate without loading; the records
+    # of changed files are filled in by the loader, which reads them anyway
+    start = time.perf_counter()
+    manifest, manifest_changed = scan_manifest(folder_path)
+    stages['manifest'] = time.perf_counter() - start
+    if not any(record['valid'] or is_pending(record) for record in manifest['files'].values()):
+        raise ValueError("Keine gültigen Excel-Dateien im Ordner")
+
+    start = time.perf_counter()
+    registry = load_registry(folder_path)
+    data_key = data_fingerprint(manifest, registry)
+    output_path = output_path or folder_path
+    html_file = dashboard_path(output_path, folder_path.name)
+    cached = None
+    if use_cache:
+        if stored_dashboard_fingerprint(html_file) == dashboard_fingerprint(data_key):
+            loading_info = _read_loading_report(html_file)
+            if loading_info is not None:
+                # The dashboard is only usable with its plotly.js next to it
+                write_plotly_asset(output_path)
+                stages['cache'] = time.perf_counter() - start
+                loading_info['archive'] = _finish_manifest(folder_path, manifest, manifest_changed, stages)
+                loading_info['stages'] = stages
+                loading_info['cached'] = 'dashboard'
+                logger.info(f"Dashboard {html_file.name} is up to date")
+                return html_file, loading_info
+        cached = load_aggregates(folder_path, data_key)
+    stages['cache'] = time.perf_counter() - start
+
+    if cached is not None:
+        df_facts = cached['df_facts']
+        loading_info = dict(cached['loading_info'], cached='aggregates')
+    else:
+        df_facts, loading_info = _evaluate_folder(folder_path, registry, stages, manifest['files'])
+        # Keyed by the registry as stored now, so the next run finds the aggregates
+        data_key = data_fingerprint(manifest, registry)
+        save_aggregates(folder_path, data_key, {'df_facts': df_facts, 'loading_info': loading_info})
+
+    # The rating state is stored in the folder, only rounds added since the last run are applied
+    start = time.perf_counter()
+    ratings = update_ratings(folder_path if use_cache else None, df_facts)
+    stages['rating'] = time.perf_counter() - start
+
+    html_file = create_html_dashboard(
+        df_facts, display_names(registry), output_path, timings=stages, workers=workers,
+        fingerprint=dashboard_fingerprint(data_key), name=folder_path.name, ratings=ratings
+    )
+
+    loading_info['archive'] = _finish_manifest(folder_path, manifest, manifest_changed, stages)
+    loading_info['stages'] = stages
+    loading_info['report'] = str(write_loading_report(html_file, loading_info))
+
+    return html_file, loading_info
+
+
+def _finish_manifest(folder_path: Path, manifest: dict, changed: bool, stages: dict) -> dict:
+    """
+    Summarize the records still pending after the loader (all of them if the cache was
+    used), save the manifest if it changed and return the folder summary.
+    """
+    start = time.perf_counter()
+    complete_manifest(folder_path, manifest)
+    if changed:
+        save_manifest(folder_path, manifest)
+    stages['manifest'] += time.perf_counter() - start
+    return summarize_manifest(manifest)
+
+
+def _evaluate_folder(
+        folder_path: Path,
+        registry: dict,
+        stages: dict,
+        manifest_records: dict) -> tuple[pd.DataFrame, dict]:
+    """
+    Load, transform and validate the game files and build the fact table.
+
+    New players are added to the registry, which is saved if it changed. Pending
+    manifest records are built from the sheets read by the loader.
+
+    Returns:
+        tuple[pd.DataFrame, dict]: (df_facts, loading_info), see start_evaluation
+    """
+    # The fact table orders all rounds by start time, so the whole folder is combined;
+    # the loader's memory budget only bounds each chunk
+    start = time.perf_counter()
+    df_rounds, df_games, df_points, loading_info = get_dataframes_from_folder(
+        folder_path, manifest_records=manifest_records
+    )
+    # Transformation runs per chunk (or per file) inside the loader, split it off the load stage;
+    # the per-file times of batch chunks are shares of the chunk time
+    transform_time = (
+        sum(chunk['transform'] for chunk in loading_info['chunks'])
+        if loading_info['chunks']
+        else sum(file_stats['transform'] or 0 for file_stats in loading_info['files'])
+    )
+    stages['load'] = time.perf_counter() - start - transform_time
+    stages['transform'] = transform_time
 
-    df_rounds, df_games, df_points, loading_info = get_dataframes_from_folder(folder_path)
-    
     # Check if any valid data was loaded
     if df_rounds.empty or not loading_info['loaded']:
         raise ValueError("Keine gültigen Excel-Dateien im Ordner")
-    
-    html_file = create_html_dashboard(df_rounds, df_games, df_points, folder_path)
-    
-    return html_file, loading_info
\ No newline at end of file
+
+    # Hand-edited files are reported, but still shown in the dashboard: blank or non-numeric
+    # point cells are NaN in the fact table and skipped by the aggregates, rows without a
+    # player name are left out, see validation.find_inconsistent_games
+    start = time.perf_counter()
+    loading_info['invalid'] = summarize_inconsistencies(find_inconsistent_games(df_points), df_rounds)
+    stages['validate'] = time.perf_counter() - start
+
+    # All charts read from one joined player-game table, players by registry ID
+    start = time.perf_counter()
+    known_players = len(registry['players'])
+    df_facts = build_fact_table(df_rounds, df_games, df_points, registry)
+    if len(registry['players']) != known_players:
+        save_registry(folder_path, registry)
+    stages['facts'] = time.perf_counter() - start
+
+    return df_facts, loading_info
+
+
+def _read_loading_report(html_file: Path) -> dict | None:
+    """Loading statistics from the JSON report of an existing dashboard, None if unreadable."""
+    report_file = html_file.with_suffix('.json')
+    try:
+        with open(report_file, encoding='utf-8') as f:
+            report = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return {
+        'loaded': report['loaded'],
+        'failed': report['failed'],
+        'invalid': report.get('invalid', {}),
+        'files': report['files'],
+        'report': str(report_file),
+    }
+
+
+def write_loading_report(html_file: Path, loading_info: dict) -> Path:
+    """
+    Write the loading statistics as JSON next to the dashboard.
+
+    Returns:
+        Path to the JSON report
+    """
+    report = {
+        'dashboard': html_file.name,
+        'archive': loading_info.get('archive'),
+        'stages': loading_info.get('stages', {}),
+        'total': sum(loading_info.get('stages', {}).values()),
+        'loaded': loading_info['loaded'],
+        'failed': loading_info['failed'],
+        'invalid': loading_info.get('invalid', {}),
+        'files': loading_info['files'],
+    }
+    report_file = html_file.with_suffix('.json')
+    with open(report_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+    return report_file
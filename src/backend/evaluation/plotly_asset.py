@@ -0,0 +1,53 @@
+"""
+Shared plotly.js next to the dashboards.
+
+The dashboards reference plotly.js relatively instead of loading it from the
+CDN, so they also open without internet access, and do not inline the
+library (about 3.5 MB per file). The library bundled with the plotly package
+is written once per game folder under a versioned name and rewritten only if
+the file is missing or its checksum does not match the bundled library.
+"""
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from plotly.offline import get_plotlyjs, get_plotlyjs_version
+from backend.helper_functions import setup_logger, write_bytes_atomic
+
+logger = setup_logger(__name__)
+
+
+def plotly_asset_name() -> str:
+    """Versioned file name of the bundled plotly.js."""
+    return f"plotly-{get_plotlyjs_version()}.min.js"
+
+
+@lru_cache(maxsize=1)
+def _bundled_plotlyjs() -> tuple[bytes, str]:
+    """Bundled plotly.js and its sha256 checksum."""
+    content = get_plotlyjs().encode('utf-8')
+    return content, hashlib.sha256(content).hexdigest()
+
+
+def write_plotly_asset(output_path: Path) -> str:
+    """
+    Make sure the bundled plotly.js is in the folder.
+
+    Args:
+        output_path: Folder of the dashboards
+
+    Returns:
+        str: File name of the asset, relative to output_path
+    """
+    content, checksum = _bundled_plotlyjs()
+    asset_file = output_path / plotly_asset_name()
+    try:
+        if hashlib.sha256(asset_file.read_bytes()).hexdigest() == checksum:
+            return asset_file.name
+        logger.warning(f"Checksum of {asset_file.name} does not match, rewriting it")
+    except FileNotFoundError:
+        pass
+
+    # Concurrent runs on the same folder each write their own temporary file, an interrupted
+    # write never leaves a broken asset
+    write_bytes_atomic(asset_file, content)
+    return asset_file.name
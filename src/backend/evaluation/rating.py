@@ -0,0 +1,189 @@
+"""
+Incremental multi-player rating of a game folder.
+
+Every round is scored as all pairwise duels of its players by final rank
+(Elo generalized to more than two players): a player scores 1 against each
+player ranked below, 0.5 against equal ranks and 0 against players ranked
+above, and the rating moves by RATING_K / (players - 1) times the sum of
+actual minus expected scores. Rounds are applied in the chronological order
+of the fact table (rundenstart, rounds without timing first).
+
+The state is stored as JSON in the game folder. If the rounds of the folder
+start with exactly the stored rounds and results, only the new rounds are
+applied; otherwise (older rounds added, files changed or removed, registry
+IDs merged) all rounds are recomputed. The actual scores are computed for
+all rounds at once, only the rating updates run round by round, so both are
+linear in the number of rounds.
+"""
+import json
+from dataclasses import dataclass
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from backend.helper_functions import setup_logger, write_text_atomic
+
+logger = setup_logger(__name__)
+
+RATING_FILENAME = "myjongg_rating.json"
+RATING_VERSION = 1
+RATING_INITIAL = 1500.0
+RATING_K = 32.0
+RATING_SEATS = 4  # Rounds with another number of players are not rated
+
+
+@dataclass
+class RatingHistory:
+    """Ratings after every rated round, rounds in chronological order."""
+    round_ids: list[str]
+    round_index: np.ndarray              # round_index of the fact table per rated round
+    players: np.ndarray                  # (rounds, RATING_SEATS) spieler_id per seat
+    ranks: np.ndarray                    # (rounds, RATING_SEATS) final rank
+    ratings: np.ndarray                  # (rounds, RATING_SEATS) rating after the round
+    current: dict[int, float]            # latest rating by spieler_id
+    applied: int                         # rounds applied in this update, the others came from the state
+
+
+def _final_standings(df_facts: pd.DataFrame) -> tuple[list[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Round ids, round_index, players and final ranks of all rounds whose final
+    game has exactly RATING_SEATS rows of distinct players with known ranks;
+    other rounds are skipped with a warning. Seats keep their order within the
+    round.
+    """
+    df_final = (
+        df_facts.loc[df_facts['is_final_game'], ['runden_id', 'round_index', 'spieler_id', 'rang']]
+        .sort_values('round_index', kind='stable')
+    )
+    players_per_round = df_final.groupby('round_index', sort=False)['spieler_id']
+    seated = (
+        (players_per_round.transform('size') == RATING_SEATS)
+        & (players_per_round.transform('nunique') == RATING_SEATS)
+    )
+    # A blank rank would be cast to INT64_MIN and win every duel of the round
+    ranked = df_final['rang'].notna().groupby(df_final['round_index'], sort=False).transform('all')
+    for mask, reason in ((~seated, f"without {RATING_SEATS} distinct players"), (seated & ~ranked, "with missing ranks")):
+        skipped = df_final.loc[mask, 'round_index'].nunique()
+        if skipped:
+            logger.warning(f"{skipped} rounds {reason} are not rated")
+    rated = seated & ranked
+    df_final = df_final[rated]
+
+    # Every rated round now is a block of RATING_SEATS consecutive rows
+    round_starts = df_final.iloc[::RATING_SEATS]
+    return (
+        round_starts['runden_id'].tolist(),
+        round_starts['round_index'].to_numpy(dtype=np.int64),
+        df_final['spieler_id'].to_numpy(dtype=np.int64).reshape(-1, RATING_SEATS),
+        df_final['rang'].to_numpy(dtype=np.int64).reshape(-1, RATING_SEATS),
+    )
+
+
+def _actual_scores(ranks: np.ndarray) -> np.ndarray:
+    """Sum of the pairwise duel scores of every seat, (rounds, RATING_SEATS), vectorized over all rounds."""
+    better = (ranks[:, :, None] < ranks[:, None, :]).sum(axis=2)
+    equal = (ranks[:, :, None] == ranks[:, None, :]).sum(axis=2) - 1
+    return better + 0.5 * equal
+
+
+def _apply_rounds(current: dict[int, float], players: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    """
+    Apply the rating updates of the given rounds to current (in place).
+
+    Returns:
+        np.ndarray: (rounds, RATING_SEATS) ratings after every round
+    """
+    factor = RATING_K / (RATING_SEATS - 1)
+    seat_range = range(RATING_SEATS)
+    history = []
+    # Each round depends on the ratings after the previous one; plain floats beat numpy on 4x4 duels
+    for seats, actual in zip(players.tolist(), scores.tolist()):
+        before = [current.get(player, RATING_INITIAL) for player in seats]
+        after = [
+            before[i] + factor * (actual[i] - sum(
+                1.0 / (1.0 + 10.0 ** ((before[j] - before[i]) / 400.0)) for j in seat_range if j != i
+            ))
+            for i in seat_range
+        ]
+        current.update(zip(seats, after))
+        history.append(after)
+    return np.array(history, dtype=np.float64).reshape(-1, RATING_SEATS)
+
+
+def load_rating_state(folder_path: Path) -> dict | None:
+    """Stored rating state of the folder, None if it is missing, unreadable or of other parameters."""
+    rating_file = folder_path / RATING_FILENAME
+    if not rating_file.exists():
+        return None
+    try:
+        with open(rating_file, encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read rating state {rating_file}. Error: {e}")
+        return None
+    parameters = {'initial': RATING_INITIAL, 'k': RATING_K, 'seats': RATING_SEATS}
+    if state.get('version') != RATING_VERSION or state.get('parameters') != parameters:
+        return None
+    return state
+
+
+def save_rating_state(folder_path: Path, history: RatingHistory) -> None:
+    rating_file = folder_path / RATING_FILENAME
+    state = {
+        'version': RATING_VERSION,
+        'parameters': {'initial': RATING_INITIAL, 'k': RATING_K, 'seats': RATING_SEATS},
+        'rounds': history.round_ids,
+        'players': history.players.tolist(),
+        'ranks': history.ranks.tolist(),
+        'ratings': history.ratings.tolist(),
+        'current': {str(player): rating for player, rating in history.current.items()},
+    }
+    try:
+        # json.dumps encodes in C, json.dump streams through the much slower Python encoder
+        write_text_atomic(rating_file, json.dumps(state))
+    except OSError as e:
+        logger.warning(f"Could not write rating state {rating_file}. Error: {e}")
+
+
+def update_ratings(folder_path: Path | None, df_facts: pd.DataFrame) -> RatingHistory:
+    """
+    Bring the rating of the folder up to date with the fact table.
+
+    Args:
+        folder_path: Game folder with the stored state, None computes without state
+        df_facts: Player-game fact table, see fact_table.build_fact_table
+
+    Returns:
+        RatingHistory: Ratings of all rounds, the state is saved if rounds were applied
+    """
+    round_ids, round_index, players, ranks = _final_standings(df_facts)
+
+    # Reuse the stored rounds if the folder's rounds start with them, results included
+    state = load_rating_state(folder_path) if folder_path is not None else None
+    stored = len(state['rounds']) if state is not None else None
+    known = 0
+    current = {}
+    stored_ratings = np.empty((0, RATING_SEATS))
+    if state is not None:
+        if (stored <= len(round_ids)
+                and state['rounds'] == round_ids[:stored]
+                and np.array_equal(np.array(state['players'], dtype=np.int64).reshape(-1, RATING_SEATS), players[:stored])
+                and np.array_equal(np.array(state['ranks'], dtype=np.int64).reshape(-1, RATING_SEATS), ranks[:stored])):
+            known = stored
+            current = {int(player): rating for player, rating in state['current'].items()}
+            stored_ratings = np.array(state['ratings'], dtype=np.float64).reshape(-1, RATING_SEATS)
+        else:
+            logger.info("Rated rounds changed, recomputing the rating")
+
+    new_ratings = _apply_rounds(current, players[known:], _actual_scores(ranks[known:]))
+    history = RatingHistory(
+        round_ids=round_ids,
+        round_index=round_index,
+        players=players,
+        ranks=ranks,
+        ratings=np.concatenate([stored_ratings, new_ratings]),
+        current=current,
+        applied=len(round_ids) - known,
+    )
+    if folder_path is not None and (history.applied or known != stored):
+        save_rating_state(folder_path, history)
+    return history
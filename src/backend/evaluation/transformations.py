@@ -1,5 +1,55 @@
 import hashlib
+import numpy as np
 import pandas as pd
+from backend.manifest_records import WINNING_POINTS  # Shared with the manifest records
+
+# Wind names in the workbooks and their column suffix in df_rounds
+WIND_KEYS = {
+    'Osten': 'osten',
+    'Süden': 'sueden',
+    'Westen': 'westen',
+    'Norden': 'norden'
+}
+
+META_COLUMNS = ['rundenstart', 'rundenende', 'rundendauer', 'rundendauer_text']
+STANDINGS_COLUMNS = ['spieler_wind', 'spieler', 'punktestand', 'rang']
+GAMES_COLUMNS = [
+    'spiel_index',
+    'wind_des_spiels',
+    'gewinner_wind',
+    'spieler',
+    'spieler_wind',
+    'punkte_brutto',
+    'verdopplungen',
+    'punkte_netto',
+    'punkte_delta',
+    'punktestand',
+    'rang'
+]
+GAMES_TIMING_COLUMNS = ['spielstart', 'spielende']
+
+ROUND_COLUMNS = [
+    'runden_id', 'dateiname', 'rundenstart', 'rundenende',
+    'rundendauer', 'rundendauer_text',
+    'spieler_osten', 'siegerpunkte_osten',
+    'spieler_sueden', 'siegerpunkte_sueden',
+    'spieler_westen', 'siegerpunkte_westen',
+    'spieler_norden', 'siegerpunkte_norden'
+]
+GAME_META_COLUMNS = [
+    'runden_id', 'spiel_index', 'wind_des_spiels',
+    'gewinner_wind', 'spielstart', 'spielende'
+]
+POINT_COLUMNS = [
+    'runden_id', 'spiel_index', 'spieler', 'spieler_wind',
+    'punkte_brutto', 'verdopplungen', 'punkte_netto',
+    'punkte_delta', 'punktestand', 'rang'
+]
+
+
+def round_id(filename: str) -> str:
+    """Stable round id generated from the filename."""
+    return hashlib.md5(filename.encode()).hexdigest()[:8]
 
 
 def prepare_round_data(
@@ -13,106 +63,263 @@ def prepare_round_data(
     - df_games_meta: Game-level metadata
     - df_points: Player-level point distribution
 
+    The input sheets are not modified.
+
     Returns:
         tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: (df_rounds, df_games_meta, df_points)
     """
-    # Generate hash from filename
-    file_hash = hashlib.md5(filename.encode()).hexdigest()[:8]
+    file_hash = round_id(filename)
 
     # 1. Create Runden-Metadaten (Round-level)
-    df_meta.columns = ['rundenstart', 'rundenende', 'rundendauer', 'rundendauer_text']
-    df_meta['runden_id'] = file_hash
-    df_meta['dateiname'] = filename
-
-    # Extract player names and calculate siegerpunkte from standings
-    df_standings.columns = ['spieler_wind', 'spieler', 'punktestand', 'rang']
-    df_standings = calculate_winning_points(df_standings)
-
-    # Map wind positions to player names and siegerpunkte
-    wind_mapping = {
-        'Osten': 'osten',
-        'Süden': 'sueden',
-        'Westen': 'westen',
-        'Norden': 'norden'
-    }
-
-    for _, row in df_standings.iterrows():
-        wind_key = wind_mapping.get(row['spieler_wind'])
-        if wind_key:
-            df_meta[f'spieler_{wind_key}'] = row['spieler']
-            df_meta[f'siegerpunkte_{wind_key}'] = row['siegerpunkte']
-
-    # Select only required columns for round metadata
-    df_rounds = df_meta[[
-        'runden_id', 'dateiname', 'rundenstart', 'rundenende',
-        'rundendauer', 'rundendauer_text',
-        'spieler_osten', 'siegerpunkte_osten',
-        'spieler_sueden', 'siegerpunkte_sueden',
-        'spieler_westen', 'siegerpunkte_westen',
-        'spieler_norden', 'siegerpunkte_norden'
-    ]].copy()
+    meta = named_columns(df_meta, META_COLUMNS)
+    index = df_meta.index
+    # Old files have no timing metadata, keep the round with unknown times
+    if df_meta.empty:
+        meta = {column: [None] for column in META_COLUMNS}
+        index = pd.RangeIndex(1)
+    round_ids = np.full(len(index), file_hash, dtype=object)
+
+    # Widen standings into spieler_<wind>/siegerpunkte_<wind> columns
+    standings = named_columns(df_standings, STANDINGS_COLUMNS)
+    winds = widen_standings(
+        round_ids,
+        np.full(len(df_standings), file_hash, dtype=object),
+        standings['spieler_wind'].to_numpy(),
+        standings['spieler'].to_numpy(),
+        winning_points(standings['rang'].to_numpy())
+    )
+    df_rounds = pd.DataFrame(
+        {'runden_id': round_ids, 'dateiname': filename, **meta, **winds},
+        index=index,
+        columns=ROUND_COLUMNS
+    )
 
     # 2. Create Spiel-Metadaten (Game-level)
     # Handle both old files (without spielstart/spielende) and new files (with them)
-    expected_columns = [
-        'spiel_index',
-        'wind_des_spiels',
-        'gewinner_wind',
-        'spieler',
-        'spieler_wind',
-        'punkte_brutto',
-        'verdopplungen',
-        'punkte_netto',
-        'punkte_delta',
-        'punktestand',
-        'rang'
-    ]
-    
-    # Check if timing columns exist (new format)
-    if len(df_games.columns) > 11:
-        expected_columns.extend(['spielstart', 'spielende'])
-    
-    df_games.columns = expected_columns
-    
-    # Add timing columns as None if they don't exist (old format compatibility)
-    if 'spielstart' not in df_games.columns:
-        df_games['spielstart'] = None
-    if 'spielende' not in df_games.columns:
-        df_games['spielende'] = None
+    games = games_columns(df_games)
+    games['runden_id'] = file_hash
 
     # Extract unique game metadata (one row per game)
-    df_games_meta = df_games[[
-        'spiel_index', 'wind_des_spiels', 'gewinner_wind', 'spielstart', 'spielende'
-    ]].drop_duplicates().copy()
-    df_games_meta['runden_id'] = file_hash
+    df_games_meta = pd.DataFrame(
+        {column: games[column] for column in GAME_META_COLUMNS}, index=df_games.index
+    ).drop_duplicates()
+
+    # 3. Create Spiel-Punkteverteilung (Player-level)
+    df_points = pd.DataFrame({column: games[column] for column in POINT_COLUMNS}, index=df_games.index)
+
+    return df_rounds, df_games_meta, df_points
+
+
+def prepare_rounds_batch(
+        raw_sheets: list[tuple[str, pd.DataFrame, pd.DataFrame, pd.DataFrame]]
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Transform the raw sheets of many files at once.
+
+    The sheets are tagged with their file, concatenated once per sheet type and
+    transformed in a single vectorized pass. The result is identical to
+    concatenating the output of prepare_round_data for every file with
+    ignore_index=True.
+
+    Args:
+        raw_sheets: (filename, df_meta, df_games, df_standings) per file
 
-    # Reorder columns
-    df_games_meta = df_games_meta[[
-        'runden_id', 'spiel_index', 'wind_des_spiels',
-        'gewinner_wind', 'spielstart', 'spielende'
-    ]]
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: (df_rounds, df_games_meta, df_points)
+
+    Raises:
+        ValueError: If a sheet of any file has an unexpected number of columns
+    """
+    if not raw_sheets:
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+
+    filenames = np.array([entry[0] for entry in raw_sheets], dtype=object)
+    file_hashes = np.array([round_id(filename) for filename in filenames], dtype=object)
+    # Files are keyed by position, so files sharing a name stem stay apart as in the per-file path
+    file_keys = np.arange(len(raw_sheets))
+
+    # 1. Create Runden-Metadaten (Round-level)
+    # Old files have no timing metadata, keep the round with unknown times
+    no_metadata = pd.DataFrame({column: [None] for column in META_COLUMNS})
+    metas = [
+        pd.DataFrame(named_columns(df_meta, META_COLUMNS)) if not df_meta.empty else no_metadata
+        for _, df_meta, _, _ in raw_sheets
+    ]
+    df_meta = pd.concat(metas, ignore_index=True)
+    meta_keys = np.repeat(file_keys, [len(meta) for meta in metas])
+
+    # Widen standings into spieler_<wind>/siegerpunkte_<wind> columns
+    standings = [
+        pd.DataFrame(named_columns(df_standings, STANDINGS_COLUMNS))
+        for _, _, _, df_standings in raw_sheets
+    ]
+    df_standings = pd.concat(standings, ignore_index=True)
+    winds = widen_standings(
+        meta_keys,
+        np.repeat(file_keys, [len(standing) for standing in standings]),
+        df_standings['spieler_wind'].to_numpy(),
+        df_standings['spieler'].to_numpy(),
+        winning_points(df_standings['rang'].to_numpy())
+    )
+    df_rounds = pd.DataFrame(
+        {
+            'runden_id': file_hashes[meta_keys],
+            'dateiname': filenames[meta_keys],
+            **{column: df_meta[column] for column in META_COLUMNS},
+            **winds
+        },
+        columns=ROUND_COLUMNS
+    )
+
+    # 2. Create Spiel-Metadaten (Game-level)
+    games = [pd.DataFrame(games_columns(df_games)) for _, _, df_games, _ in raw_sheets]
+    df_games = pd.concat(games, ignore_index=True)
+    game_keys = np.repeat(file_keys, [len(game) for game in games])
+    df_games['runden_id'] = file_hashes[game_keys]
+
+    # Extract unique game metadata (one row per game and file)
+    df_games_meta = df_games[GAME_META_COLUMNS]
+    df_games_meta = df_games_meta[~df_games_meta.assign(file_key=game_keys).duplicated()].reset_index(drop=True)
 
     # 3. Create Spiel-Punkteverteilung (Player-level)
-    df_points = df_games[[
-        'spiel_index', 'spieler', 'spieler_wind',
-        'punkte_brutto', 'verdopplungen', 'punkte_netto',
-        'punkte_delta', 'punktestand', 'rang'
-    ]].copy()
-    df_points['runden_id'] = file_hash
-
-    # Reorder columns
-    df_points = df_points[[
-        'runden_id', 'spiel_index', 'spieler', 'spieler_wind',
-        'punkte_brutto', 'verdopplungen', 'punkte_netto',
-        'punkte_delta', 'punktestand', 'rang'
-    ]]
+    df_points = df_games[POINT_COLUMNS]
 
     return df_rounds, df_games_meta, df_points
 
+
+def named_columns(df: pd.DataFrame, names: list[str]) -> dict:
+    """
+    Name the columns of a raw sheet by position without copying them.
+
+    Returns:
+        dict: {name: Series}
+
+    Raises:
+        ValueError: If the sheet does not have exactly len(names) columns
+    """
+    if len(df.columns) != len(names):
+        raise ValueError(
+            f"Length mismatch: Expected axis has {len(df.columns)} elements, "
+            f"new values have {len(names)} elements"
+        )
+    return dict(zip(names, (column for _, column in df.items())))
+
+
+def games_column_names(df_games: pd.DataFrame) -> list[str]:
+    """Column names of a Runden sheet, old files have no spielstart/spielende."""
+    # Check if timing columns exist (new format)
+    if len(df_games.columns) > len(GAMES_COLUMNS):
+        return GAMES_COLUMNS + GAMES_TIMING_COLUMNS
+    return GAMES_COLUMNS
+
+
+def games_columns(df_games: pd.DataFrame) -> dict:
+    """
+    Name the columns of a Runden sheet without copying them.
+
+    Returns:
+        dict: {column name: Series}, with spielstart/spielende set to None for
+        old files without timing columns
+    """
+    columns = named_columns(df_games, games_column_names(df_games))
+    return {'spielstart': None, 'spielende': None, **columns}
+
+
+def widen_standings(
+        round_ids: np.ndarray,
+        standing_round_ids: np.ndarray,
+        standing_winds: np.ndarray,
+        standing_players: np.ndarray,
+        standing_points: np.ndarray) -> dict:
+    """
+    Pivot the standings of one or more rounds into one row per round.
+
+    Each standing is scattered into the row of its round and the column of its
+    wind; if a wind occurs twice in a round the later entry wins. Winds without
+    an entry get no player (NaN) and 0 siegerpunkte, unknown winds are ignored.
+
+    Args:
+        round_ids: runden_id of each output row
+        standing_round_ids: runden_id of each standing
+        standing_winds: Wind name of each standing (Osten, Süden, ...)
+        standing_players: Player name of each standing
+        standing_points: Siegerpunkte of each standing
+
+    Returns:
+        dict: {'spieler_<wind>': object array, 'siegerpunkte_<wind>': int64 array}
+        for the four winds, aligned with round_ids
+    """
+    codes, unique_ids = pd.factorize(round_ids)
+    rows = pd.Index(unique_ids).get_indexer(standing_round_ids)
+
+    columns = {}
+    for wind, wind_key in WIND_KEYS.items():
+        mask = (standing_winds == wind) & (rows >= 0)
+        players = np.full(len(unique_ids), np.nan, dtype=object)
+        players[rows[mask]] = standing_players[mask]
+        points = np.zeros(len(unique_ids), dtype=np.int64)
+        points[rows[mask]] = standing_points[mask]
+        columns[f'spieler_{wind_key}'] = players[codes]
+        columns[f'siegerpunkte_{wind_key}'] = points[codes]
+    return columns
+
+
+def winning_points(ranks: np.ndarray) -> np.ndarray:
+    """Siegerpunkte per final rank as int64 array, looked up from WINNING_POINTS."""
+    points = np.zeros(len(ranks), dtype=np.int64)
+    for rank, rank_points in WINNING_POINTS.items():
+        points[ranks == rank] = rank_points
+    return points
+
+
 def calculate_winning_points(df_standings: pd.DataFrame) -> pd.DataFrame:
     """
     First gets 2 points, second 1 point, others 0 points.
     """
-    df_standings = df_standings.copy()
-    df_standings['siegerpunkte'] = df_standings['rang'].apply(lambda x: 2 if x == 1 else (1 if x == 2 else 0))
-    return df_standings
+    return df_standings.assign(siegerpunkte=winning_points(df_standings['rang'].to_numpy()))
+
+
+def _parse_iso_timestamps(values: pd.Series) -> pd.Series:
+    """Parse ISO 8601 strings with UTC offsets to UTC datetimes, missing values become NaT."""
+    return pd.to_datetime(values, utc=True, format='ISO8601', errors='coerce')
+
+
+def parse_timestamps(
+        df_rounds: pd.DataFrame,
+        df_games_meta: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Parse the ISO timestamp strings of rounds and games into tz-aware UTC
+    datetime columns and precompute durations. Runs vectorized over all rows.
+
+    - rundenstart, rundenende, spielstart, spielende: datetime64[ns, UTC]
+    - rundendauer: timedelta64 from the stored duration in seconds
+    - spieldauer: timedelta64, spielende - spielstart if known, otherwise the
+      time since the previous game of the round was entered (the round start
+      for the first game)
+
+    Files without timing (old format) get NaT in all of these columns.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: (df_rounds, df_games_meta)
+    """
+    df_rounds = df_rounds.assign(
+        rundenstart=_parse_iso_timestamps(df_rounds['rundenstart']),
+        rundenende=_parse_iso_timestamps(df_rounds['rundenende']),
+        rundendauer=pd.to_timedelta(pd.to_numeric(df_rounds['rundendauer'], errors='coerce'), unit='s')
+    )
+
+    df_games_meta = df_games_meta.assign(
+        spielstart=_parse_iso_timestamps(df_games_meta['spielstart']),
+        spielende=_parse_iso_timestamps(df_games_meta['spielende'])
+    )
+    order = df_games_meta.sort_values(['runden_id', 'spiel_index']).index
+    previous_entry = df_games_meta.loc[order].groupby('runden_id')['spielstart'].shift()
+    # Workbooks sharing a name stem share their runden_id, map with the first of them
+    round_starts = df_rounds.drop_duplicates('runden_id').set_index('runden_id')['rundenstart']
+    round_start = df_games_meta['runden_id'].map(round_starts)
+    previous_entry = previous_entry.reindex(df_games_meta.index).fillna(round_start)
+    df_games_meta['spieldauer'] = (df_games_meta['spielende'] - df_games_meta['spielstart']).fillna(
+        df_games_meta['spielstart'] - previous_entry
+    )
+
+    return df_rounds, df_games_meta
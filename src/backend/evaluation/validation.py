@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+from backend.player_registry import normalize_player_name
+
+# Point columns of df_points, blank or non-numeric cells become NaN when coerced
+NUMERIC_COLUMNS = ['punkte_brutto', 'verdopplungen', 'punkte_netto', 'punkte_delta', 'punktestand', 'rang']
+
+# Checked invariants of df_points, in report order
+CHECKS = {
+    'spieler': 'Spielername fehlt',
+    'nicht_numerisch': 'Punktezelle leer oder nicht numerisch',
+    'punkte_netto': 'punkte_netto != punkte_brutto * 2**verdopplungen',
+    'punkte_delta': 'Summe punkte_delta des Spiels != 0',
+    'punktestand': 'punktestand != laufende Summe von punkte_delta',
+    'rang': 'rang passt nicht zum punktestand',
+}
+
+
+def coerce_numeric_columns(df_points: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert NUMERIC_COLUMNS to numbers, blank or non-numeric cells (e.g. in
+    hand-edited files) become NaN. Columns without such cells stay integers.
+    """
+    return df_points.assign(**{
+        column: pd.to_numeric(df_points[column], errors='coerce') for column in NUMERIC_COLUMNS
+    })
+
+
+def find_inconsistent_games(df_points: pd.DataFrame) -> pd.DataFrame:
+    """
+    Check the point invariants of all games in one vectorized pass.
+
+    Rows without a player name are reported, the fact table leaves them out.
+    Blank or non-numeric cells in any of NUMERIC_COLUMNS are reported as
+    their own violation; the fact table keeps them as NaN and the dashboard
+    aggregates skip them. Per game, punkte_netto must equal
+    punkte_brutto * 2**verdopplungen, the punkte_delta values must sum to
+    zero, punktestand must be the running sum of punkte_delta within the
+    round and rang must be the rank of punktestand (ties share the best
+    rank). Each of these is only checked where its values are numeric.
+
+    Returns:
+        pd.DataFrame: One row per offending game with columns runden_id,
+        spiel_index and one boolean column per check in CHECKS (True = violated)
+    """
+    df = coerce_numeric_columns(df_points).sort_values(['runden_id', 'spiel_index'], kind='stable')
+    game_keys = [df['runden_id'], df['spiel_index']]
+    player_keys = [df['runden_id'], df['spieler']]
+
+    # Casting NaN to integers would compare garbage values, missing values are compared as 0 and masked
+    missing = {column: df[column].isna().to_numpy() for column in NUMERIC_COLUMNS}
+    values = {column: df[column].fillna(0).to_numpy().astype(np.int64) for column in NUMERIC_COLUMNS}
+
+    def per_game_any(mask: np.ndarray) -> np.ndarray:
+        return pd.Series(mask, index=df.index).groupby(game_keys).transform('any').to_numpy()
+
+    netto_known = ~(missing['punkte_brutto'] | missing['verdopplungen'] | missing['punkte_netto'])
+    delta = pd.Series(values['punkte_delta'], index=df.index)
+    # The running sum is only known up to the first missing punkte_delta of the player
+    running_known = ~pd.Series(missing['punkte_delta'], index=df.index).groupby(player_keys, dropna=False).cummax().to_numpy()
+    standings_known = ~per_game_any(missing['punktestand'])
+    standings_rank = df['punktestand'].groupby(game_keys).rank(method='min', ascending=False).to_numpy()
+
+    violations = pd.DataFrame({
+        'runden_id': df['runden_id'],
+        'spiel_index': df['spiel_index'],
+        'spieler': df['spieler'].map(normalize_player_name, na_action='ignore').fillna('').eq('').to_numpy(),
+        'nicht_numerisch': np.column_stack(list(missing.values())).any(axis=1),
+        'punkte_netto': netto_known & (
+            values['punkte_netto'] != values['punkte_brutto'] * np.left_shift(1, values['verdopplungen'])
+        ),
+        'punkte_delta': ~per_game_any(missing['punkte_delta'])
+            & (delta.groupby(game_keys).transform('sum').to_numpy() != 0),
+        'punktestand': running_known & ~missing['punktestand']
+            & (values['punktestand'] != delta.groupby(player_keys, dropna=False).cumsum().to_numpy()),
+        'rang': standings_known & ~missing['rang'] & (values['rang'] != standings_rank),
+    })
+
+    per_game = violations.groupby(['runden_id', 'spiel_index'], sort=False)[list(CHECKS)].any()
+    return per_game[per_game.any(axis=1)].reset_index()
+
+
+def summarize_inconsistencies(df_invalid: pd.DataFrame, df_rounds: pd.DataFrame) -> dict:
+    """
+    Group offending games by file for loading_info.
+
+    Returns:
+        dict: {filename: {check: [spiel_index, ...]}} for files with violations
+    """
+    # Workbooks sharing a name stem share runden_id and dateiname
+    filenames = df_invalid['runden_id'].map(df_rounds.drop_duplicates('runden_id').set_index('runden_id')['dateiname'])
+    report = {}
+    for check in CHECKS:
+        violated = df_invalid[check]
+        for filename, spiel_index in zip(filenames[violated], df_invalid.loc[violated, 'spiel_index']):
+            report.setdefault(filename, {}).setdefault(check, []).append(int(spiel_index))
+    return report
@@ -1,43 +1,195 @@
+import base64
+import html
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.express as px
+from backend.evaluation.bootstrap import BOOTSTRAP_CONFIDENCE
+from backend.evaluation.client_pages import CLIENT_PAGES, PAGES_JS, page_builders_js
+from backend.evaluation.compact_dataset import DECODER_JS, dataset_script, encode_fact_table
+from backend.evaluation.dashboard_cache import fingerprint_meta_tag
+from backend.evaluation.downsampling import lttb_indices
+from backend.evaluation.form import FORM_WINDOW, FormAnalytics, compute_form
+from backend.evaluation.head_to_head import HeadToHead, compute_head_to_head
+from backend.evaluation.plotly_asset import write_plotly_asset
+from backend.evaluation.rating import RATING_INITIAL, RATING_K, RatingHistory
+from backend.evaluation.metrics import (
+    WIND_ORDER, OverviewMetrics, PlayerDetail, compute_overview_metrics, compute_player_details
+)
 
 PODIUM_COLORS = ['#FFD700', '#C0C0C0', '#CD7F32', "#939393"]  # Gold, Silver, Bronze, 4th is Black
 PLAYER_COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f']  # Neutral distinguishable colors for players
 
+TIMELINE_POINT_BUDGET = 1000  # Max points per player and timeline, longer timelines are downsampled with LTTB
+CONFIDENCE_LABEL = f"{BOOTSTRAP_CONFIDENCE * 100:.0f} %-Konfidenzintervall"  # Of the bootstrap error bars
+WEBGL_THRESHOLD = 2000  # Timelines with more points in total are rendered with WebGL (Scattergl)
+
+# Netto/delta toggle: the charts hold the netto values, the delta values are embedded once in
+# layout.meta (numeric arrays base64 encoded like plotly's own trace data, see _typed_array)
+# and swapped in with Plotly.restyle instead of keeping hidden duplicate traces
+NETTO_DELTA_TOGGLE_JS = """
+            const TYPED_ARRAYS = {
+                i1: Int8Array, u1: Uint8Array, i2: Int16Array, u2: Uint16Array,
+                i4: Int32Array, u4: Uint32Array, f4: Float32Array, f8: Float64Array
+            };
+
+            function decodeTypedArray(value) {
+                if (!value || typeof value.bdata !== 'string') return value;
+                const bytes = Uint8Array.from(atob(value.bdata), c => c.charCodeAt(0));
+                return Array.from(new TYPED_ARRAYS[value.dtype](bytes.buffer));
+            }
+
+            function attachNettoDeltaToggle(gd) {
+                const toggle = gd.layout.meta && gd.layout.meta.netto_delta_toggle;
+                if (!toggle) return;
+
+                // The values plotted initially are the netto values
+                toggle.restyle.forEach(group => {
+                    // Nested attributes like error_y.array are looked up along their path
+                    group.netto = group.traces.map(index => decodeTypedArray(
+                        group.attribute.split('.').reduce((value, key) => value && value[key], gd.data[index])
+                    ));
+                    group.delta = group.delta.map(decodeTypedArray);
+                });
+
+                let shown = 'netto';
+                gd.on('plotly_buttonclicked', event => {
+                    const dataset = event.button.args[0];
+                    if (dataset === shown) return;
+                    shown = dataset;
+                    toggle.restyle.forEach(group => {
+                        Plotly.restyle(gd, {[group.attribute]: group[dataset]}, group.traces);
+                    });
+                    Plotly.relayout(gd, toggle.layout[dataset]);
+                });
+            }
+
+            window.addEventListener('load', () => {
+                document.querySelectorAll('.plotly-graph-div').forEach(attachNettoDeltaToggle);
+            });
+"""
+
 
 def create_html_dashboard(
-    df_rounds: pd.DataFrame,
-    df_games: pd.DataFrame,
-    df_points: pd.DataFrame,
-    output_path: Path
+    df_facts: pd.DataFrame,
+    player_names: dict[int, str],
+    output_path: Path,
+    timings: dict | None = None,
+    point_budget: int = TIMELINE_POINT_BUDGET,
+    client_pages: bool = True,
+    player_pages: bool = True,
+    workers: int = 1,
+    fingerprint: str | None = None,
+    name: str | None = None,
+    ratings: RatingHistory | None = None,
+    head_to_head: bool = True,
+    form: bool = True
 ) -> Path:
     """
     Create an interactive HTML dashboard with navigation support.
 
     Currently showing:
-    - Page 1 (Overview): Aggregate statistics across all rounds
-
-    Extendable for future pages (e.g., Round Details, Player Analysis)
+    - Page 1 (Overview): Aggregate statistics across all rounds, pre-rendered
+    - Pages from client_pages.CLIENT_PAGES (Spielzeiten, Filter, Rundendetails): built
+      in the browser from the embedded compact dataset when they are opened for the first time
+    - One page per player, chosen in the navigation: pre-rendered from one shared
+      aggregate pass, embedded as JSON and plotted when it is opened for the first time
+    - Rating (if ratings are given): current ratings and their history, embedded
+      and plotted like the player pages
+    - Direkter Vergleich: points won and lost between every two players, reconstructed
+      from the stored games (see head_to_head.py), embedded like the player pages
+    - Form: rolling average of the last games per player and a table of streaks and
+      hot and cold runs (see form.py), embedded like the player pages
 
     Args:
-        df_rounds: Round-level metadata DataFrame
-        df_games: Game-level metadata DataFrame
-        df_points: Player-level points distribution DataFrame
-        output_path: Path where HTML file should be saved
+        df_facts: Player-game fact table, see fact_table.build_fact_table
+        player_names: Display name per spieler_id, see player_registry.display_names
+        output_path: Folder where the HTML file should be saved
+        timings: Optional dict that receives the durations in seconds of the
+            'figures' and 'html' stages
+        point_budget: Max points per player in the rank and cumulative timelines
+        client_pages: Embed the compact dataset and add the lazily built pages
+        player_pages: Add the player pages
+        workers: Number of worker processes building the chart blocks and the
+            player pages, 1 builds them in this process
+        fingerprint: Optional dashboard fingerprint stored in the HTML head,
+            see dashboard_cache.dashboard_fingerprint
+        name: Name of the game folder for the file name, defaults to the name of output_path
+        ratings: Optional rating history for the rating page, see rating.update_ratings
+        head_to_head: Add the head-to-head page
+        form: Add the form page
 
     Returns:
         Path to the generated HTML file
     """
+    start = time.perf_counter()
+
     # Create page figures
-    fig_overview = _create_overview_figure(df_rounds, df_games, df_points)
-    # fig_detail = _create_detail_figure(df_rounds, df_games, df_points)  # Future: Round Details
+    fig_overview = _create_overview_figure(df_facts, player_names, point_budget, workers)
+    player_details = list(compute_player_details(df_facts, player_names).values()) if player_pages else []
+    player_figures = _render_player_pages(player_details, point_budget, workers)
+
+    # Pre-rendered pages in the navigation bar: (page_id, label, figure JSON)
+    figure_pages = []
+    if ratings is not None and ratings.round_ids:
+        figure_pages.append(('rating', '🏅 Rating', _figure_json(_create_rating_figure(ratings, player_names, point_budget))))
+    if head_to_head and not df_facts.empty:
+        figure_pages.append(('head-to-head', '⚔️ Direkter Vergleich', _figure_json(
+            _create_head_to_head_figure(compute_head_to_head(df_facts, player_names))
+        )))
+    if form and not df_facts.empty:
+        figure_pages.append(('form', '🔥 Form', _figure_json(
+            _create_form_figure(compute_form(df_facts, player_names), point_budget)
+        )))
+
+    figures_time = time.perf_counter() - start
+    start = time.perf_counter()
 
     # Convert figures to HTML divs
-    overview_html = fig_overview.to_html(full_html=False, include_plotlyjs='cdn', div_id='overview-page')
-    # detail_html = fig_detail.to_html(full_html=False, include_plotlyjs=False, div_id='detail-page')  # Future
+    # plotly.js is shared by all dashboards of the folder, see plotly_asset.py
+    plotly_script = f'<script src="{html.escape(write_plotly_asset(output_path))}"></script>'
+    overview_html = fig_overview.to_html(full_html=False, include_plotlyjs=False, div_id='overview-plot')
+
+    # Lazily built pages: only empty containers and the data, the figures are created on first open
+    pages = CLIENT_PAGES if client_pages else []
+    page_buttons = ''.join(
+        f'<button class="nav-button" id="btn-{page.page_id}" onclick="showPage(\'{page.page_id}\')">{page.label}</button>'
+        for page in pages
+    )
+    page_containers = ''.join(f'<div id="{page.page_id}-page" class="page"></div>' for page in pages)
+    data_script = dataset_script(encode_fact_table(df_facts, player_names)) if pages else ''
+    pages_js = DECODER_JS + PAGES_JS + page_builders_js(pages) if pages else 'const PAGE_BUILDERS = {};'
+    fingerprint_meta = fingerprint_meta_tag(fingerprint) if fingerprint else ''
+
+    # Player pages: the figures wait as JSON in their containers until the page is opened
+    player_select = ''
+    if player_details:
+        player_options = ''.join(
+            f'<option value="player-{detail.player_id}">{html.escape(detail.label)}</option>'
+            for detail in player_details
+        )
+        player_select = (
+            '<select class="nav-button" id="player-select" onchange="showPage(this.value)">'
+            f'<option value="" disabled selected>👤 Spieler</option>{player_options}</select>'
+        )
+    figure_buttons = ''.join(
+        f'<button class="nav-button" id="btn-{page_id}" onclick="showPage(\'{page_id}\')">{label}</button>'
+        for page_id, label, _ in figure_pages
+    )
+    figure_containers = ''.join(
+        f'<div id="{page_id}-page" class="page">'
+        f'<script type="application/json" id="{page_id}-figure">{figure}</script></div>'
+        for page_id, _, figure in figure_pages
+    )
+    player_containers = ''.join(
+        f'<div id="player-{detail.player_id}-page" class="page">'
+        f'<script type="application/json" id="player-{detail.player_id}-figure">{figure}</script></div>'
+        for detail, figure in zip(player_details, player_figures)
+    )
 
     # Create complete HTML with navigation structure (extensible for future pages)
     html_content = f"""
@@ -45,7 +197,9 @@ def create_html_dashboard(
     <html>
     <head>
         <meta charset="utf-8">
+        {fingerprint_meta}
         <title>Mahjong Evaluation Dashboard</title>
+        {plotly_script}
         <style>
             body {{
                 font-family: Arial, sans-serif;
@@ -97,6 +251,86 @@ def create_html_dashboard(
                 padding-bottom: 10px;
                 border-bottom: 3px solid #3498db;
             }}
+            .chart {{
+                background-color: white;
+                margin-bottom: 20px;
+            }}
+            .notice {{
+                color: #2c3e50;
+                font-size: 16px;
+                font-style: italic;
+            }}
+            .filter-bar {{
+                display: flex;
+                flex-wrap: wrap;
+                align-items: center;
+                gap: 15px;
+                background-color: white;
+                padding: 15px;
+                margin-bottom: 20px;
+                font-size: 15px;
+            }}
+            .filter-summary {{
+                margin-left: auto;
+                font-style: italic;
+            }}
+            .filter-table {{
+                border-collapse: collapse;
+                background-color: white;
+                font-size: 15px;
+            }}
+            .filter-table th, .filter-table td {{
+                padding: 6px 14px;
+                border-bottom: 1px solid #ddd;
+                text-align: right;
+            }}
+            .filter-table th:first-child, .filter-table td:first-child {{
+                text-align: left;
+            }}
+            .detail-viewport {{
+                height: 70vh;
+                overflow-y: auto;
+                background-color: white;
+            }}
+            .detail-row {{
+                display: grid;
+                grid-template-columns: 60px minmax(120px, 1.5fr) 50px 140px 90px 90px minmax(90px, 1fr) 70px 80px 110px 80px 80px 110px 50px;
+                min-width: 1250px;
+                height: 28px;
+                line-height: 28px;
+                font-size: 14px;
+            }}
+            .detail-row > span {{
+                padding: 0 8px;
+                overflow: hidden;
+                white-space: nowrap;
+                text-overflow: ellipsis;
+            }}
+            .detail-row > span.num {{
+                text-align: right;
+            }}
+            .detail-header {{
+                position: sticky;
+                top: 0;
+                z-index: 1;
+                background-color: #2c3e50;
+                color: white;
+                font-weight: bold;
+            }}
+            .detail-row.odd-game {{
+                background-color: #f4f7fa;
+            }}
+            .detail-row.game-start {{
+                box-shadow: inset 0 1px 0 #ccc;
+            }}
+            .detail-canvas {{
+                position: relative;
+            }}
+            .detail-block {{
+                position: absolute;
+                left: 0;
+                right: 0;
+            }}
         </style>
     </head>
     <body>
@@ -104,7 +338,9 @@ def create_html_dashboard(
             <button class="nav-button active" id="btn-overview" onclick="showPage('overview')">
                 📊 Gesamtansicht - alle Runden
             </button>
-            <!-- Future pages can be added here -->
+            {figure_buttons}
+            {page_buttons}
+            {player_select}
             <span style="margin-left: 30px; font-size: 14px; color: white; font-style: italic;">
                 ℹ️ Nettopunkte: Punkte inkl. Verdopplungen | Punkte Delta: Nettopunkte inkl. Schulden mit allen Spielern
             </span>
@@ -114,9 +350,23 @@ def create_html_dashboard(
             {overview_html}
         </div>
 
-        <!-- Future page containers can be added here -->
+        {figure_containers}
+        {page_containers}
+        {player_containers}
+        {data_script}
 
         <script>
+{pages_js}
+            // Lazily built pages are created the first time they are shown
+            const builtPages = new Set();
+
+            function plotFigurePage(container, figureScript) {{
+                const figure = JSON.parse(figureScript.textContent);
+                const div = document.createElement('div');
+                container.appendChild(div);
+                Plotly.newPlot(div, figure.data, figure.layout, {{responsive: true}});
+            }}
+
             function showPage(pageId) {{
                 // Hide all pages
                 const pages = document.querySelectorAll('.page');
@@ -126,43 +376,76 @@ def create_html_dashboard(
                 const buttons = document.querySelectorAll('.nav-button');
                 buttons.forEach(btn => btn.classList.remove('active'));
 
-                // Show selected page
-                document.getElementById(pageId + '-page').classList.add('active');
-                document.getElementById('btn-' + pageId).classList.add('active');
+                // Show selected page, player pages are chosen in the player select
+                const container = document.getElementById(pageId + '-page');
+                container.classList.add('active');
+                const playerSelect = document.getElementById('player-select');
+                if (pageId.startsWith('player-')) {{
+                    playerSelect.classList.add('active');
+                }} else {{
+                    document.getElementById('btn-' + pageId).classList.add('active');
+                    if (playerSelect) playerSelect.selectedIndex = 0;
+                }}
+
+                // Build after showing, so the charts get the size of the visible container
+                if (!builtPages.has(pageId)) {{
+                    const figure = document.getElementById(pageId + '-figure');
+                    if (figure) {{
+                        builtPages.add(pageId);
+                        plotFigurePage(container, figure);
+                    }} else if (PAGE_BUILDERS[pageId]) {{
+                        builtPages.add(pageId);
+                        PAGE_BUILDERS[pageId](container, loadDataset());
+                    }}
+                }}
 
                 // Scroll to top
                 window.scrollTo({{ top: 0, behavior: 'smooth' }});
             }}
-        </script>
+{NETTO_DELTA_TOGGLE_JS}        </script>
     </body>
     </html>
     """
 
     # Save to file
-    # use foldername to create filename
-    html_file = 'Auswertung_' + output_path.name + '.html'
-    filepath = output_path / html_file
+    filepath = dashboard_path(output_path, name)
     with open(filepath, 'w', encoding='utf-8') as f:
         f.write(html_content)
 
+    if timings is not None:
+        timings['figures'] = figures_time
+        timings['html'] = time.perf_counter() - start
+
     return filepath
 
 
+def dashboard_path(output_path: Path, name: str | None = None) -> Path:
+    """Path of the dashboard in output_path, named after the game folder (default: output_path)."""
+    return output_path / ('Auswertung_' + (name or output_path.name) + '.html')
+
+
 def _create_overview_figure(
-    df_rounds: pd.DataFrame,
-    df_games: pd.DataFrame,
-    df_points: pd.DataFrame
-) -> go.Figure:
+        df_facts: pd.DataFrame,
+        player_names: dict[int, str],
+        point_budget: int = TIMELINE_POINT_BUDGET,
+        workers: int = 1) -> go.Figure:
     """
     Create overview page figure with aggregate statistics across all rounds.
 
+    All aggregates come from metrics.compute_overview_metrics. The traces of each chart
+    block in OVERVIEW_BLOCKS are built and serialized independently, with workers > 1 in
+    a process pool, and assembled into the subplot grid afterwards.
+    Timelines longer than point_budget points per player are reduced with LTTB to
+    original points, so the hover still shows exact values, and switch to WebGL
+    above WEBGL_THRESHOLD points.
+
     Visualizations:
     1. Podium - Siegerpunkte
     2. Podium - Gesamtpunktzahl
     3. Laufende Summe der Gesamtpunktzahl über alle Spiele
-    4. Ø Nettopunkte je Spieler
+    4. Ø Nettopunkte je Spieler, with bootstrap confidence intervals as error bars
     5. Wind-Vorteil Analyse
-    6. Performance als Spielführer
+    6. Performance als Spielführer, averages with bootstrap confidence intervals
     """
     # Create subplot grid
     fig = make_subplots(
@@ -173,9 +456,9 @@ def _create_overview_figure(
             'Rang nach Siegerpunkten über alle Runden',
             'Laufende Summe der Gesamtpunktzahl über alle Spiele',
             'Punkteverteilung je Spieler (Boxplot)',
-            'Ø Punkte',
+            f'Ø Punkte ({CONFIDENCE_LABEL})',
             'Punkte als Spielführer',
-            'Ø Punkte als Spielführer',
+            f'Ø Punkte als Spielführer ({CONFIDENCE_LABEL})',
             'Wind-Vorteil Analyse'
         ),
         specs=[
@@ -191,331 +474,20 @@ def _create_overview_figure(
         row_heights=[0.18, 0.22, 0.22, 0.16, 0.16, 0.12]
     )
 
-    # Siegerpunkte by Player
-    siegerpunkte_data = {}
-    for wind in ['osten', 'sueden', 'westen', 'norden']:
-        player_col = f'spieler_{wind}'
-        points_col = f'siegerpunkte_{wind}'
-
-        if player_col in df_rounds.columns:
-            for _, row in df_rounds.iterrows():
-                player = row[player_col]
-                points = row[points_col]
-                siegerpunkte_data[player] = siegerpunkte_data.get(player, 0) + points
-
-    sorted_players = sorted(siegerpunkte_data.items(), key=lambda x: x[1], reverse=True)
-    
-    # Create player-to-color mapping based on Siegerpunkte ranking
-    player_color_map = {}
-    if sorted_players:
-        for i, (player, _) in enumerate(sorted_players):
-            player_color_map[player] = PLAYER_COLORS[i % len(PLAYER_COLORS)]
-        
-        players, points = zip(*sorted_players)
-        bar_colors = [PODIUM_COLORS[i] if i < len(PODIUM_COLORS) else '#A9A9A9' for i in range(len(players))]
-        fig.add_trace(
-            go.Bar(
-                x=list(players), 
-                y=list(points), 
-                name='Siegerpunkte',
-                marker_color=bar_colors, 
-                text=list(points),
-                textposition='inside',
-                insidetextanchor='start',
-                textfont=dict(size=17, color='black'),
-                showlegend=False
-            ),
-            row=1, col=1
-        )
-
-    # Gesamtpunktzahl by Player
-    total_points = df_points.groupby('spieler')['punkte_delta'].sum().sort_values(ascending=False)
-
-    bar_colors = [PODIUM_COLORS[i] if i < len(PODIUM_COLORS) else '#A9A9A9' for i in range(len(total_points))]
-    formatted_points = [f"{int(val):,}".replace(",", ".") for val in total_points.values]
-    fig.add_trace(
-        go.Bar(
-            x=total_points.index, 
-            y=total_points.values, 
-            name='Gesamtpunktzahl',
-            marker_color=bar_colors,
-            showlegend=False
-        ),
-        row=1, col=2
-    )
-    
-    # Add text labels at y=0
-    fig.add_trace(
-        go.Scatter(
-            x=total_points.index,
-            y=[0] * len(total_points),
-            mode='text',
-            text=formatted_points,
-            textposition='top center',
-            textfont=dict(size=14, color='black'),
-            showlegend=False,
-            hoverinfo='skip'
-        ),
-        row=1, col=2
-    )
-
-    # Cumulative Rank Timeline (by Rounds)
-    # Unpivot Siegerpunkte data from df_rounds
-    df_rounds_sorted = df_rounds.sort_values('rundenstart').reset_index(drop=True)
-    df_rounds_sorted['round_index'] = df_rounds_sorted.index + 1
-    
-    # Unpivot siegerpunkte columns
-    siegerpunkte_melted = pd.melt(
-        df_rounds_sorted,
-        id_vars=['runden_id', 'rundenstart', 'round_index'],
-        value_vars=['siegerpunkte_osten', 'siegerpunkte_sueden', 'siegerpunkte_westen', 'siegerpunkte_norden'],
-        var_name='wind_column',
-        value_name='siegerpunkte'
-    )
-    
-    # Unpivot player columns
-    player_melted = pd.melt(
-        df_rounds_sorted,
-        id_vars=['runden_id', 'rundenstart', 'round_index'],
-        value_vars=['spieler_osten', 'spieler_sueden', 'spieler_westen', 'spieler_norden'],
-        var_name='wind_column',
-        value_name='spieler'
-    )
-    
-    # Extract wind suffix to align siegerpunkte with players
-    siegerpunkte_melted['wind'] = siegerpunkte_melted['wind_column'].str.replace('siegerpunkte_', '')
-    player_melted['wind'] = player_melted['wind_column'].str.replace('spieler_', '')
-    
-    # Merge to create long format: round_index, spieler, siegerpunkte
-    df_siegerpunkte_long = siegerpunkte_melted.merge(
-        player_melted[['runden_id', 'round_index', 'wind', 'spieler']],
-        on=['runden_id', 'round_index', 'wind'],
-        how='left'
-    )
-    
-    # Calculate cumulative Siegerpunkte per player
-    df_siegerpunkte_long = df_siegerpunkte_long.sort_values(['rundenstart', 'round_index'])
-    df_siegerpunkte_long['cumulative_siegerpunkte'] = df_siegerpunkte_long.groupby('spieler')['siegerpunkte'].cumsum()
-    
-    # Calculate rank at each round (highest cumulative = rank 1)
-    df_siegerpunkte_long['rank'] = df_siegerpunkte_long.groupby('round_index')['cumulative_siegerpunkte'].rank(
-        method='min', ascending=False
-    )
-    
-    # Sort by round_index and rank so hover displays players in rank order (1 to 4)
-    df_siegerpunkte_long = df_siegerpunkte_long.sort_values(['round_index', 'rank'])
-    
-    # Plot rank timeline for each player
-    for player in sorted(df_siegerpunkte_long['spieler'].unique()):
-        player_data = df_siegerpunkte_long[df_siegerpunkte_long['spieler'] == player]
-        player_color = player_color_map.get(player, '#7f7f7f')
-        fig.add_trace(
-            go.Scatter(
-                x=player_data['round_index'],
-                y=player_data['rank'],
-                mode='lines+markers',
-                name=player,
-                line=dict(width=2, color=player_color, shape='linear'),
-                marker=dict(size=6, color=player_color),
-                customdata=player_data['cumulative_siegerpunkte'],
-                hovertemplate='<b>%{fullData.name}</b><br>Rang: %{y}<br>Siegerpunkte: %{customdata}<extra></extra>',
-                showlegend=False
-            ),
-            row=2, col=1
-        )
+    metrics = compute_overview_metrics(df_facts, player_names, workers)
+    num_players = len(metrics.player_ids)
 
-    # Cumulative Points Timeline
-    # Prepare continuous game index
-    df_points_sorted = df_points.merge(
-        df_rounds[['runden_id', 'rundenstart']],
-        on='runden_id',
-        how='left'
-    ).sort_values(['rundenstart', 'spiel_index'])
-
-    df_points_sorted['continuous_game_index'] = df_points_sorted.groupby(
-        ['runden_id', 'spiel_index']
-    ).ngroup()
-
-    # Calculate cumulative points
-    df_points_sorted = df_points_sorted.sort_values('continuous_game_index')
-    df_points_sorted['cumulative_points'] = df_points_sorted.groupby('spieler')['punkte_delta'].cumsum()
-
-    for player in sorted(df_points_sorted['spieler'].unique()):
-        player_data = df_points_sorted[df_points_sorted['spieler'] == player]
-        player_color = player_color_map.get(player, '#7f7f7f')
-        fig.add_trace(
-            go.Scatter(
-                x=player_data['continuous_game_index'] + 1,
-                y=player_data['cumulative_points'],
-                mode='lines+markers',
-                name=player,
-                line=dict(width=2, color=player_color),
-                marker=dict(size=4, color=player_color)
-            ),
-            row=3, col=1
-        )
+    # Add the traces of all chart blocks in block order, collecting the delta values of the
+    # netto/delta toggle with their final trace indices
+    delta_data = {}
+    for block_traces in _build_chart_blocks(metrics, point_budget, workers):
+        for trace, row, col, delta in block_traces:
+            fig.add_trace(trace, row=row, col=col)
+            for attribute, value in delta.items():
+                traces, values = delta_data.setdefault(attribute, ([], []))
+                traces.append(len(fig.data) - 1)
+                values.append(value)
 
-    # Boxplot for Points Distribution
-    # Use consistent player order from Siegerpunkte ranking
-    all_players = [player for player, _ in sorted_players] if sorted_players else sorted(df_points['spieler'].unique())
-    num_players = len(all_players)
-    
-    # Track where boxplot traces start
-    boxplot_start_idx = len(fig.data)
-    
-    for player in all_players:
-        player_data = df_points[df_points['spieler'] == player]
-        player_color = player_color_map.get(player, '#7f7f7f')
-        
-        # Netto points boxplot
-        fig.add_trace(
-            go.Box(
-                y=player_data['punkte_netto'],
-                name=player,
-                marker_color=player_color,
-                visible=True,
-                showlegend=False
-            ),
-            row=4, col=1
-        )
-        
-        # Delta points boxplot
-        fig.add_trace(
-            go.Box(
-                y=player_data['punkte_delta'],
-                name=player,
-                marker_color=player_color,
-                visible=False,
-                showlegend=False
-            ),
-            row=4, col=1
-        )
-
-    # Average points bar chart per player (row 3, col 2)
-    avg_netto_per_player = df_points.groupby('spieler')['punkte_netto'].mean().reset_index(name='avg_netto')
-    avg_delta_per_player = df_points.groupby('spieler')['punkte_delta'].mean().reset_index(name='avg_delta')
-    avg_points_per_player = avg_netto_per_player.merge(avg_delta_per_player, on='spieler')
-    
-    # Use consistent player order from Siegerpunkte ranking
-    player_order = [player for player, _ in sorted_players] if sorted_players else sorted(avg_points_per_player['spieler'].unique())
-    avg_points_per_player['spieler'] = pd.Categorical(avg_points_per_player['spieler'], categories=player_order, ordered=True)
-    avg_points_per_player = avg_points_per_player.sort_values('spieler')
-    
-    bar_colors_avg_player = [player_color_map.get(player, '#7f7f7f') for player in avg_points_per_player['spieler']]
-    
-    # Netto average bar chart (visible by default)
-    formatted_avg_netto = [f"{int(val):,}".replace(",", ".") for val in avg_points_per_player['avg_netto']]
-    fig.add_trace(
-        go.Bar(
-            x=avg_points_per_player['spieler'],
-            y=avg_points_per_player['avg_netto'],
-            name='Ø Netto',
-            marker_color=bar_colors_avg_player,
-            showlegend=False,
-            visible=True
-        ),
-        row=4, col=2
-    )
-    
-    # Add text labels at y=0 for netto
-    fig.add_trace(
-        go.Scatter(
-            x=avg_points_per_player['spieler'],
-            y=[0] * len(avg_points_per_player),
-            mode='text',
-            text=formatted_avg_netto,
-            textposition='top center',
-            textfont=dict(size=14, color='black'),
-            showlegend=False,
-            hoverinfo='skip',
-            visible=True
-        ),
-        row=4, col=2
-    )
-    
-    # Delta average bar chart (hidden by default)
-    formatted_avg_delta = [f"{int(val):,}".replace(",", ".") for val in avg_points_per_player['avg_delta']]
-    fig.add_trace(
-        go.Bar(
-            x=avg_points_per_player['spieler'],
-            y=avg_points_per_player['avg_delta'],
-            name='Ø Delta',
-            marker_color=bar_colors_avg_player,
-            showlegend=False,
-            visible=False
-        ),
-        row=4, col=2
-    )
-    
-    # Add text labels at y=0 for delta
-    fig.add_trace(
-        go.Scatter(
-            x=avg_points_per_player['spieler'],
-            y=[0] * len(avg_points_per_player),
-            mode='text',
-            text=formatted_avg_delta,
-            textposition='top center',
-            textfont=dict(size=14, color='black'),
-            showlegend=False,
-            hoverinfo='skip',
-            visible=False
-        ),
-        row=4, col=2
-    )
-    
-    fig.update_xaxes(
-        row=4, col=2,
-        tickfont=dict(size=14)
-    )
-    
-    # Calculate shared y-axis range for both average bar charts (row 3 col 2 and row 4 col 2)
-    # For netto values
-    all_netto_values = list(avg_points_per_player['avg_netto'])
-    all_delta_values = list(avg_points_per_player['avg_delta'])
-
-    # Wind Advantage Analysis (moved to row 5)
-    # Find round winners (rank 1 at final game of each round)
-    final_games = df_points.groupby('runden_id')['spiel_index'].max().reset_index()
-    final_games.columns = ['runden_id', 'final_spiel_index']
-    
-    round_winners = df_points.merge(final_games, on='runden_id')
-    round_winners = round_winners[
-        (round_winners['spiel_index'] == round_winners['final_spiel_index']) &
-        (round_winners['rang'] == 1)
-    ]
-    
-    # Count wins by wind position
-    wind_wins = round_winners['spieler_wind'].value_counts()
-    total_rounds = len(df_rounds)
-    
-    # Define fixed wind order (matching Wind enum in game.py)
-    wind_order = ['Osten', 'Süden', 'Westen', 'Norden']
-    
-    # Calculate win rates for each wind
-    wind_win_rates = []
-    wind_win_counts = []
-    for wind in wind_order:
-        wins = wind_wins.get(wind, 0)
-        rate = (wins / total_rounds * 100) if total_rounds > 0 else 0
-        wind_win_rates.append(rate)
-        wind_win_counts.append(wins)
-    
-    # Create bar chart with expected 25% line
-    fig.add_trace(
-        go.Bar(
-            x=wind_order,
-            y=wind_win_rates,
-            name='Gewinnrate',
-            marker_color=['#ff9999', '#ffcc99', '#99ccff', '#99ff99'],
-            text=wind_win_counts,
-            textposition='inside',
-            insidetextanchor='start',
-            textfont=dict(size=17, color='black'),
-            showlegend=False
-        ),
-        row=6, col=1
-    )
-    
     # Add expected 25% reference line
     fig.add_hline(
         y=25,
@@ -534,153 +506,27 @@ def _create_overview_figure(
         row=6, col=1
     )
 
-    # Wind Performance Analysis (as wind_des_spiels)
-    # Merge df_points with df_games to get wind_des_spiels
-    df_wind_analysis = df_points.merge(
-        df_games[['runden_id', 'spiel_index', 'wind_des_spiels', 'gewinner_wind']],
-        on=['runden_id', 'spiel_index'],
-        how='left'
-    )
-    
-    # Filter for games where player was the wind of the game
-    df_as_wind = df_wind_analysis[df_wind_analysis['spieler_wind'] == df_wind_analysis['wind_des_spiels']]
-    
-    # Calculate per-round statistics for each player
-    # 1. Total netto points as wind_des_spiels per round
-    df_netto_as_wind = df_as_wind.groupby(
-        ['runden_id', 'spieler']
-    )['punkte_netto'].sum().reset_index(name='netto_as_wind')
-    
-    # 2. Total delta points as wind_des_spiels per round
-    df_delta_as_wind = df_as_wind.groupby(
-        ['runden_id', 'spieler']
-    )['punkte_delta'].sum().reset_index(name='delta_as_wind')
-    
-    # Merge both statistics
-    df_wind_stats = df_netto_as_wind.merge(
-        df_delta_as_wind,
-        on=['runden_id', 'spieler'],
-        how='outer'
-    ).fillna(0)
-    
-    # Create boxplots for each player (netto and delta, togglable with main boxplot)
-    # Use consistent player order from Siegerpunkte ranking
-    all_players_sorted = [player for player, _ in sorted_players] if sorted_players else sorted(df_points['spieler'].unique())
-    num_players_wind = len(all_players_sorted)
-    
-    for player in all_players_sorted:
-        player_stats = df_wind_stats[df_wind_stats['spieler'] == player]
-        player_color = player_color_map.get(player, '#7f7f7f')
-        
-        # Netto points boxplot (visible by default)
-        fig.add_trace(
-            go.Box(
-                y=player_stats['netto_as_wind'],
-                name=player,
-                marker_color=player_color,
-                visible=True,
-                showlegend=False
-            ),
-            row=5, col=1
-        )
-        
-        # Delta points boxplot (hidden by default)
-        fig.add_trace(
-            go.Box(
-                y=player_stats['delta_as_wind'],
-                name=player,
-                marker_color=player_color,
-                visible=False,
-                showlegend=False
-            ),
-            row=5, col=1
-        )
-    
     fig.update_yaxes(title_text="Nettopunkte", row=5, col=1)
+    for row in (4, 5):
+        fig.update_xaxes(
+            row=row, col=2,
+            tickfont=dict(size=14)
+        )
+
+    # Shared y-axis range for both average bar charts (row 4 col 2 and row 5 col 2)
+    # The ranges include the confidence intervals, so the error bars are not cut off
+    as_wind = metrics.games_as_wind > 0
+    all_netto_values = np.concatenate([
+        metrics.avg_netto, metrics.avg_netto_as_wind[as_wind],
+        metrics.ci_netto.ravel(), metrics.ci_netto_as_wind[as_wind].ravel()
+    ])
+    all_delta_values = np.concatenate([
+        metrics.avg_delta, metrics.avg_delta_as_wind[as_wind],
+        metrics.ci_delta.ravel(), metrics.ci_delta_as_wind[as_wind].ravel()
+    ])
+    all_netto_values = all_netto_values[~np.isnan(all_netto_values)].tolist()
+    all_delta_values = all_delta_values[~np.isnan(all_delta_values)].tolist()
 
-    # Bar charts: Average points as wind_des_spiels
-    # Calculate average netto and delta points for each player
-    avg_netto_as_wind = df_as_wind.groupby('spieler')['punkte_netto'].mean().reset_index(name='avg_netto')
-    avg_delta_as_wind = df_as_wind.groupby('spieler')['punkte_delta'].mean().reset_index(name='avg_delta')
-    
-    # Merge and use consistent player order from Siegerpunkte ranking
-    avg_points_as_wind = avg_netto_as_wind.merge(avg_delta_as_wind, on='spieler')
-    player_order = [player for player, _ in sorted_players] if sorted_players else sorted(avg_points_as_wind['spieler'].unique())
-    avg_points_as_wind['spieler'] = pd.Categorical(avg_points_as_wind['spieler'], categories=player_order, ordered=True)
-    avg_points_as_wind = avg_points_as_wind.sort_values('spieler')
-    
-    # Create bar colors using player color map
-    bar_colors_avg = [player_color_map.get(player, '#7f7f7f') for player in avg_points_as_wind['spieler']]
-    
-    # Netto average bar chart (visible by default)
-    formatted_netto = [f"{int(val):,}".replace(",", ".") for val in avg_points_as_wind['avg_netto']]
-    fig.add_trace(
-        go.Bar(
-            x=avg_points_as_wind['spieler'],
-            y=avg_points_as_wind['avg_netto'],
-            name='Ø Netto als Wind',
-            marker_color=bar_colors_avg,
-            showlegend=False,
-            visible=True
-        ),
-        row=5, col=2
-    )
-    
-    # Add text labels at y=0 for netto
-    fig.add_trace(
-        go.Scatter(
-            x=avg_points_as_wind['spieler'],
-            y=[0] * len(avg_points_as_wind),
-            mode='text',
-            text=formatted_netto,
-            textposition='top center',
-            textfont=dict(size=14, color='black'),
-            showlegend=False,
-            hoverinfo='skip',
-            visible=True
-        ),
-        row=5, col=2
-    )
-    
-    # Delta average bar chart (hidden by default)
-    formatted_delta = [f"{int(val):,}".replace(",", ".") for val in avg_points_as_wind['avg_delta']]
-    fig.add_trace(
-        go.Bar(
-            x=avg_points_as_wind['spieler'],
-            y=avg_points_as_wind['avg_delta'],
-            name='Ø Delta als Wind',
-            marker_color=bar_colors_avg,
-            showlegend=False,
-            visible=False
-        ),
-        row=5, col=2
-    )
-    
-    # Add text labels at y=0 for delta
-    fig.add_trace(
-        go.Scatter(
-            x=avg_points_as_wind['spieler'],
-            y=[0] * len(avg_points_as_wind),
-            mode='text',
-            text=formatted_delta,
-            textposition='top center',
-            textfont=dict(size=14, color='black'),
-            showlegend=False,
-            hoverinfo='skip',
-            visible=False
-        ),
-        row=5, col=2
-    )
-    
-    fig.update_xaxes(
-        row=5, col=2,
-        tickfont=dict(size=14)
-    )
-    
-    # Collect values from row 4 col 2 bar charts for shared y-axis range
-    all_netto_values.extend(list(avg_points_as_wind['avg_netto']))
-    all_delta_values.extend(list(avg_points_as_wind['avg_delta']))
-    
     # Calculate shared y-axis ranges with some padding
     netto_min = min(all_netto_values) if all_netto_values else 0
     netto_max = max(all_netto_values) if all_netto_values else 0
@@ -701,49 +547,35 @@ def _create_overview_figure(
     fig.update_yaxes(title_text="Ø Nettopunkte", range=shared_netto_range, row=4, col=2)
     fig.update_yaxes(title_text="Ø Nettopunkte", range=shared_netto_range, row=5, col=2)
 
-    # Update layout
-    total_traces = len(fig.data)
-    
-    # Build visibility arrays for toggle buttons
-    # All traces before boxplots stay visible (podium bars + timeline)
-    base_visibility = [True] * boxplot_start_idx
-    
-    # For netto: show first set of boxplots (netto), hide second set (delta)
-    netto_boxplot_visibility = []
-    for i in range(num_players):
-        netto_boxplot_visibility.extend([True, False])
-    
-    # For delta: hide first set of boxplots (netto), show second set (delta)
-    delta_boxplot_visibility = []
-    for i in range(num_players):
-        delta_boxplot_visibility.extend([False, True])
-    
-    # Average points per player bar charts + text labels: netto visible, delta hidden
-    # Each has: bar + scatter text = 2 traces
-    avg_player_bar_netto_visibility = [True, True, False, False]  # netto bar + text visible, delta bar + text hidden
-    avg_player_bar_delta_visibility = [False, False, True, True]  # netto bar + text hidden, delta bar + text visible
-    
-    # Wind analysis trace should always be visible
-    wind_visibility = [True]
-    
-    # Wind performance boxplots: netto visible, delta hidden (same pattern as main boxplot)
-    wind_perf_netto_visibility = []
-    for i in range(num_players_wind):
-        wind_perf_netto_visibility.extend([True, False])
-    
-    # Wind performance boxplots: netto hidden, delta visible
-    wind_perf_delta_visibility = []
-    for i in range(num_players_wind):
-        wind_perf_delta_visibility.extend([False, True])
-    
-    # Average points as wind bar charts + text labels: netto visible, delta hidden
-    # Each has: bar + scatter text = 2 traces
-    avg_wind_bar_netto_visibility = [True, True, False, False]  # netto bar + text visible, delta bar + text hidden
-    avg_wind_bar_delta_visibility = [False, False, True, True]  # netto bar + text hidden, delta bar + text visible
-    
-    netto_visible = base_visibility + netto_boxplot_visibility + avg_player_bar_netto_visibility + wind_visibility + wind_perf_netto_visibility + avg_wind_bar_netto_visibility
-    delta_visible = base_visibility + delta_boxplot_visibility + avg_player_bar_delta_visibility + wind_visibility + wind_perf_delta_visibility + avg_wind_bar_delta_visibility
-    
+    # Netto/delta toggle: the buttons only emit plotly_buttonclicked (method 'skip'), the
+    # dashboard script restyles the traces listed in layout.meta with the delta values and
+    # back, see NETTO_DELTA_TOGGLE_JS
+    netto_layout = {
+        "yaxis5.title.text": "Nettopunkte",
+        "yaxis6.title.text": "Ø Nettopunkte",
+        "yaxis6.range": shared_netto_range,
+        "yaxis7.title.text": "Nettopunkte",
+        "yaxis8.title.text": "Ø Nettopunkte",
+        "yaxis8.range": shared_netto_range
+    }
+    delta_layout = {
+        "yaxis5.title.text": "Punkte Delta",
+        "yaxis6.title.text": "Ø Punkte Delta",
+        "yaxis6.range": shared_delta_range,
+        "yaxis7.title.text": "Punkte Delta",
+        "yaxis8.title.text": "Ø Punkte Delta",
+        "yaxis8.range": shared_delta_range
+    }
+    fig.update_layout(meta={
+        'netto_delta_toggle': {
+            'restyle': [
+                {'attribute': attribute, 'traces': traces, 'delta': values}
+                for attribute, (traces, values) in delta_data.items()
+            ],
+            'layout': {'netto': netto_layout, 'delta': delta_layout}
+        }
+    })
+
     fig.update_layout(
         height=1800,
         title_text="Mahjong Dashboard - Übersicht aller Runden",
@@ -763,36 +595,8 @@ def _create_overview_figure(
                 type="buttons",
                 direction="left",
                 buttons=[
-                    dict(
-                        args=[
-                            {"visible": netto_visible},
-                            {
-                                "yaxis5.title.text": "Nettopunkte",
-                                "yaxis6.title.text": "Ø Nettopunkte",
-                                "yaxis6.range": shared_netto_range,
-                                "yaxis7.title.text": "Nettopunkte",
-                                "yaxis8.title.text": "Ø Nettopunkte",
-                                "yaxis8.range": shared_netto_range
-                            }
-                        ],
-                        label="Nettopunkte",
-                        method="update"
-                    ),
-                    dict(
-                        args=[
-                            {"visible": delta_visible},
-                            {
-                                "yaxis5.title.text": "Punkte Delta",
-                                "yaxis6.title.text": "Ø Punkte Delta",
-                                "yaxis6.range": shared_delta_range,
-                                "yaxis7.title.text": "Punkte Delta",
-                                "yaxis8.title.text": "Ø Punkte Delta",
-                                "yaxis8.range": shared_delta_range
-                            }
-                        ],
-                        label="Punkte Delta",
-                        method="update"
-                    )
+                    dict(args=['netto'], label="Nettopunkte", method="skip"),
+                    dict(args=['delta'], label="Punkte Delta", method="skip")
                 ],
                 active=0,
                 showactive=True,
@@ -809,8 +613,8 @@ def _create_overview_figure(
 
     # Update axes
     # Add extra space at top for Siegerpunkte labels
-    max_siegerpunkte = max(points) if sorted_players else 0
-    min_siegerpunkte = min(points) if sorted_players else 0
+    max_siegerpunkte = metrics.siegerpunkte.max() if num_players else 0
+    min_siegerpunkte = metrics.siegerpunkte.min() if num_players else 0
     y_range_sieger = abs(max_siegerpunkte - min_siegerpunkte)
     # Add 20% buffer at top for text labels
     y_range_buffer_top_sieger = y_range_sieger * 0.20
@@ -824,8 +628,8 @@ def _create_overview_figure(
         range=[min_siegerpunkte if min_siegerpunkte < 0 else 0, max_siegerpunkte + y_range_buffer_top_sieger]
     )
 
-    max_gesamtpunktzahl = total_points.max() if len(total_points) > 0 else 0
-    min_gesamtpunktzahl = total_points.min() if len(total_points) > 0 else 0
+    max_gesamtpunktzahl = metrics.total_points.max() if num_players else 0
+    min_gesamtpunktzahl = metrics.total_points.min() if num_players else 0
     y_range_total = abs(max_gesamtpunktzahl - min_gesamtpunktzahl)
     y_range_buffer_top = y_range_total * 0.20
     y_range_buffer_bottom = y_range_total * 0.15
@@ -840,7 +644,7 @@ def _create_overview_figure(
     )
 
     # X-axis for rank timeline: show round numbers
-    max_rounds = df_siegerpunkte_long['round_index'].max() if not df_siegerpunkte_long.empty else 0
+    max_rounds = metrics.max_rounds
     round_tick_interval = 1 if max_rounds <= 25 else 2
     fig.update_xaxes(
         title_text="Rundennummer",
@@ -859,7 +663,7 @@ def _create_overview_figure(
     )
 
     # X-axis for cumulative timeline: show all games if <= 25, otherwise every 2nd
-    max_games = df_points_sorted['continuous_game_index'].max() if not df_points_sorted.empty else 0
+    max_games = metrics.max_games
     game_tick_interval = 1 if max_games <= 25 else 2
     fig.update_xaxes(
         title_text="Spielnummer (alle Runden)", 
@@ -876,9 +680,724 @@ def _create_overview_figure(
     )
     fig.update_yaxes(title_text="Nettopunkte", row=4, col=1)
     
-    fig.update_xaxes(
-        row=4, col=2,
-        tickfont=dict(size=14)
+
+    return fig
+
+
+# Chart blocks of the overview: each returns its traces in plot order as
+# (trace, row, col, delta values of the attributes swapped by the netto/delta toggle)
+
+def _player_colors(num_players: int) -> list[str]:
+    """Player colors in Siegerpunkte ranking order."""
+    return [PLAYER_COLORS[i % len(PLAYER_COLORS)] for i in range(num_players)]
+
+
+def _podium_traces(metrics: OverviewMetrics, point_budget: int) -> list[tuple]:
+    """Siegerpunkte and Gesamtpunktzahl podiums (row 1)."""
+    traces = []
+    num_players = len(metrics.player_ids)
+
+    # Siegerpunkte by Player
+    if num_players:
+        bar_colors = [PODIUM_COLORS[i] if i < len(PODIUM_COLORS) else '#A9A9A9' for i in range(num_players)]
+        traces.append((
+            go.Bar(
+                x=metrics.player_labels, 
+                y=metrics.siegerpunkte, 
+                name='Siegerpunkte',
+                marker_color=bar_colors, 
+                text=metrics.siegerpunkte.tolist(),
+                textposition='inside',
+                insidetextanchor='start',
+                textfont=dict(size=17, color='black'),
+                showlegend=False
+            ),
+            1, 1, {}
+        ))
+
+    # Gesamtpunktzahl by Player
+    total_order = sorted(range(num_players), key=lambda i: (-metrics.total_points[i], metrics.player_labels[i]))
+    total_labels = [metrics.player_labels[i] for i in total_order]
+    total_points = metrics.total_points[total_order]
+
+    bar_colors = [PODIUM_COLORS[i] if i < len(PODIUM_COLORS) else '#A9A9A9' for i in range(len(total_points))]
+    formatted_points = [f"{int(val):,}".replace(",", ".") for val in total_points]
+    traces.append((
+        go.Bar(
+            x=total_labels, 
+            y=total_points, 
+            name='Gesamtpunktzahl',
+            marker_color=bar_colors,
+            showlegend=False
+        ),
+        1, 2, {}
+    ))
+    
+    # Add text labels at y=0
+    traces.append((
+        go.Scatter(
+            x=total_labels,
+            y=[0] * len(total_points),
+            mode='text',
+            text=formatted_points,
+            textposition='top center',
+            textfont=dict(size=14, color='black'),
+            showlegend=False,
+            hoverinfo='skip'
+        ),
+        1, 2, {}
+    ))
+    return traces
+
+
+def _rank_timeline_traces(metrics: OverviewMetrics, point_budget: int) -> list[tuple]:
+    """Rank by cumulative Siegerpunkte after every round, one line per player (row 2)."""
+    player_colors = _player_colors(len(metrics.player_ids))
+    rank_points = [
+        lttb_indices(series.round_index, series.rank, point_budget)
+        for series in (metrics.series[metrics.player_ids[i]] for i in metrics.name_order)
+    ]
+    rank_scatter = go.Scattergl if sum(len(points) for points in rank_points) > WEBGL_THRESHOLD else go.Scatter
+    traces = []
+    for i, points in zip(metrics.name_order, rank_points):
+        series = metrics.series[metrics.player_ids[i]]
+        traces.append((
+            rank_scatter(
+                x=series.round_index[points],
+                y=series.rank[points],
+                mode='lines+markers',
+                name=metrics.player_labels[i],
+                line=dict(width=2, color=player_colors[i], shape='linear'),
+                marker=dict(size=6, color=player_colors[i]),
+                customdata=series.cumulative_siegerpunkte[points],
+                hovertemplate='<b>%{fullData.name}</b><br>Rang: %{y}<br>Siegerpunkte: %{customdata}<extra></extra>',
+                showlegend=False
+            ),
+            2, 1, {}
+        ))
+    return traces
+
+
+def _cumulative_timeline_traces(metrics: OverviewMetrics, point_budget: int) -> list[tuple]:
+    """Running Gesamtpunktzahl over all games, one line per player (row 3)."""
+    player_colors = _player_colors(len(metrics.player_ids))
+    cumulative_points = [
+        lttb_indices(series.game_index, series.cumulative_points, point_budget)
+        for series in (metrics.series[metrics.player_ids[i]] for i in metrics.name_order)
+    ]
+    cumulative_scatter = go.Scattergl if sum(len(points) for points in cumulative_points) > WEBGL_THRESHOLD else go.Scatter
+    traces = []
+    for i, points in zip(metrics.name_order, cumulative_points):
+        series = metrics.series[metrics.player_ids[i]]
+        traces.append((
+            cumulative_scatter(
+                x=series.game_index[points],
+                y=series.cumulative_points[points],
+                mode='lines+markers',
+                name=metrics.player_labels[i],
+                line=dict(width=2, color=player_colors[i]),
+                marker=dict(size=4, color=player_colors[i])
+            ),
+            3, 1, {}
+        ))
+    return traces
+
+
+def _points_distribution_traces(metrics: OverviewMetrics, point_budget: int) -> list[tuple]:
+    """Points per game as boxplot and average bars per player (row 4)."""
+    player_colors = _player_colors(len(metrics.player_ids))
+    traces = []
+    # Use consistent player order from Siegerpunkte ranking
+    for i, player_id in enumerate(metrics.player_ids):
+        series = metrics.series[player_id]
+        traces.append((
+            go.Box(
+                y=series.punkte_netto,
+                name=metrics.player_labels[i],
+                marker_color=player_colors[i],
+                showlegend=False
+            ),
+            4, 1, {'y': series.punkte_delta}
+        ))
+
+    traces.extend(_average_bar_traces(
+        metrics.player_labels, player_colors, metrics.avg_netto, metrics.avg_delta,
+        metrics.ci_netto, metrics.ci_delta, 'Ø Netto', 'Ø Delta', row=4
+    ))
+    return traces
+
+
+def _wind_advantage_traces(metrics: OverviewMetrics, point_budget: int) -> list[tuple]:
+    """Round wins by wind position (row 6)."""
+    # Round winners (rank 1 at final game of each round) by wind position
+    total_rounds = metrics.total_rounds
+    wind_win_counts = metrics.wind_wins
+    wind_win_rates = wind_win_counts / total_rounds * 100 if total_rounds > 0 else np.zeros(len(WIND_ORDER))
+    
+    # Bar chart, the expected 25% line is added with the layout
+    return [(
+        go.Bar(
+            x=WIND_ORDER,
+            y=wind_win_rates,
+            name='Gewinnrate',
+            marker_color=['#ff9999', '#ffcc99', '#99ccff', '#99ff99'],
+            text=wind_win_counts.tolist(),
+            textposition='inside',
+            insidetextanchor='start',
+            textfont=dict(size=17, color='black'),
+            showlegend=False
+        ),
+        6, 1, {}
+    )]
+
+
+def _wind_distribution_traces(metrics: OverviewMetrics, point_budget: int) -> list[tuple]:
+    """Points as wind_des_spiels (Spielführer) as boxplot and average bars per player (row 5)."""
+    player_colors = _player_colors(len(metrics.player_ids))
+    traces = []
+    # Total points as wind_des_spiels per round, one boxplot per player in Siegerpunkte ranking order
+    for i, player_id in enumerate(metrics.player_ids):
+        series = metrics.series[player_id]
+        traces.append((
+            go.Box(
+                y=series.netto_as_wind,
+                name=metrics.player_labels[i],
+                marker_color=player_colors[i],
+                showlegend=False
+            ),
+            5, 1, {'y': series.delta_as_wind}
+        ))
+
+    # Average points as wind_des_spiels, for players who have been Spielführer
+    as_wind = np.flatnonzero(metrics.games_as_wind > 0)
+    traces.extend(_average_bar_traces(
+        [metrics.player_labels[i] for i in as_wind],
+        [player_colors[i] for i in as_wind],
+        metrics.avg_netto_as_wind[as_wind],
+        metrics.avg_delta_as_wind[as_wind],
+        metrics.ci_netto_as_wind[as_wind],
+        metrics.ci_delta_as_wind[as_wind],
+        'Ø Netto als Wind',
+        'Ø Delta als Wind',
+        row=5
+    ))
+    return traces
+
+
+def _average_bar_traces(
+        labels: list[str],
+        colors: list[str],
+        avg_netto: np.ndarray,
+        avg_delta: np.ndarray,
+        ci_netto: np.ndarray,
+        ci_delta: np.ndarray,
+        netto_name: str,
+        delta_name: str,
+        row: int) -> list[tuple]:
+    """
+    Netto average bars with their bootstrap confidence intervals as error bars and their
+    text labels at y=0 in column 2 of the given row, the delta averages and intervals
+    are swapped in by the netto/delta toggle.
+    """
+    # Averages are NaN for players without a known value
+    formatted_netto = [f"{int(val):,}".replace(",", ".") if not np.isnan(val) else "" for val in avg_netto]
+    formatted_delta = [f"{int(val):,}".replace(",", ".") if not np.isnan(val) else "" for val in avg_delta]
+    return [
+        (
+            go.Bar(
+                x=labels,
+                y=avg_netto,
+                name=netto_name,
+                marker_color=colors,
+                error_y=dict(
+                    type='data',
+                    symmetric=False,
+                    array=ci_netto[:, 1] - avg_netto,
+                    arrayminus=avg_netto - ci_netto[:, 0],
+                    color='#555555',
+                    thickness=1.5
+                ),
+                showlegend=False
+            ),
+            row, 2, {
+                'y': avg_delta,
+                'name': delta_name,
+                'error_y.array': ci_delta[:, 1] - avg_delta,
+                'error_y.arrayminus': avg_delta - ci_delta[:, 0],
+            }
+        ),
+        (
+            go.Scatter(
+                x=labels,
+                y=[0] * len(avg_netto),
+                mode='text',
+                text=formatted_netto,
+                textposition='top center',
+                textfont=dict(size=14, color='black'),
+                showlegend=False,
+                hoverinfo='skip'
+            ),
+            row, 2, {'text': formatted_delta}
+        ),
+    ]
+
+
+# Trace order of the overview figure
+OVERVIEW_BLOCKS = [
+    _podium_traces,
+    _rank_timeline_traces,
+    _cumulative_timeline_traces,
+    _points_distribution_traces,
+    _wind_advantage_traces,
+    _wind_distribution_traces,
+]
+
+# Metrics of the process pool workers, sent once per worker by the pool initializer
+_worker_metrics = None
+
+
+def _init_chart_worker(metrics: OverviewMetrics) -> None:
+    global _worker_metrics
+    _worker_metrics = metrics
+
+
+def _build_chart_block(block, point_budget: int, metrics: OverviewMetrics | None = None) -> list[tuple]:
+    """
+    Run a chart block and convert its traces and delta values to plotly's JSON form
+    (arrays as base64 typed array specs), so only encoded dicts are passed back from a
+    worker and the assembled figure does not encode them again.
+    """
+    traces = block(metrics if metrics is not None else _worker_metrics, point_budget)
+    specs = go.Figure(data=[trace for trace, _, _, _ in traces]).to_dict()['data']
+    return [
+        (spec, row, col, {
+            attribute: _typed_array(value) if isinstance(value, np.ndarray) else value
+            for attribute, value in delta.items()
+        })
+        for spec, (_, row, col, delta) in zip(specs, traces)
+    ]
+
+
+def _build_chart_blocks(metrics: OverviewMetrics, point_budget: int, workers: int) -> list[list[tuple]]:
+    """Build all OVERVIEW_BLOCKS, in block order, serially or in a pool of worker processes."""
+    if workers <= 1:
+        return [_build_chart_block(block, point_budget, metrics) for block in OVERVIEW_BLOCKS]
+    with ProcessPoolExecutor(
+            max_workers=min(workers, len(OVERVIEW_BLOCKS)),
+            initializer=_init_chart_worker,
+            initargs=(metrics,)) as executor:
+        return list(executor.map(_build_chart_block, OVERVIEW_BLOCKS, [point_budget] * len(OVERVIEW_BLOCKS)))
+
+
+def _typed_array(values: np.ndarray) -> dict:
+    """
+    Encode a numeric array as base64 typed array spec, the compact format plotly uses for trace data.
+
+    Integers are stored with the smallest type that holds their range.
+    """
+    if np.issubdtype(values.dtype, np.integer):
+        low, high = (values.min(), values.max()) if len(values) else (0, 0)
+        for dtype in (np.int8, np.int16, np.int32, np.int64):
+            if np.iinfo(dtype).min <= low and high <= np.iinfo(dtype).max:
+                break
+        values = values.astype(dtype)
+    else:
+        values = values.astype(np.float64)
+    values = values.astype(values.dtype.newbyteorder('<'))
+    return {'dtype': values.dtype.str[1:], 'bdata': base64.b64encode(values.tobytes()).decode('ascii')}
+
+
+# Player pages: one pre-rendered figure per player, embedded as JSON and plotted when the
+# page is opened for the first time (see PLAYER_PAGES_JS)
+
+def _create_player_figure(detail: PlayerDetail, point_budget: int = TIMELINE_POINT_BUDGET) -> go.Figure:
+    """
+    Create the page figure of one player from its metrics.compute_player_details aggregates.
+
+    Visualizations:
+    1. Laufende Summe der Gesamtpunktzahl über alle Spiele
+    2. Platzierungen und Verteilung der Hände
+    3. Performance je Windposition und als Spielführer
+    4. Beste und schlechteste Spiele
+    """
+    fig = make_subplots(
+        rows=4, cols=2,
+        subplot_titles=(
+            'Laufende Summe der Gesamtpunktzahl',
+            'Platzierungen je Runde',
+            'Verteilung der Hände (Punkte vor Verdopplung)',
+            'Ø Nettopunkte je Windposition',
+            'Ø Nettopunkte als Spielführer',
+            'Beste Spiele',
+            'Schlechteste Spiele'
+        ),
+        specs=[
+            [{'type': 'scatter', 'colspan': 2}, None],
+            [{'type': 'bar'}, {'type': 'histogram'}],
+            [{'type': 'bar'}, {'type': 'bar'}],
+            [{'type': 'table'}, {'type': 'table'}]
+        ],
+        vertical_spacing=0.08,
+        horizontal_spacing=0.12,
+        row_heights=[0.3, 0.22, 0.22, 0.26]
     )
 
+    # History, downsampled like the overview timelines
+    points = lttb_indices(detail.game_index, detail.cumulative_points, point_budget)
+    timeline_scatter = go.Scattergl if len(points) > WEBGL_THRESHOLD else go.Scatter
+    fig.add_trace(timeline_scatter(
+        x=detail.game_index[points],
+        y=detail.cumulative_points[points],
+        mode='lines+markers',
+        name='Gesamtpunktzahl',
+        line=dict(width=2, color=PLAYER_COLORS[0]),
+        marker=dict(size=4, color=PLAYER_COLORS[0])
+    ), row=1, col=1)
+
+    fig.add_trace(go.Bar(
+        x=['1. Platz', '2. Platz', '3. Platz', '4. Platz'],
+        y=detail.placements,
+        marker_color=PODIUM_COLORS,
+        text=detail.placements.tolist(),
+        textposition='auto'
+    ), row=2, col=1)
+
+    fig.add_trace(go.Histogram(
+        x=detail.punkte_brutto,
+        marker_color=PLAYER_COLORS[2]
+    ), row=2, col=2)
+
+    # Performance per wind position and as Spielführer, with game and win counts in the hover
+    fig.add_trace(_player_performance_bar(
+        WIND_ORDER, detail.avg_netto_per_wind, detail.games_per_wind, detail.wins_per_wind, PLAYER_COLORS[1]
+    ), row=3, col=1)
+    fig.add_trace(_player_performance_bar(
+        ['Spielführer', 'Mitspieler'], detail.avg_netto_as_wind, detail.games_as_wind, detail.wins_as_wind,
+        PLAYER_COLORS[4]
+    ), row=3, col=2)
+
+    # Before the tables, add_hline only handles figures of cartesian traces
+    fig.add_hline(y=0, line_color='gray', row=3, col=1)
+    fig.add_hline(y=0, line_color='gray', row=3, col=2)
+
+    fig.add_trace(_player_games_table(detail.best_games), row=4, col=1)
+    fig.add_trace(_player_games_table(detail.worst_games), row=4, col=2)
+
+    fig.update_xaxes(title_text="Spielnummer (alle Runden)", row=1, col=1)
+    fig.update_yaxes(title_text="Gesamtpunktzahl", row=1, col=1)
+    fig.update_yaxes(title_text="Runden", row=2, col=1)
+    fig.update_xaxes(title_text="Punkte", row=2, col=2)
+    fig.update_yaxes(title_text="Spiele", row=2, col=2)
+    fig.update_yaxes(title_text="Ø Nettopunkte", row=3, col=1)
+    fig.update_yaxes(title_text="Ø Nettopunkte", row=3, col=2)
+
+    total_points = f"{detail.total_points:,}".replace(",", ".")
+    fig.update_layout(
+        height=1500,
+        title_text=(
+            f"{detail.label} - {detail.games} Spiele in {detail.rounds} Runden | "
+            f"Siegerpunkte {detail.siegerpunkte} | Gesamtpunktzahl {total_points}"
+        ),
+        title_font_size=24,
+        showlegend=False,
+        template='plotly_white'
+    )
+    return fig
+
+
+def _player_performance_bar(
+        labels: list[str],
+        averages: np.ndarray,
+        games: np.ndarray,
+        wins: np.ndarray,
+        color: str) -> go.Bar:
+    """Average netto points per category, categories without games stay empty."""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        win_rates = wins / games * 100
+    return go.Bar(
+        x=labels,
+        y=averages,
+        marker_color=color,
+        text=[f"{games_count} Spiele" for games_count in games.tolist()],
+        textposition='auto',
+        customdata=np.column_stack([games, np.nan_to_num(win_rates)]),
+        hovertemplate='%{x}<br>Ø Nettopunkte: %{y:.0f}<br>Spiele: %{customdata[0]}'
+                      '<br>Gewinnrate: %{customdata[1]:.0f} %<extra></extra>'
+    )
+
+
+def _player_games_table(df_games: pd.DataFrame) -> go.Table:
+    """Table of single games, see metrics.GAME_TABLE_COLUMNS."""
+    starts = [
+        start.to_pydatetime().astimezone().strftime('%d.%m.%Y %H:%M') if not pd.isna(start) else '–'
+        for start in df_games['spielstart']
+    ]
+    return go.Table(
+        header=dict(
+            values=['Spiel', 'Datei', 'Nr.', 'Beginn', 'Netto', 'Delta'],
+            fill_color='#2c3e50',
+            font=dict(color='white', size=13),
+            align='left'
+        ),
+        cells=dict(
+            values=[
+                df_games['game_index'].tolist(),
+                df_games['dateiname'].tolist(),
+                df_games['spiel_index'].tolist(),
+                starts,
+                df_games['punkte_netto'].tolist(),
+                df_games['punkte_delta'].tolist(),
+            ],
+            align='left',
+            height=26
+        )
+    )
+
+
+def _figure_json(fig: go.Figure) -> str:
+    """Figure as JSON, ready to be embedded in a script element."""
+    # A literal "</" would end the script element early
+    return fig.to_json().replace('</', '<\\/')
+
+
+def _render_player_page(detail: PlayerDetail, point_budget: int) -> str:
+    """Player page figure as JSON, ready to be embedded in a script element."""
+    return _figure_json(_create_player_figure(detail, point_budget))
+
+
+def _render_player_pages(details: list[PlayerDetail], point_budget: int, workers: int) -> list[str]:
+    """Render all player pages, in order, serially or in a pool of worker processes."""
+    if workers <= 1 or len(details) <= 1:
+        return [_render_player_page(detail, point_budget) for detail in details]
+    with ProcessPoolExecutor(max_workers=min(workers, len(details))) as executor:
+        return list(executor.map(_render_player_page, details, [point_budget] * len(details)))
+
+
+def _create_rating_figure(
+        ratings: RatingHistory,
+        player_names: dict[int, str],
+        point_budget: int = TIMELINE_POINT_BUDGET) -> go.Figure:
+    """
+    Create the rating page figure: current rating podium and rating after every round.
+
+    Visualizations:
+    1. Podium - aktuelles Rating
+    2. Rating nach jeder Runde, one line per player
+    """
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=('Podium - aktuelles Rating', 'Rating nach jeder Runde'),
+        vertical_spacing=0.12,
+        row_heights=[0.4, 0.6]
+    )
+
+    # Podium, rating descending, ties by name
+    ranking = sorted(ratings.current, key=lambda player: (-ratings.current[player], player_names[player]))
+    current = [ratings.current[player] for player in ranking]
+    fig.add_trace(go.Bar(
+        x=[player_names[player] for player in ranking],
+        y=current,
+        marker_color=[PODIUM_COLORS[i] if i < len(PODIUM_COLORS) else '#A9A9A9' for i in range(len(ranking))],
+        text=[f"{rating:.0f}" for rating in current],
+        textposition='inside',
+        insidetextanchor='start',
+        textfont=dict(size=17, color='black'),
+        showlegend=False
+    ), row=1, col=1)
+
+    # History: all seats flattened and grouped by player once, rounds stay ascending per player
+    seat_players = ratings.players.ravel()
+    seat_rounds = np.repeat(ratings.round_index, ratings.players.shape[1])
+    seat_ratings = ratings.ratings.ravel()
+    order = np.argsort(seat_players, kind='stable')
+    players, starts = np.unique(seat_players[order], return_index=True)
+    bounds = np.append(starts, len(order))
+    by_name = sorted(range(len(players)), key=lambda i: player_names[players[i]])
+    timelines = []
+    for i in by_name:
+        rows = order[bounds[i]:bounds[i + 1]]
+        points = lttb_indices(seat_rounds[rows], seat_ratings[rows], point_budget)
+        timelines.append((players[i], seat_rounds[rows][points], seat_ratings[rows][points]))
+    timeline_scatter = go.Scattergl if sum(len(x) for _, x, _ in timelines) > WEBGL_THRESHOLD else go.Scatter
+    for color, (player, x, y) in zip(_player_colors(len(timelines)), timelines):
+        fig.add_trace(timeline_scatter(
+            x=x,
+            y=y,
+            mode='lines+markers',
+            name=player_names[player],
+            line=dict(width=2, color=color),
+            marker=dict(size=4, color=color),
+            hovertemplate='Runde %{x}<br>Rating %{y:.0f}'
+        ), row=2, col=1)
+
+    fig.add_hline(y=RATING_INITIAL, line_dash='dash', line_color='gray', row=2, col=1)
+    low, high = min(current), max(current)
+    padding = max(high - low, 50) * 0.2
+    fig.update_yaxes(title_text="Rating", range=[low - padding, high + padding], row=1, col=1)
+    fig.update_xaxes(title_text="Rundennummer", row=2, col=1)
+    fig.update_yaxes(title_text="Rating", row=2, col=1)
+    fig.update_layout(
+        height=1100,
+        title_text=f"Rating (Elo, K = {RATING_K:.0f}) - {len(ratings.round_ids)} Runden",
+        title_font_size=24,
+        template='plotly_white'
+    )
+    return fig
+
+
+def _create_head_to_head_figure(head_to_head: HeadToHead) -> go.Figure:
+    """
+    Create the head-to-head page figure, rows are the players, columns their opponents.
+
+    Visualizations:
+    1. Punkte gegeneinander (netto): points received minus points paid
+    2. Ø Punkte je gemeinsamem Spiel
+    3. Gemeinsame Spiele
+    """
+    labels = head_to_head.labels
+    together = head_to_head.games.astype(np.float64)
+    np.fill_diagonal(together, np.nan)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        per_game = head_to_head.points / together
+    net_points = head_to_head.points.astype(np.float64)
+    net_points[np.isnan(together)] = np.nan
+
+    fig = make_subplots(
+        rows=3, cols=1,
+        subplot_titles=(
+            'Punkte gegeneinander (netto, Zeile gegen Spalte)',
+            'Ø Punkte je gemeinsamem Spiel',
+            'Gemeinsame Spiele'
+        ),
+        vertical_spacing=0.08
+    )
+
+    customdata = np.stack([head_to_head.won, head_to_head.lost, head_to_head.games], axis=-1)
+    hover = ('%{y} gegen %{x}<br>Netto: %{z:,.0f}<br>Erhalten: %{customdata[0]:,}'
+             '<br>Gezahlt: %{customdata[1]:,}<br>Gemeinsame Spiele: %{customdata[2]}<extra></extra>')
+    for row, values, text_format in ((1, net_points, '%{z:,.0f}'), (2, per_game, '%{z:,.0f}')):
+        limit = np.nanmax(np.abs(values)) if np.isfinite(values).any() else 1
+        fig.add_trace(go.Heatmap(
+            x=labels,
+            y=labels,
+            z=values,
+            zmid=0,
+            zmin=-limit,
+            zmax=limit,
+            colorscale='RdBu',
+            texttemplate=text_format,
+            customdata=customdata,
+            hovertemplate=hover,
+            colorbar=dict(len=0.28, y=1 - (row - 1) * 0.36, yanchor='top')
+        ), row=row, col=1)
+    fig.add_trace(go.Heatmap(
+        x=labels,
+        y=labels,
+        z=together,
+        colorscale='Blues',
+        texttemplate='%{z}',
+        hovertemplate='%{y} und %{x}<br>Gemeinsame Spiele: %{z}<extra></extra>',
+        colorbar=dict(len=0.28, y=0.28, yanchor='top')
+    ), row=3, col=1)
+
+    for row in (1, 2, 3):
+        fig.update_yaxes(autorange='reversed', row=row, col=1)
+
+    title = "Direkter Vergleich - aus den gespeicherten Spielen rekonstruierte Zahlungen"
+    if head_to_head.mismatched_games:
+        title += f" ({head_to_head.mismatched_games} Spiele weichen von punkte_delta ab)"
+    fig.update_layout(
+        height=max(1200, 3 * (120 + 45 * len(labels))),
+        title_text=title,
+        title_font_size=22,
+        template='plotly_white',
+        separators=',.'
+    )
+    return fig
+
+
+def _game_span(first: int, last: int) -> str:
+    return f"Spiel {first}" if first == last else f"Spiele {first}–{last}"
+
+
+def _create_form_figure(form: FormAnalytics, point_budget: int = TIMELINE_POINT_BUDGET) -> go.Figure:
+    """
+    Create the form page figure from the form.compute_form analytics.
+
+    Visualizations:
+    1. Form: Ø Delta der letzten FORM_WINDOW Spiele, one line per player
+    2. Rekorde: current form and streak, longest streaks, hot and cold runs
+    """
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=(f'Form - Ø Delta der letzten {FORM_WINDOW} Spiele', 'Serien und Phasen'),
+        specs=[[{'type': 'scatter'}], [{'type': 'table'}]],
+        vertical_spacing=0.1,
+        row_heights=[0.6, 0.4]
+    )
+
+    # Rolling averages, downsampled like the overview timelines
+    timelines = []
+    for game_index, rolling_delta in zip(form.game_index, form.rolling_delta):
+        points = lttb_indices(game_index, rolling_delta, point_budget)
+        timelines.append((game_index[points], rolling_delta[points]))
+    timeline_scatter = go.Scattergl if sum(len(x) for x, _ in timelines) > WEBGL_THRESHOLD else go.Scatter
+    for color, label, (x, y) in zip(_player_colors(len(timelines)), form.labels, timelines):
+        fig.add_trace(timeline_scatter(
+            x=x,
+            y=y,
+            mode='lines',
+            name=label,
+            line=dict(width=2, color=color),
+            hovertemplate='Spiel %{x}<br>Ø Delta %{y:,.0f}'
+        ), row=1, col=1)
+
+    # Before the table, add_hline only handles figures of cartesian traces
+    fig.add_hline(y=0, line_dash='dash', line_color='gray', row=1, col=1)
+
+    def streak(record: np.ndarray) -> str:
+        games, first, last = record.tolist()
+        return f"{games} ({_game_span(first, last)})" if games else '–'
+
+    def run(record: np.ndarray) -> str:
+        points, first, last = record.tolist()
+        return f"{points:,} ({_game_span(first, last)})".replace(",", ".") if first else '–'
+
+    current_streaks = [
+        f"{abs(games)} {'gewonnen' if games > 0 else 'verloren'}" if games else '–'
+        for games in form.current_streak.tolist()
+    ]
+    fig.add_trace(go.Table(
+        header=dict(
+            values=[
+                'Spieler', f'Ø Delta (letzte {FORM_WINDOW})', 'Aktuelle Serie', 'Längste Gewinnserie',
+                'Längste Verlustserie', f'Beste {FORM_WINDOW} Spiele', f'Schwächste {FORM_WINDOW} Spiele'
+            ],
+            fill_color='#2c3e50',
+            font=dict(color='white', size=13),
+            align='left'
+        ),
+        cells=dict(
+            values=[
+                form.labels,
+                [f"{value:,.0f}".replace(",", ".") for value in form.current_form.tolist()],
+                current_streaks,
+                [streak(record) for record in form.win_streak],
+                [streak(record) for record in form.loss_streak],
+                [run(record) for record in form.hot_run],
+                [run(record) for record in form.cold_run],
+            ],
+            align='left',
+            height=26
+        )
+    ), row=2, col=1)
+
+    fig.update_xaxes(title_text="Spielnummer (alle Runden)", row=1, col=1)
+    fig.update_yaxes(title_text="Ø Delta", row=1, col=1)
+    fig.update_layout(
+        height=max(1100, 800 + 26 * len(form.labels)),
+        title_text="Form - gewonnene Spiele mit Delta > 0, verlorene mit Delta < 0",
+        title_font_size=24,
+        template='plotly_white'
+    )
     return fig
@@ -0,0 +1,277 @@
+"""
+Fast reader for the game workbooks written by `save_dataframes_to_excel`.
+
+The workbooks always contain the sheets Spielinfo, Runden and Endstand with a
+fixed header. Instead of going through pandas and openpyxl, the xlsx zip is
+opened directly and the sheet XML streams are iterparsed into typed NumPy
+columns. Anything that does not match the known layout raises
+UnsupportedWorkbookError, so callers can fall back to `pd.read_excel`.
+"""
+import posixpath
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+# Expected header and column type per sheet, in sheet order
+SPIELINFO_SCHEMA = (
+    ('Spielstart', str),
+    ('Spielende', str),
+    ('Dauer (Sekunden)', int),
+    ('Dauer (formatiert)', str),
+)
+RUNDEN_SCHEMA = (
+    ('Runde', int),
+    ('Wind der Runde', str),
+    ('Gewinner', str),
+    ('Spieler', str),
+    ('Wind', str),
+    ('Basispunkte', int),
+    ('Verdopplungen', int),
+    ('Rundenpunkte', int),
+    ('Punkteänderung', int),
+    ('Laufende Summe', int),
+    ('Rang', int),
+)
+# Timing columns only exist in files written since games record their timestamps
+RUNDEN_TIMING_SCHEMA = (
+    ('Spielstart', str),
+    ('Spielende', str),
+)
+ENDSTAND_SCHEMA = (
+    ('Wind', str),
+    ('Spieler', str),
+    ('Laufende Summe', int),
+    ('Rang', int),
+)
+
+# Strings pandas would read as NaN, such cells are left to pd.read_excel
+_NA_STRINGS = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+})
+
+_MISSING = object()
+
+
+class UnsupportedWorkbookError(ValueError):
+    """Raised when a workbook does not match the known game workbook layout."""
+
+
+def empty_metadata_sheet() -> pd.DataFrame:
+    """Spielinfo sheet without data, as read from a workbook with header only."""
+    return pd.DataFrame({name: np.empty(0, dtype=object) for name, _ in SPIELINFO_SCHEMA})
+
+
+def read_game_workbook(
+        file_path: Path,
+        timings: dict | None = None) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Read the three sheets of a game workbook.
+
+    Args:
+        file_path: Path to the xlsx file
+        timings: Optional dict that receives the durations in seconds of the
+            'open' (zip and workbook structure) and 'parse' (sheets) stages
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: (df_metadata, df_games, df_standings)
+        equal to what `pd.read_excel(file_path, sheet_name=0/1/2)` returns. For
+        old workbooks without Spielinfo sheet df_metadata is empty.
+
+    Raises:
+        UnsupportedWorkbookError: If the file is not a workbook with the known layout
+    """
+    start = time.perf_counter()
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            sheet_paths, shared_strings_path = _locate_parts(archive)
+            if len(sheet_paths) not in (2, 3):
+                raise UnsupportedWorkbookError(f"Expected 2 or 3 sheets, found {len(sheet_paths)}")
+            open_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            shared_strings = _read_shared_strings(archive, shared_strings_path)
+            schemas = (
+                (SPIELINFO_SCHEMA,),
+                (RUNDEN_SCHEMA + RUNDEN_TIMING_SCHEMA, RUNDEN_SCHEMA),
+                (ENDSTAND_SCHEMA,),
+            )
+            # Old files without a Spielinfo sheet only contain Runden and Endstand
+            if len(sheet_paths) == 2:
+                schemas = schemas[1:]
+            sheets = tuple(
+                _read_sheet(archive, sheet_path, shared_strings, sheet_schemas)
+                for sheet_path, sheet_schemas in zip(sheet_paths, schemas)
+            )
+            if len(sheets) == 2:
+                sheets = (empty_metadata_sheet(), *sheets)
+    except (zipfile.BadZipFile, OSError, KeyError, IndexError, ET.ParseError, ValueError) as e:
+        if isinstance(e, UnsupportedWorkbookError):
+            raise
+        raise UnsupportedWorkbookError(f"Cannot read {file_path.name}: {e}") from e
+
+    if timings is not None:
+        timings['open'] = open_time
+        timings['parse'] = time.perf_counter() - start
+    return sheets
+
+
+def _locate_parts(archive: zipfile.ZipFile) -> tuple[list[str], str | None]:
+    """Resolve the worksheet paths in sheet order and the shared strings path."""
+    workbook = ET.fromstring(archive.read('xl/workbook.xml'))
+    relationships = ET.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+
+    targets = {}
+    shared_strings_path = None
+    for rel in relationships.iter(f'{_NS_PKG_REL}Relationship'):
+        target = rel.get('Target')
+        # Targets are either absolute within the package or relative to xl/
+        path = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join('xl', target))
+        targets[rel.get('Id')] = path
+        if rel.get('Type', '').endswith('/sharedStrings'):
+            shared_strings_path = path
+
+    sheet_paths = [
+        targets[sheet.get(f'{_NS_REL}id')]
+        for sheet in workbook.iter(f'{_NS_MAIN}sheet')
+    ]
+    return sheet_paths, shared_strings_path
+
+
+def _text_of(element: ET.Element) -> str:
+    """Concatenate the text runs of a shared or inline string, skipping phonetic hints."""
+    plain = element.find(f'{_NS_MAIN}t')
+    if plain is not None:
+        return plain.text or ''
+    return ''.join(
+        run.findtext(f'{_NS_MAIN}t', default='')
+        for run in element.iter(f'{_NS_MAIN}r')
+    )
+
+
+def _read_shared_strings(archive: zipfile.ZipFile, path: str | None) -> list[str]:
+    if path is None:
+        return []
+    shared_strings = []
+    with archive.open(path) as stream:
+        for _, element in ET.iterparse(stream):
+            if element.tag == f'{_NS_MAIN}si':
+                shared_strings.append(_text_of(element))
+                element.clear()
+    return shared_strings
+
+
+def _column_index(reference: str) -> int:
+    """Zero-based column index of a cell reference like 'M17'."""
+    index = 0
+    for char in reference:
+        if char.isdigit():
+            break
+        index = index * 26 + (ord(char) - 64)
+    return index - 1
+
+
+def _cell_value(cell: ET.Element, shared_strings: list[str]):
+    cell_type = cell.get('t', 'n')
+    if cell_type == 'inlineStr':
+        inline = cell.find(f'{_NS_MAIN}is')
+        return _MISSING if inline is None else _text_of(inline)
+
+    value = cell.findtext(f'{_NS_MAIN}v')
+    if value is None:
+        return _MISSING
+    if cell_type == 's':
+        return shared_strings[int(value)]
+    if cell_type == 'str':
+        return value
+    if cell_type == 'n':
+        number = float(value)
+        # pandas reads integral floats from openpyxl as int
+        return int(number) if number.is_integer() else number
+    raise UnsupportedWorkbookError(f"Unsupported cell type '{cell_type}'")
+
+
+def _read_rows(archive: zipfile.ZipFile, path: str, shared_strings: list[str]) -> list[list]:
+    """Stream all rows of a sheet, cells missing from a row are _MISSING."""
+    rows = []
+    with archive.open(path) as stream:
+        for _, element in ET.iterparse(stream):
+            if element.tag != f'{_NS_MAIN}row':
+                continue
+            row = []
+            for cell in element.iter(f'{_NS_MAIN}c'):
+                reference = cell.get('r')
+                index = _column_index(reference) if reference else len(row)
+                if index < len(row):
+                    raise UnsupportedWorkbookError("Cells out of order")
+                row.extend([_MISSING] * (index - len(row)))
+                row.append(_cell_value(cell, shared_strings))
+            if element.get('r') and int(element.get('r')) != len(rows) + 1:
+                raise UnsupportedWorkbookError("Rows are not contiguous")
+            rows.append(row)
+            element.clear()
+    return rows
+
+
+def _read_sheet(
+        archive: zipfile.ZipFile,
+        path: str,
+        shared_strings: list[str],
+        schemas: tuple[tuple[tuple[str, type], ...], ...]) -> pd.DataFrame:
+    rows = _read_rows(archive, path, shared_strings)
+    if not rows:
+        raise UnsupportedWorkbookError("Sheet without header")
+
+    header = rows[0]
+    schema = next(
+        (s for s in schemas if header == [name for name, _ in s]),
+        None
+    )
+    if schema is None:
+        raise UnsupportedWorkbookError(f"Unexpected header {header}")
+
+    # Trailing empty rows are dropped by pd.read_excel as well
+    data_rows = rows[1:]
+    while data_rows and all(value is _MISSING for value in data_rows[-1]):
+        data_rows.pop()
+
+    if not data_rows:
+        return pd.DataFrame({name: np.empty(0, dtype=object) for name, _ in schema})
+
+    width = len(schema)
+    columns = [[] for _ in range(width)]
+    for row in data_rows:
+        if len(row) > width:
+            raise UnsupportedWorkbookError("Row wider than header")
+        if all(value is _MISSING for value in row):
+            raise UnsupportedWorkbookError("Empty row inside data")
+        row = row + [_MISSING] * (width - len(row))
+        for column, value in zip(columns, row):
+            column.append(value)
+
+    return pd.DataFrame({
+        name: _to_array(values, column_type)
+        for (name, column_type), values in zip(schema, columns)
+    })
+
+
+def _to_array(values: list, column_type: type) -> np.ndarray:
+    """Convert one column to the dtype pandas would infer for it."""
+    if column_type is int:
+        if not all(type(value) is int for value in values):
+            raise UnsupportedWorkbookError("Non-integer value in integer column")
+        return np.array(values, dtype=np.int64)
+
+    values = [_MISSING if value == '' else value for value in values]
+    if any(value is not _MISSING and (type(value) is not str or value in _NA_STRINGS) for value in values):
+        raise UnsupportedWorkbookError("Non-text value in text column")
+    if all(value is _MISSING for value in values):
+        return np.full(len(values), np.nan)
+    return np.array([np.nan if value is _MISSING else value for value in values], dtype=object)
@@ -1,5 +1,8 @@
 import logging
+import os
+import uuid
 from logging import getLogger, DEBUG
+from pathlib import Path
 
 
 def setup_logger(logger_name: str, file_name: str = 'app.log', verbose: bool = True) -> logging.Logger:
@@ -15,8 +18,9 @@ def setup_logger(logger_name: str, file_name: str = 'app.log', verbose: bool = T
     logger = getLogger(logger_name)
     logger.setLevel(DEBUG)
 
-    # Create a file handler which logs even debug messages, overwriting old logs
-    file_handler = logging.FileHandler(file_name, mode='w', encoding='utf-8')
+    # Create a file handler which logs even debug messages, overwriting old logs;
+    # the file is only created once something is logged
+    file_handler = logging.FileHandler(file_name, mode='w', encoding='utf-8', delay=True)
     file_handler.setLevel(DEBUG)
 
     # Create console handler for simple logging
@@ -39,6 +43,30 @@ def setup_logger(logger_name: str, file_name: str = 'app.log', verbose: bool = T
     
     return logger
 
+def write_bytes_atomic(file_path: Path, content: bytes) -> None:
+    """Write a file through a uniquely named temporary file next to it and swap it in.
+
+    Readers never see a partial file and concurrent writers do not mix their
+    contents, the last write wins. The temporary file is removed if writing fails.
+
+    Args:
+        file_path: File to write
+        content: Content of the file
+    """
+    # A random name instead of tempfile.mkstemp, whose private permissions would be kept by the target
+    temp_file = file_path.with_name(f"{file_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(temp_file, 'xb') as f:
+            f.write(content)
+        os.replace(temp_file, file_path)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+def write_text_atomic(file_path: Path, text: str) -> None:
+    """Write a text file as UTF-8 atomically, see write_bytes_atomic."""
+    write_bytes_atomic(file_path, text.encode('utf-8'))
+
 def calculate_ranks(items, key_func=lambda x: x.points):
     """Calculate ranks for items, handling ties correctly (1,2,2,4).
     
@@ -0,0 +1,137 @@
+"""
+Records and storage of the game folder manifest.
+
+Kept free of the evaluation pipeline, so saving a game only depends on
+pandas: data_export builds the record of a new workbook from the frames it
+has just written, and the loader of the evaluation builds the records of
+changed files from the sheets it reads anyway. Scanning the folder and the
+summaries are in archive_manifest.py.
+"""
+import json
+from pathlib import Path
+import pandas as pd
+from backend.helper_functions import setup_logger, write_text_atomic
+
+logger = setup_logger(__name__)
+
+MANIFEST_FILENAME = "myjongg_manifest.json"
+MANIFEST_VERSION = 2
+
+# Format versions of the game workbooks
+FORMAT_WITHOUT_TIMING = 1  # Runden sheet without Spielstart/Spielende columns
+FORMAT_WITH_TIMING = 2
+
+# Siegerpunkte per final rank of a round, all other ranks get 0
+WINNING_POINTS = {1: 2, 2: 1}
+
+
+def file_fingerprint(file_path: Path) -> str:
+    """Cheap fingerprint of a file from its size and modification time."""
+    stat = file_path.stat()
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def _optional(value):
+    """Convert missing values read from Excel to None and NumPy scalars to Python."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return value.item() if hasattr(value, 'item') else value
+
+
+def build_record(
+        file_path: Path,
+        df_metadata: pd.DataFrame,
+        df_games: pd.DataFrame,
+        df_standings: pd.DataFrame) -> dict:
+    """
+    Summarize the raw sheets of one game workbook.
+
+    Args:
+        file_path: Path to the workbook, used for the name and fingerprint
+        df_metadata: Spielinfo sheet (Spielstart, Spielende, Dauer (Sekunden), Dauer (formatiert))
+        df_games: Runden sheet, one row per player and game
+        df_standings: Endstand sheet (Wind, Spieler, Laufende Summe, Rang)
+
+    Returns:
+        dict: Manifest record of the file
+    """
+    has_metadata = not df_metadata.empty
+    start = _optional(df_metadata.iloc[0, 0]) if has_metadata else None
+    end = _optional(df_metadata.iloc[0, 1]) if has_metadata else None
+
+    standings = [
+        {
+            'wind': _optional(wind),
+            'spieler': _optional(player),
+            'punktestand': _optional(points),
+            'rang': _optional(rank),
+            'siegerpunkte': WINNING_POINTS.get(_optional(rank), 0),
+        }
+        for wind, player, points, rank in df_standings.iloc[:, :4].itertuples(index=False)
+    ]
+    standings.sort(key=lambda entry: (entry['rang'] is None, entry['rang'] or 0))
+
+    return {
+        'file': file_path.name,
+        'fingerprint': file_fingerprint(file_path),
+        'format_version': FORMAT_WITH_TIMING if len(df_games.columns) > 11 else FORMAT_WITHOUT_TIMING,
+        'valid': not df_games.empty and not df_standings.empty,
+        'players': {entry['wind']: entry['spieler'] for entry in standings},
+        'start': start,
+        'end': end,
+        'standings': standings,
+        'siegerpunkte': {entry['spieler']: entry['siegerpunkte'] for entry in standings},
+        'games': int(df_games.iloc[:, 0].nunique()) if not df_games.empty else 0,
+    }
+
+
+def invalid_record(file_path: Path, error: str) -> dict:
+    """Record of a workbook that could not be read, error is the exception class name."""
+    return {
+        'file': file_path.name,
+        'fingerprint': file_fingerprint(file_path),
+        'valid': False,
+        'error': error,
+    }
+
+
+def pending_record(file_path: Path) -> dict:
+    """Placeholder of a new or changed workbook whose sheets have not been summarized yet."""
+    return {
+        'file': file_path.name,
+        'fingerprint': file_fingerprint(file_path),
+        'valid': False,
+        'pending': True,
+    }
+
+
+def is_pending(record: dict | None) -> bool:
+    return record is None or record.get('pending', False)
+
+
+def load_manifest(folder_path: Path) -> dict:
+    """Load the stored manifest, an empty manifest if it is missing or outdated."""
+    manifest_file = folder_path / MANIFEST_FILENAME
+    empty = {'version': MANIFEST_VERSION, 'files': {}}
+    if not manifest_file.exists():
+        return empty
+    try:
+        with open(manifest_file, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read manifest {manifest_file} - rebuilding. Error: {e}")
+        return empty
+    if manifest.get('version') != MANIFEST_VERSION:
+        return empty
+    return manifest
+
+
+def save_manifest(folder_path: Path, manifest: dict) -> None:
+    write_text_atomic(folder_path / MANIFEST_FILENAME, json.dumps(manifest, indent=2, ensure_ascii=False))
+
+
+def update_manifest_record(folder_path: Path, record: dict) -> None:
+    """Insert or replace the record of one file, e.g. right after saving it."""
+    manifest = load_manifest(folder_path)
+    manifest['files'][record['file']] = record
+    save_manifest(folder_path, manifest)
@@ -0,0 +1,129 @@
+"""
+Registry of all players of a game folder.
+
+Player names are typed freely at the start of every game, so the same
+person may appear as "Anna", "anna " or "Anni". The registry maps the
+normalized form of every known name and of additional aliases to a stable
+small integer ID and a display name. It is stored as JSON in the game folder
+and may be edited by hand to add aliases, e.g.
+
+    {"id": 1, "name": "Anna", "aliases": ["anni"]}
+
+Evaluations join and group on the IDs and only map back to display names
+when rendering.
+"""
+import json
+import re
+import unicodedata
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from backend.helper_functions import setup_logger, write_text_atomic
+
+logger = setup_logger(__name__)
+
+REGISTRY_FILENAME = "myjongg_spieler.json"
+REGISTRY_VERSION = 1
+
+
+def clean_player_name(name: str) -> str:
+    """Display form of a typed name: Unicode NFC, trimmed, single spaces."""
+    return re.sub(r"\s+", " ", unicodedata.normalize('NFC', str(name))).strip()
+
+
+def normalize_player_name(name: str) -> str:
+    """Lookup key of a name, equal for names that only differ in case or whitespace."""
+    return clean_player_name(name).casefold()
+
+
+def load_registry(folder_path: Path) -> dict:
+    """Load the stored registry, an empty registry if it is missing or unreadable."""
+    registry_file = folder_path / REGISTRY_FILENAME
+    empty = {'version': REGISTRY_VERSION, 'players': []}
+    if not registry_file.exists():
+        return empty
+    try:
+        with open(registry_file, encoding='utf-8') as f:
+            registry = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read player registry {registry_file}. Error: {e}")
+        return empty
+    if registry.get('version') != REGISTRY_VERSION:
+        return empty
+    return registry
+
+
+def save_registry(folder_path: Path, registry: dict) -> None:
+    write_text_atomic(folder_path / REGISTRY_FILENAME, json.dumps(registry, indent=2, ensure_ascii=False))
+
+
+def _lookup(registry: dict) -> dict[str, int]:
+    """Normalized name and aliases of every player mapped to the player ID."""
+    lookup = {}
+    for player in registry['players']:
+        for alias in [player['name'], *player.get('aliases', [])]:
+            lookup.setdefault(normalize_player_name(alias), player['id'])
+    return lookup
+
+
+def player_ids(registry: dict, names) -> np.ndarray:
+    """
+    Look up the IDs of player names, registering unknown players.
+
+    Each distinct name is normalized and looked up once. New players get the
+    next free ID and their cleaned spelling as display name; the registry is
+    changed in place and has to be saved by the caller.
+
+    Args:
+        registry: Player registry as returned by load_registry
+        names: Array-like of player names, missing and blank names get ID -1
+
+    Returns:
+        np.ndarray: int64 player ID per name
+    """
+    codes, unique_names = pd.factorize(pd.Series(names, dtype=object))
+    lookup = _lookup(registry)
+    next_id = max((player['id'] for player in registry['players']), default=0) + 1
+
+    unique_ids = np.empty(len(unique_names), dtype=np.int64)
+    for i, name in enumerate(unique_names):
+        key = normalize_player_name(name)
+        if not key:
+            unique_ids[i] = -1
+            continue
+        if key not in lookup:
+            registry['players'].append({'id': next_id, 'name': clean_player_name(name), 'aliases': []})
+            lookup[key] = next_id
+            next_id += 1
+        unique_ids[i] = lookup[key]
+
+    # pd.factorize marks missing names with -1
+    return np.where(codes >= 0, unique_ids[codes] if len(unique_ids) else -1, -1)
+
+
+def display_names(registry: dict) -> dict[int, str]:
+    """Display name per player ID."""
+    return {player['id']: player['name'] for player in registry['players']}
+
+
+def canonical_player_names(folder_path: Path, names: list[str]) -> list[str]:
+    """
+    Display names for typed player names, so "anna " is continued as the known
+    player "Anna". Unknown names are only cleaned, the registry is not changed.
+    """
+    registry = load_registry(folder_path)
+    lookup = _lookup(registry)
+    names_by_id = display_names(registry)
+    return [
+        names_by_id.get(lookup.get(normalize_player_name(name)), clean_player_name(name))
+        for name in names
+    ]
+
+
+def register_players(folder_path: Path, names: list[str]) -> None:
+    """Add unknown players to the registry of a folder, e.g. right after saving a game."""
+    registry = load_registry(folder_path)
+    known_players = len(registry['players'])
+    player_ids(registry, names)
+    if len(registry['players']) != known_players:
+        save_registry(folder_path, registry)
@@ -6,6 +6,7 @@ from kivy.uix.label import Label
 from kivy.core.window import Window
 from kivy.graphics import Color, RoundedRectangle
 from kivy.metrics import dp
+from backend.evaluation.orchestrator import STAGE_LABELS
 from frontend.shared.styles import (
     font_config, K_SURFACE, K_TEXT_PRIMARY, CARD_STYLES
 )
@@ -109,6 +110,47 @@ def show_error(message: str):
     popup.open()
 
 
+def _format_seconds(seconds: float) -> str:
+    return f"{seconds:.2f} s".replace(".", ",")
+
+
+def _format_timing_summary(loading_info: dict, slowest_count: int = 3) -> list[str]:
+    """Build summary lines for stage timings and the slowest files."""
+    stages = loading_info.get('stages')
+    if not stages:
+        return []
+
+    stage_parts = [
+        f"{label} {_format_seconds(stages[stage])}"
+        for stage, label in STAGE_LABELS.items() if stage in stages
+    ]
+    lines = [
+        "",
+        f"⏱ Laufzeit {_format_seconds(sum(stages.values()))}: " + " | ".join(stage_parts)
+    ]
+    cached = loading_info.get('cached')
+    if cached == 'dashboard':
+        lines.append("♻ Keine Änderungen seit der letzten Auswertung, Dashboard aus dem Cache")
+    elif cached == 'aggregates':
+        lines.append("♻ Keine Änderungen an den Dateien, Daten aus dem Cache")
+
+    def file_time(file_stats: dict) -> float:
+        return sum(file_stats[stage] or 0 for stage in ('open', 'parse', 'transform'))
+
+    # File timings of a cached evaluation are from an earlier run
+    files = [] if cached else loading_info.get('files', [])
+    slowest = sorted(files, key=file_time, reverse=True)[:slowest_count]
+    if slowest:
+        lines.append("Langsamste Dateien:")
+        for file_stats in slowest:
+            lines.append(f"  • {file_stats['file']}: {_format_seconds(file_time(file_stats))}")
+
+    if loading_info.get('report'):
+        lines.append(f"Details: {loading_info['report']}")
+
+    return lines
+
+
 class LoadingResultsPopup(Popup):
     """Popup to display Excel file loading results after evaluation."""
     def __init__(self, loading_info: dict, **kwargs):
@@ -127,12 +169,32 @@ class LoadingResultsPopup(Popup):
             if loaded:
                 message_parts.append("")  # Empty line for spacing
             message_parts.append(f"✗ Fehler beim Laden ({len(failed)}):")
+            errors = {
+                file_stats['file']: file_stats['error']
+                for file_stats in loading_info.get('files', [])
+                if file_stats['error']
+            }
             for filename in failed:
-                message_parts.append(f"  • {filename}")
+                if filename in errors:
+                    message_parts.append(f"  • {filename} ({errors[filename]})")
+                else:
+                    message_parts.append(f"  • {filename}")
         
+        invalid = loading_info.get('invalid', {})
+        if invalid:
+            message_parts.append("")
+            message_parts.append(f"⚠ Inkonsistente Daten ({len(invalid)}):")
+            for filename, checks in invalid.items():
+                games = sorted({spiel for spiele in checks.values() for spiel in spiele})
+                message_parts.append(
+                    f"  • {filename}: Spiel {', '.join(map(str, games))} ({', '.join(checks)})"
+                )
+
         if not loaded and not failed:
             message_parts.append("Keine Excel-Dateien gefunden.")
         
+        message_parts.extend(_format_timing_summary(loading_info))
+        
         message = "\n".join(message_parts)
         
         # Set modern styling before init
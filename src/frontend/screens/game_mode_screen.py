@@ -3,6 +3,7 @@ from kivy.uix.screenmanager import Screen
 from kivy.properties import ObjectProperty, StringProperty, BooleanProperty
 from kivy.clock import Clock
 from backend.game import Game
+from frontend.shared.utils import get_folder_summary
 from backend.evaluation.orchestrator import start_evaluation
 from frontend.components.popups import show_loading_results
 
@@ -25,7 +26,7 @@ class GameModeScreen(Screen):
     def update_folder_info(self):
         """Update the folder info display."""
         if self.game and self.game.game_folder:
-            self.folder_info = f"Ordner: {str(self.game.game_folder)}"
+            self.folder_info = f"Ordner: {str(self.game.game_folder)}\n{get_folder_summary(self.game.game_folder)}"
         else:
             self.folder_info = "Kein Ordner ausgewählt"
         # Reset status message when entering screen
@@ -4,8 +4,10 @@ from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.properties import ObjectProperty
 from backend.game import Wind, Game
+from backend.player_registry import canonical_player_names, normalize_player_name
 from frontend.shared.config import IDIOT_NAMES
 from frontend.shared.styles import font_config
+from frontend.components.popups import show_error
 from random import sample
 
 class StartScreen(Screen):
@@ -78,6 +80,17 @@ class StartScreen(Screen):
                 except StopIteration:
                     name = f"Spieler {len(player_names) + 1}"
             player_names.append(name)
+
+        # Continue known players under their registered spelling
+        if self.game.game_folder:
+            player_names = canonical_player_names(self.game.game_folder, player_names)
+
+        # The game keys running sums and ranks by name, every seat needs its own player
+        keys = [normalize_player_name(name) for name in player_names]
+        duplicates = sorted({name for name, key in zip(player_names, keys) if keys.count(key) > 1})
+        if duplicates:
+            show_error(f"Jeder Spieler darf nur einmal mitspielen: {', '.join(duplicates)}")
+            return
         
         self.game.set_players(player_names)
         self.game.start_game()
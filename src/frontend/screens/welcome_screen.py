@@ -1,6 +1,7 @@
 from kivy.uix.screenmanager import Screen
 from kivy.properties import ObjectProperty, StringProperty
 from backend.game import Game
+from frontend.shared.utils import get_folder_summary
 from datetime import datetime
 import os
 import sys
@@ -26,7 +27,7 @@ class WelcomeScreen(Screen):
     def update_folder_info(self):
         """Update the folder info display."""
         if self.game and self.game.game_folder:
-            self.folder_info = f"Ordner:\n{str(self.game.game_folder)}"
+            self.folder_info = f"Ordner:\n{str(self.game.game_folder)}\n{get_folder_summary(self.game.game_folder)}"
             self.can_proceed = True
         else:
             self.folder_info = "Kein Ordner ausgewählt"
@@ -1,6 +1,11 @@
 """
 Shared utility functions for the frontend.
 """
+from pathlib import Path
+from backend.archive_manifest import get_manifest, summarize_manifest, format_manifest_summary
+from backend.helper_functions import setup_logger
+
+logger = setup_logger(__name__)
 
 def get_screen_name(screen_class):
     """Convert a screen class name to a screen name.
@@ -8,3 +13,14 @@ def get_screen_name(screen_class):
     """
     name = screen_class.__name__
     return ''.join(['_' + c.lower() if c.isupper() else c for c in name])[1:]
+
+
+def get_folder_summary(folder_path: Path) -> str:
+    """Summarize the saved rounds of a game folder from its manifest."""
+    if not folder_path.exists():
+        return "Neuer Ordner"
+    try:
+        return format_manifest_summary(summarize_manifest(get_manifest(folder_path)))
+    except Exception as e:
+        logger.warning(f"Could not read manifest of {folder_path}. Error: {e}")
+        return ""
@@ -0,0 +1,113 @@
+"""Regression tests for archives with a blank points cell in a hand-edited workbook."""
+
+import json
+import sys
+import warnings
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent / "benchmarks"))
+
+from synthetic_archive import generate_game_sheets
+from backend.evaluation.transformations import prepare_rounds_batch, parse_timestamps
+from backend.evaluation.fact_table import build_fact_table
+from backend.evaluation.metrics import compute_overview_metrics, compute_player_details
+from backend.evaluation.compact_dataset import encode_fact_table, dataset_script
+from backend.evaluation.rating import update_ratings
+from backend.evaluation.head_to_head import compute_head_to_head
+from backend.evaluation.form import compute_form
+
+
+def _facts_with_blank_cell(column: str = 'Rundenpunkte', row: int = 1) -> pd.DataFrame:
+    """Fact table of a small synthetic archive whose first workbook has one blank cell."""
+    sheets = generate_game_sheets(6, old_format_every=3)
+    filename, df_metadata, df_games, df_standings = sheets[0]
+    df_games = df_games.astype({column: object})
+    df_games.loc[row, column] = None
+    sheets[0] = (filename, df_metadata, df_games, df_standings)
+    df_rounds, df_games_meta, df_points = prepare_rounds_batch(sheets)
+    df_rounds, df_games_meta = parse_timestamps(df_rounds, df_games_meta)
+    return build_fact_table(df_rounds, df_games_meta, df_points, {'version': 1, 'players': []})
+
+
+def _player_names(df_facts: pd.DataFrame) -> dict[int, str]:
+    return {player_id: f"Spieler {player_id}" for player_id in df_facts['spieler_id'].unique()}
+
+
+def test_overview_averages_skip_blank_netto():
+    df_facts = _facts_with_blank_cell()
+    assert df_facts['punkte_netto'].isna().sum() == 1
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        metrics = compute_overview_metrics(df_facts, _player_names(df_facts))
+
+    expected = df_facts.groupby('spieler_id')['punkte_netto'].mean()
+    np.testing.assert_allclose(metrics.avg_netto, expected[metrics.player_ids].to_numpy())
+    assert np.isfinite(metrics.ci_netto).all()
+
+
+def test_player_details_skip_blank_netto():
+    df_facts = _facts_with_blank_cell()
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        details = compute_player_details(df_facts, _player_names(df_facts))
+
+    blank_player = df_facts.loc[df_facts['punkte_netto'].isna(), 'spieler_id'].iloc[0]
+    df_player = df_facts[df_facts['spieler_id'] == blank_player]
+    expected = df_player.groupby(~df_player['is_spielfuehrer'])['punkte_netto'].mean()
+    np.testing.assert_allclose(details[blank_player].avg_netto_as_wind, expected.to_numpy())
+    assert details[blank_player].total_points == df_player['punkte_delta'].sum()
+
+
+def test_compact_dataset_embeds_blank_netto_as_null():
+    df_facts = _facts_with_blank_cell()
+    script = dataset_script(encode_fact_table(df_facts, _player_names(df_facts)))
+    payload = script[script.index('>') + 1:script.rindex('</script>')].replace('<\\/', '</')
+
+    def reject(constant):
+        raise ValueError(f"{constant} is not valid JSON")
+
+    # Like JSON.parse in the browser, NaN and Infinity are rejected
+    dataset = json.loads(payload, parse_constant=reject)
+    assert dataset['rows']['netto'].count(None) == 1
+
+
+def test_rating_skips_rounds_with_blank_rank():
+    df_facts = _facts_with_blank_cell()
+    df_facts.loc[df_facts['is_final_game'].idxmax(), 'rang'] = np.nan
+    blank_round = df_facts.loc[df_facts['rang'].isna(), 'runden_id'].iloc[0]
+
+    history = update_ratings(None, df_facts)
+    assert blank_round not in history.round_ids
+    assert len(history.round_ids) == df_facts['runden_id'].nunique() - 1
+    assert np.isfinite(history.ratings).all()
+    assert (history.ranks >= 1).all()
+
+
+def test_head_to_head_leaves_out_games_with_blank_netto():
+    df_facts = _facts_with_blank_cell()
+    blank_game = df_facts.loc[df_facts['punkte_netto'].isna(), 'game_index'].iloc[0]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        head_to_head = compute_head_to_head(df_facts, _player_names(df_facts))
+
+    # The pairwise sums of the remaining games still match the per-player totals
+    df_known = df_facts[df_facts['game_index'] != blank_game]
+    totals = df_known.groupby('spieler_id')['punkte_delta'].sum()
+    np.testing.assert_array_equal(head_to_head.points.sum(axis=1), totals[head_to_head.player_ids].to_numpy())
+    assert head_to_head.mismatched_games == 0
+
+
+def test_form_skips_blank_delta():
+    df_facts = _facts_with_blank_cell(column='Punkteänderung')
+    assert df_facts['punkte_delta'].isna().sum() == 1
+
+    form = compute_form(df_facts, _player_names(df_facts), window=3)
+    df_known = df_facts[df_facts['punkte_delta'].notna()]
+    assert [len(games) for games in form.game_index] == df_known.groupby('spieler_id').size()[form.player_ids].tolist()
+    for values in (form.current_form, form.hot_run, form.cold_run, form.win_streak, form.loss_streak):
+        assert np.abs(values).max() < 10**9